@@ -1,58 +1,174 @@
 from pydantic import BaseModel, Field, ConfigDict
 
-from fastapi import FastAPI
-from pydantic import BaseModel, Field
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse, Response
+from pydantic import BaseModel, Field, ValidationError
 from typing import List, Optional, Dict, Any
 
-from accuracy_cal.data_store import (
-    load_monsters,
-    load_items,
-    load_named_effect_catalog,
-)
 from accuracy_cal.models import (
+    EquipSlot,
     Stats,
     CharacterInput,
     JobGroup,
-    EquipmentState,
-    BuffState,
-    EquipSlot,
-    EffectSpec,
 )
 from accuracy_cal.engine import derive_character_result, check_hit
+from accuracy_cal.batch import derive_character_results_batch, job_codes
+from accuracy_cal.catalog import CatalogManager, CatalogSnapshot
+from accuracy_cal.level_sweep import sweep_levels
+from accuracy_cal.loadout import LoadoutError
+from accuracy_cal.matrix import hit_matrix
+from accuracy_cal.memo import CalcMemo, request_key
+from accuracy_cal.optimizer import optimize_gear
+from accuracy_cal.payloads import BatchEncoder, encode_calc, encode_matrix
+from accuracy_cal import timing
+from accuracy_cal.timing import span
+
+# ---- in-memory catalogs ----
+# 요청마다 CATALOG.current 를 한 번만 읽어서 끝까지 그 스냅샷을 사용 (리로드 중에도 일관됨)
+CATALOG = CatalogManager()
+
+# data/*.json 변경 감시 주기(초), 0이면 감시 안 함 (/admin/reload 로만 리로드)
+WATCH_INTERVAL = float(os.environ.get("ACCURACY_CAL_WATCH_INTERVAL", "2"))
+
+# /calc 결과 캐시 (같은 빌드 반복 요청용): 크기 0이면 사용 안 함, TTL 0이면 만료 없음
+_CALC_CACHE_SIZE = int(os.environ.get("ACCURACY_CAL_CALC_CACHE_SIZE", "4096"))
+_CALC_CACHE_TTL = float(os.environ.get("ACCURACY_CAL_CALC_CACHE_TTL", "300"))
+CALC_MEMO = CalcMemo(maxsize=_CALC_CACHE_SIZE, ttl=_CALC_CACHE_TTL or None) if _CALC_CACHE_SIZE > 0 else None
+
 
-app = FastAPI(title="Accuracy Calculator API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if WATCH_INTERVAL > 0:
+        CATALOG.start_watching(WATCH_INTERVAL)
+    try:
+        yield
+    finally:
+        CATALOG.stop_watching()
 
-# ---- in-memory catalogs (simple cache) ----
-MONSTERS = load_monsters()
-ITEMS = load_items()
-BUFFS = load_named_effect_catalog("buff_skills.json")   # id -> EffectSpec
-DOPING = load_named_effect_catalog("doping.json")       # id -> EffectSpec
+
+app = FastAPI(title="Accuracy Calculator API", lifespan=lifespan)
+
+# ACCURACY_CAL_TIMING=1 이면 route/구간별 지연 시간 히스토그램을 /metrics 에 추가
+if timing.ENABLED:
+    app.add_middleware(timing.TimingMiddleware)
 
 
 @app.get("/health")
 def health():
-    return {"ok": True}
+    return {"ok": True, **CATALOG.status()}
+
+
+def _prometheus_text(metrics: List[tuple]) -> str:
+    # (이름, 타입, 설명, 값) -> Prometheus text exposition format
+    lines = []
+    for name, kind, help_text, value in metrics:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    out = [
+        ("accuracy_cal_catalog_version", "gauge", "Current catalog snapshot version.", CATALOG.current.version),
+    ]
+    if CALC_MEMO is not None:
+        st = CALC_MEMO.cache.stats()
+        out += [
+            ("accuracy_cal_calc_cache_hits_total", "counter", "/calc result cache hits.", st["hits"]),
+            ("accuracy_cal_calc_cache_misses_total", "counter", "/calc result cache misses.", st["misses"]),
+            ("accuracy_cal_calc_cache_evictions_total", "counter", "Entries evicted by the LRU size limit.", st["evictions"]),
+            ("accuracy_cal_calc_cache_expirations_total", "counter", "Entries dropped after their TTL.", st["expirations"]),
+            ("accuracy_cal_calc_cache_invalidations_total", "counter", "Entries dropped on catalog version change.", st["invalidations"]),
+            ("accuracy_cal_calc_cache_size", "gauge", "Entries currently cached.", st["size"]),
+        ]
+    text = _prometheus_text(out)
+    timing_lines = timing.prometheus_lines()
+    if timing_lines:
+        text += "\n".join(timing_lines) + "\n"
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+
+@app.post("/admin/reload", status_code=202)
+def admin_reload() -> Dict[str, Any]:
+    # 스냅샷 재구성은 백그라운드 스레드에서: 바로 202 반환, 완료 여부는 /health 의 catalog_version 으로 확인
+    started = CATALOG.request_reload()
+    return {"started": started, **CATALOG.status()}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두사는 무시
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+# ---- /catalog: 스냅샷을 만들 때 한 번 직렬화 ----
+@app.get("/catalog")
+def catalog(request: Request) -> Response:
+    body = CATALOG.current.body
+    headers = {"ETag": body.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), body.etag):
+        return Response(status_code=304, headers=headers)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=body.gzip, media_type="application/json", headers=headers)
+    return Response(content=body.raw, media_type="application/json", headers=headers)
+
+
+@app.get("/monsters/hittable")
+def monsters_hittable(
+    level: int = Query(..., ge=1, le=300),
+    acc: int = Query(..., ge=0),
+    sort: str = Query("level", pattern="^(level|evasion)$"),
+) -> Dict[str, Any]:
+    found = CATALOG.current.monster_index.hittable(level, acc, sort_by=sort)
+    return {
+        "level": level,
+        "acc": acc,
+        "monsters": [
+            {"id": mid, "name": m.name, "level": m.level, "evasion": m.evasion, "image_url": m.image_url}
+            for mid, m in found
+        ],
+    }
 
 
-@app.get("/catalog")
-def catalog() -> Dict[str, Any]:
+@app.get("/search")
+def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    kind: str = Query("all", pattern="^(all|item|monster)$"),
+    slot: Optional[EquipSlot] = None,
+    limit: int = Query(20, ge=1, le=200),
+) -> Dict[str, Any]:
+    # 스냅샷별 검색 인덱스 (리로드하면 새 스냅샷에서 다시 만듦), slot을 주면 아이템만
+    cat = CATALOG.current
+    hits = []
+    if kind in ("all", "item"):
+        hits += [("item", h) for h in cat.item_search.search(q, limit=limit, slot=slot)]
+    if kind in ("all", "monster") and slot is None:
+        hits += [("monster", h) for h in cat.monster_search.search(q, limit=limit)]
+    hits.sort(key=lambda kh: (-kh[1].score, len(kh[1].name), kh[1].key))
     return {
-        "monsters": {
-            mid: {"name": m.name, "level": m.level, "evasion": m.evasion, "image_url": m.image_url}
-            for mid, m in MONSTERS.items()
-        },
-        "items": {
-            iid: {"name": it.name, "slot": it.slot.value, "effect": {"stats": it.effect.stats.__dict__, "acc": it.effect.acc}, "image_url": it.icon_url}
-            for iid, it in ITEMS.items()
-        },
-        "buffs": {
-            bid: {"name": spec.name, "acc_group": spec.acc_group, "effect": {"stats": spec.effect.stats.__dict__, "acc": spec.effect.acc}}
-            for bid, spec in BUFFS.items()
-        },
-        "doping": {
-            did: {"name": spec.name, "acc_group": spec.acc_group, "effect": {"stats": spec.effect.stats.__dict__, "acc": spec.effect.acc}}
-            for did, spec in DOPING.items()
-        },
+        "query": q,
+        "results": [
+            {
+                "kind": k,
+                "id": h.key,
+                "name": h.name,
+                "slot": h.slot.value if h.slot is not None else None,
+                "match": h.match,
+                "score": h.score,
+            }
+            for k, h in hits[:limit]
+        ],
     }
 
 
@@ -80,115 +196,260 @@ class CalcRequest(BaseModel):
     doping: List[str] = []  # 예: ["acc_pill", "custom:acc=10,dex=3"]
 
 
-def parse_kv_int_list(spec: str) -> dict[str, int]:
-    out: dict[str, int] = {}
-    if not spec:
-        return out
-    for part in spec.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        k, v = part.split("=", 1)
-        out[k.strip().lower()] = int(v.strip())
-    return out
-
-def make_custom_item(slot: EquipSlot, rhs: str):
-    # rhs: "custom:acc=7,dex=3"
-    kv = parse_kv_int_list(rhs[len("custom:"):])
-    acc = kv.pop("acc", 0)
-    s = Stats(
-        str=kv.pop("str", 0),
-        dex=kv.pop("dex", 0),
-        int=kv.pop("int", 0),
-        luk=kv.pop("luk", 0),
-    )
-    if kv:
-        raise ValueError(f"invalid keys: {list(kv.keys())}")
-
-    from accuracy_cal.models import Effect, Item
-    return Item(
-        item_id="custom",
-        name="(커스텀 장비)",
-        slot=slot,
-        effect=Effect(stats=s, acc=acc),
-        icon_url=None,
-    )
-
-def make_custom_effectspec(kind_name: str, rhs: str) -> EffectSpec:
-    # rhs: "custom:acc=10,dex=3"
-    kv = parse_kv_int_list(rhs[len("custom:"):])
-    acc = kv.pop("acc", 0)
-    s = Stats(
-        str=kv.pop("str", 0),
-        dex=kv.pop("dex", 0),
-        int=kv.pop("int", 0),
-        luk=kv.pop("luk", 0),
-    )
-    if kv:
-        raise ValueError(f"invalid keys: {list(kv.keys())}")
-    from accuracy_cal.models import Effect
-    return EffectSpec(name=f"(커스텀 {kind_name})", effect=Effect(stats=s, acc=acc), acc_group=None)
-
-
-@app.post("/calc")
-def calc(req: CalcRequest) -> Dict[str, Any]:
+def _build_character(req: CalcRequest) -> CharacterInput:
     job = JobGroup(req.job)
-
     mw = (req.mw_percent / 100.0) if req.mw_on else 0.0
-
-    ch = CharacterInput(
+    return CharacterInput(
         level=req.level,
         job=job,
         base_stats=Stats(str=req.base_stats.str_, dex=req.base_stats.dex, int=req.base_stats.int_, luk=req.base_stats.luk),
         maple_warrior_percent=mw,
     )
 
-    equipment = EquipmentState(use_overall=False)
-    buffs = BuffState()
-
-    # equip 적용 (id/custom)
-    for spec in req.equip:
-        slot_s, rhs = spec.split("=", 1)
-        slot = EquipSlot(slot_s)
 
-        if rhs.startswith("custom:"):
-            it = make_custom_item(slot, rhs)
-        else:
-            it = ITEMS[rhs]
-            if it.slot != slot:
-                raise ValueError("slot mismatch")
+def _build_loadout(cat: CatalogSnapshot, req: CalcRequest):
+    # equip/buff/doping 스펙은 스냅샷의 컴파일러로 해석 (같은 스펙은 한 번만 파싱)
+    try:
+        return cat.loadouts.compile(req.equip, req.buff, req.doping).states()
+    except LoadoutError as e:
+        raise HTTPException(status_code=422, detail=[err.to_dict() for err in e.errors])
 
-        equipment.equipped[slot] = it
-
-    # buff 적용
-    for i, bid in enumerate(req.buff):
-        if bid.startswith("custom:"):
-            buffs.skill_buffs[f"custom_buff_{i}"] = make_custom_effectspec("버프", bid)
-        else:
-            buffs.skill_buffs[bid] = BUFFS[bid]
-
-    # doping 적용
-    for i, did in enumerate(req.doping):
-        if did.startswith("custom:"):
-            buffs.doping[f"custom_doping_{i}"] = make_custom_effectspec("도핑", did)
-        else:
-            buffs.doping[did] = DOPING[did]
-
-    result = derive_character_result(ch, equipment, buffs)
-
-    mob = MONSTERS[req.monster_id]
-    hit = check_hit(result.acc_total, ch.level, mob)
 
+@app.post("/calc")
+@timing.timed("/calc")
+def calc(req: CalcRequest, format: str = Query("json", pattern="^(json|compact)$")) -> Response:
+    """format=compact: 키 없이 값 배열 (순서는 payloads.CALC_FIELDS)"""
+    cat = CATALOG.current
+    ch = _build_character(req)
+    mw = ch.maple_warrior_percent
+
+    # 정규화한 요청으로 먼저 조회 -> 적중하면 로드아웃 컴파일/derive/check_hit 모두 생략
+    key = cached = None
+    if CALC_MEMO is not None:
+        with span("memo"):
+            key = request_key(ch, req.equip, req.buff, req.doping, req.monster_id)
+            cached = CALC_MEMO.get(key, version=cat.version)
+    if cached is not None:
+        result, hit = cached
+        mob = cat.monsters[req.monster_id]
+    else:
+        with span("loadout"):
+            equipment, buffs = _build_loadout(cat, req)
+        mob = cat.monsters[req.monster_id]
+        with span("derive"):
+            result = derive_character_result(ch, equipment, buffs)
+        with span("check_hit"):
+            hit = check_hit(result.acc_total, ch.level, mob)
+        if key is not None:
+            CALC_MEMO.put(key, (result, hit), version=cat.version)
+
+    # dict/jsonable_encoder를 거치지 않고 바로 bytes로
+    with span("serialize"):
+        return Response(content=encode_calc(mw, result, hit, mob, format), media_type="application/json")
+
+
+# ---- gear optimizer ----
+class GearOptimizeRequest(CalcRequest):
+    # equip으로 준 장비는 고정, 나머지 슬롯을 탐색
+    k: int = Field(5, ge=1, le=50)
+    costs: Optional[Dict[str, float]] = None  # item_id -> 비용 (없으면 스탯 합), 목록에 없는 아이템은 제외
+    # True면 후보를 직업별 파레토 프런티어로 제한 (명중 축에서 지배당한 아이템 제외, 그 아이템이 더 싼 경우는 놓칠 수 있음)
+    frontier_only: bool = False
+
+
+@app.post("/optimize/gear")
+@timing.timed("/optimize/gear")
+def optimize_gear_route(req: GearOptimizeRequest) -> Dict[str, Any]:
+    cat = CATALOG.current
+    ch = _build_character(req)
+    with span("loadout"):
+        equipment, buffs = _build_loadout(cat, req)
+    mob = cat.monsters[req.monster_id]
+
+    with span("optimize"):
+        items = cat.item_frontier.candidates(ch.job) if req.frontier_only else cat.items
+        try:
+            loadouts = optimize_gear(ch, items, buffs, mob, k=req.k, cost=req.costs, fixed=equipment)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
     return {
-        "mw": mw,
-        "base_after_mw": result.base_after_mw.__dict__,
-        "bonus_stats": result.bonus_stats.__dict__,
-        "total_stats": result.total_stats.__dict__,
-        "acc_from_stats": result.acc_from_stats,
-        "acc_bonus": result.acc_bonus,
-        "acc_total": result.acc_total,
         "monster": {"name": mob.name, "level": mob.level, "evasion": mob.evasion},
-        "acc_required": hit.acc_required,
-        "is_sufficient": hit.is_sufficient,
-        "margin": hit.margin,
+        "loadouts": [
+            {
+                "cost": g.cost,
+                "use_overall": g.use_overall,
+                "items": {slot.value: it.item_id for slot, it in g.items},
+                "acc_total": g.acc_total,
+                "acc_required": g.acc_required,
+                "margin": g.margin,
+            }
+            for g in loadouts
+        ],
     }
+
+
+# ---- level sweep ----
+class LevelSweepRequest(CalcRequest):
+    # monster_id 대신 monster_ids (없으면 카탈로그 전체)
+    monster_id: Optional[str] = None
+    monster_ids: Optional[List[str]] = None
+    max_level: int = Field(200, ge=1, le=300)
+    ap_stat: Optional[str] = Field(None, pattern="^(str|dex|int|luk)$")
+
+
+@app.post("/sweep/levels")
+@timing.timed("/sweep/levels")
+def sweep_levels_route(req: LevelSweepRequest) -> Dict[str, Any]:
+    cat = CATALOG.current
+    ch = _build_character(req)
+    with span("loadout"):
+        equipment, buffs = _build_loadout(cat, req)
+    monsters = cat.monsters
+    if req.monster_ids is not None:
+        unknown = [mid for mid in req.monster_ids if mid not in monsters]
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"unknown monster ids: {unknown}")
+        monsters = {mid: monsters[mid] for mid in req.monster_ids}
+
+    with span("sweep"):
+        sweep = sweep_levels(ch, equipment, buffs, monsters, max_level=req.max_level, ap_stat=req.ap_stat)
+    return sweep.to_payload()
+
+
+# ---- batch ----
+class CalcBatchItem(CalcRequest):
+    # monster_ids(공유 목록)를 주면 개별 monster_id는 생략 가능
+    monster_id: Optional[str] = None
+
+
+class CalcBatchRequest(BaseModel):
+    # 항목별 에러를 돌려주기 위해 검증은 항목 단위로 따로 함
+    builds: List[Dict[str, Any]]
+    monster_ids: Optional[List[str]] = None
+
+
+def _error_text(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors())
+    if isinstance(e, LoadoutError):
+        return "; ".join(f"{err.kind}[{err.index}] {err.code}: {err.message}" for err in e.errors)
+    if isinstance(e, KeyError):
+        return f"unknown id: {e.args[0]}"
+    return str(e)
+
+
+@app.post("/calc/batch")
+@timing.timed("/calc/batch")
+def calc_batch(req: CalcBatchRequest, format: str = Query("json", pattern="^(json|compact)$")) -> Response:
+    """format=compact: {"fields", "monster_fields", "results": [[값...], ...]} (payloads.BATCH_FIELDS 참고)"""
+    cat = CATALOG.current
+    shared_mobs = None
+    if req.monster_ids is not None:
+        unknown = [mid for mid in req.monster_ids if mid not in cat.monsters]
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"unknown monster ids: {unknown}")
+        shared_mobs = [(mid, cat.monsters[mid]) for mid in req.monster_ids]
+
+    out = BatchEncoder(len(req.builds), format)
+
+    # (결과 index, 캐릭터, 보너스 Effect, [(monster_id, Monster)])
+    with span("parse"):
+        rows = []
+        for i, raw in enumerate(req.builds):
+            try:
+                item = CalcBatchItem.model_validate(raw)
+                ch = _build_character(item)
+                # 같은 장비/버프/도핑 조합은 해석/합산이 인턴되어 한 번만
+                bonus = cat.loadouts.compile(item.equip, item.buff, item.doping).bonus
+                if shared_mobs is not None:
+                    mobs = shared_mobs
+                elif item.monster_id is not None:
+                    mobs = [(item.monster_id, cat.monsters[item.monster_id])]
+                else:
+                    raise ValueError("monster_id is required when monster_ids is not given")
+            except (ValidationError, ValueError, KeyError) as e:
+                out.error(i, _error_text(e))
+                continue
+            rows.append((i, ch, bonus, mobs))
+
+    # (빌드, 몬스터) 쌍을 펼쳐서 한 번에 계산
+    with span("compute"):
+        pairs = [(row, mid, mob) for row in rows for mid, mob in row[3]]
+        if pairs:
+            res = derive_character_results_batch(
+                level=[r[1].level for r, _, _ in pairs],
+                job_code=job_codes(r[1].job for r, _, _ in pairs),
+                base_str=[r[1].base_stats.str for r, _, _ in pairs],
+                base_dex=[r[1].base_stats.dex for r, _, _ in pairs],
+                base_int=[r[1].base_stats.int for r, _, _ in pairs],
+                base_luk=[r[1].base_stats.luk for r, _, _ in pairs],
+                mw_percent=[r[1].maple_warrior_percent for r, _, _ in pairs],
+                bonus_str=[r[2].stats.str for r, _, _ in pairs],
+                bonus_dex=[r[2].stats.dex for r, _, _ in pairs],
+                bonus_int=[r[2].stats.int for r, _, _ in pairs],
+                bonus_luk=[r[2].stats.luk for r, _, _ in pairs],
+                bonus_acc=[r[2].acc for r, _, _ in pairs],
+                mob_level=[m.level for _, _, m in pairs],
+                mob_evasion=[m.evasion for _, _, m in pairs],
+            )
+            acc_from_stats = res.acc_from_stats.tolist()
+            acc_bonus = res.acc_bonus.tolist()
+            acc_total = res.acc_total.tolist()
+            acc_required = res.acc_required.tolist()
+            margin = res.margin.tolist()
+
+    # 결과가 커서 dict를 만들지 않고 조각 문자열로 바로 직렬화
+    with span("serialize"):
+        first = {}
+        for k, (row, mid, _) in enumerate(pairs):
+            first.setdefault(row[0], k)
+            out.monster(row[0], mid, acc_required[k], margin[k])
+        for i, ch, _, _ in rows:
+            k = first.get(i)
+            if k is None:
+                # 공유 몬스터 목록이 비어 있던 경우
+                out.empty(i, ch.maple_warrior_percent)
+            else:
+                out.ok(i, ch.maple_warrior_percent, acc_from_stats[k], acc_bonus[k], acc_total[k])
+        return Response(content=out.encode(), media_type="application/json")
+
+
+# ---- roster x monster matrix ----
+class MatrixBuild(CalcRequest):
+    # 열(몬스터)은 MatrixRequest.monster_ids로 공유, name은 행 이름 (없으면 로스터 index)
+    name: Optional[str] = None
+    monster_id: Optional[str] = None
+
+
+class MatrixRequest(BaseModel):
+    builds: List[MatrixBuild] = Field(..., min_length=1)
+    monster_ids: Optional[List[str]] = None  # 없으면 카탈로그 전체
+
+
+@app.post("/matrix")
+@timing.timed("/matrix")
+def matrix_route(req: MatrixRequest) -> Response:
+    """로스터 x 몬스터 마진 표: {"rows", "monsters", "margin": [[행별 마진...], ...]} (margin >= 0 이면 미스 0)"""
+    cat = CATALOG.current
+    monsters = cat.monsters
+    if req.monster_ids is not None:
+        unknown = [mid for mid in req.monster_ids if mid not in monsters]
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"unknown monster ids: {unknown}")
+        monsters = {mid: monsters[mid] for mid in req.monster_ids}
+
+    # 빌드마다 캐릭터/보너스를 한 번만 (같은 장비/버프/도핑 조합은 컴파일러가 인턴)
+    with span("loadout"):
+        roster = []
+        for i, b in enumerate(req.builds):
+            try:
+                ch = _build_character(b)
+                bonus = cat.loadouts.compile(b.equip, b.buff, b.doping).bonus
+            except (LoadoutError, ValueError) as e:
+                raise HTTPException(status_code=422, detail=f"builds[{i}]: {_error_text(e)}")
+            roster.append((b.name if b.name is not None else str(i), ch, bonus))
+
+    with span("compute"):
+        m = hit_matrix(roster, monsters)
+    with span("serialize"):
+        return Response(content=encode_matrix(m), media_type="application/json")
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+from .models import JobGroup
+
+# 컬럼 배열에서 쓰는 직업 코드 (MAGE만 계산식이 다름)
+JOB_CODES: Dict[JobGroup, int] = {
+    JobGroup.WARRIOR: 0,
+    JobGroup.ARCHER: 1,
+    JobGroup.THIEF: 2,
+    JobGroup.MAGE: 3,
+}
+MAGE_CODE = JOB_CODES[JobGroup.MAGE]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    acc_from_stats: np.ndarray
+    acc_bonus: np.ndarray
+    acc_total: np.ndarray
+    acc_required: np.ndarray
+    margin: np.ndarray
+
+    @property
+    def is_sufficient(self) -> np.ndarray:
+        return self.margin >= 0
+
+
+def job_codes(jobs) -> np.ndarray:
+    """JobGroup(또는 "archer" 같은 문자열) 목록 -> 직업 코드 배열"""
+    return np.fromiter((JOB_CODES[JobGroup(j)] for j in jobs), dtype=np.int64)
+
+
+def _ints(a) -> np.ndarray:
+    return np.asarray(a, dtype=np.int64)
+
+
+def apply_maple_warrior_batch(base, mw_percent) -> np.ndarray:
+    # engine.apply_maple_warrior와 같은 float64 연산 순서: floor(base * (1.0 + mw))
+    return np.floor(_ints(base) * (1.0 + np.asarray(mw_percent, dtype=np.float64))).astype(np.int64)
+
+
+def calc_accuracy_from_stats_batch(job_code, dex, int_, luk) -> np.ndarray:
+    dex, int_, luk = _ints(dex), _ints(int_), _ints(luk)
+    # 마법: (INT//10) + (LUK//10) / 물리: floor(DEX*0.8 + LUK*0.5)
+    mage = (int_ // 10) + (luk // 10)
+    physical = np.floor(dex * 0.8 + luk * 0.5).astype(np.int64)
+    return np.where(_ints(job_code) == MAGE_CODE, mage, physical)
+
+
+def required_accuracy_batch(player_level, mob_level, mob_evasion) -> np.ndarray:
+    """engine.required_accuracy의 벡터 버전 (브로드캐스트 지원)"""
+    player_level, mob_level, mob_evasion = _ints(player_level), _ints(mob_level), _ints(mob_evasion)
+    level_diff = np.maximum(mob_level - player_level, 0)
+    # level_diff == 0 이면 55 * EVA / 15 와 동일 (정수 곱 후 나눗셈 -> 버림)
+    return np.floor((55 + level_diff * 2) * mob_evasion / 15).astype(np.int64)
+
+
+def derive_character_results_batch(
+    level,
+    job_code,
+    base_str,
+    base_dex,
+    base_int,
+    base_luk,
+    mw_percent,
+    bonus_str,
+    bonus_dex,
+    bonus_int,
+    bonus_luk,
+    bonus_acc,
+    mob_level,
+    mob_evasion,
+) -> BatchResult:
+    """
+    derive_character_result + check_hit 을 컬럼 배열 단위로 한 번에 계산
+    - 모든 인자는 같은 길이의 배열(또는 스칼라, 브로드캐스트)
+    - bonus_* 는 장비 + 버프/도핑 합산 결과 (BuffState.total_effect 규칙 적용 후)
+    """
+    # STR은 명중 계산에 쓰이지 않으므로 생략
+    total_dex = apply_maple_warrior_batch(base_dex, mw_percent) + _ints(bonus_dex)
+    total_int = apply_maple_warrior_batch(base_int, mw_percent) + _ints(bonus_int)
+    total_luk = apply_maple_warrior_batch(base_luk, mw_percent) + _ints(bonus_luk)
+
+    acc_from_stats = calc_accuracy_from_stats_batch(job_code, total_dex, total_int, total_luk)
+    acc_bonus = np.broadcast_to(_ints(bonus_acc), acc_from_stats.shape)
+    acc_total = acc_from_stats + acc_bonus
+    acc_required = required_accuracy_batch(level, mob_level, mob_evasion)
+    acc_total, acc_required = np.broadcast_arrays(acc_total, acc_required)
+
+    return BatchResult(
+        acc_from_stats=acc_from_stats,
+        acc_bonus=acc_bonus,
+        acc_total=acc_total,
+        acc_required=acc_required,
+        margin=acc_total - acc_required,
+    )
+
@@ -0,0 +1,140 @@
+"""
+장비/버프/도핑 스펙 해석 처리량: 이전 방식(요청마다 문자열 파싱) vs LoadoutCompiler
+
+    python -m accuracy_cal.benchmarks.bench_loadout [--builds 5000] [--distinct 200]
+
+- legacy : 이전 api._build_loadout과 같은 방식 (스펙마다 split/int 파싱 + EquipmentState/BuffState 구성)
+- cold   : 새 LoadoutCompiler로 전체 빌드 목록 한 번 (스펙 단위 인턴만 효과)
+- warm   : 같은 컴파일러로 다시 (목록 단위 인턴까지 적용)
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+from ..loadout import LoadoutCompiler
+from ..models import BuffState, Effect, EffectSpec, EquipmentState, EquipSlot, Item, Stats
+
+
+def synthetic_catalog(n_items: int = 2000, seed: int = 0) -> SimpleNamespace:
+    rng = random.Random(seed)
+    slots = list(EquipSlot)
+    items = {}
+    for i in range(n_items):
+        slot = rng.choice(slots)
+        eff = Effect(Stats(0, rng.randint(0, 8), rng.randint(0, 5), rng.randint(0, 8)), rng.randint(0, 12))
+        items[f"item_{i}"] = Item(f"item_{i}", f"item {i}", slot, eff)
+    buffs = {f"buff_{i}": EffectSpec(f"buff {i}", Effect(acc=rng.randint(1, 20)), rng.choice([None, "accuracy"])) for i in range(30)}
+    doping = {f"dope_{i}": EffectSpec(f"dope {i}", Effect(Stats(0, rng.randint(0, 5), 0, 0), rng.randint(0, 10)), rng.choice([None, "accuracy"])) for i in range(30)}
+    return SimpleNamespace(items=items, buffs=buffs, doping=doping)
+
+
+def _custom(rng: random.Random) -> str:
+    return "custom:" + ",".join(f"{k}={rng.randint(0, 9)}" for k in rng.sample(["str", "dex", "int", "luk", "acc"], 3))
+
+
+def synthetic_specs(cat: SimpleNamespace, n: int, distinct: int, seed: int = 0) -> List[Tuple[List[str], List[str], List[str]]]:
+    # distinct개의 서로 다른 빌드를 n번 반복 (실제 트래픽처럼 같은 빌드가 자주 반복)
+    rng = random.Random(seed)
+    by_slot: Dict[EquipSlot, List[str]] = {}
+    for iid, it in cat.items.items():
+        by_slot.setdefault(it.slot, []).append(iid)
+    pool = []
+    for _ in range(distinct):
+        equip = []
+        for slot, ids in by_slot.items():
+            if rng.random() < 0.6:
+                rhs = _custom(rng) if rng.random() < 0.1 else rng.choice(ids)
+                equip.append(f"{slot.value}={rhs}")
+        buff = [rng.choice(list(cat.buffs)) for _ in range(rng.randint(0, 3))] + ([_custom(rng)] if rng.random() < 0.2 else [])
+        doping = [rng.choice(list(cat.doping)) for _ in range(rng.randint(0, 2))]
+        pool.append((equip, buff, doping))
+    return [rng.choice(pool) for _ in range(n)]
+
+
+# ---- 이전 방식 (api.py에 있던 파서를 그대로 옮김) ----
+def _legacy_kv(spec: str) -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        k, v = part.split("=", 1)
+        out[k.strip().lower()] = int(v.strip())
+    return out
+
+
+def _legacy_effect(rhs: str) -> Effect:
+    kv = _legacy_kv(rhs[len("custom:"):])
+    acc = kv.pop("acc", 0)
+    s = Stats(str=kv.pop("str", 0), dex=kv.pop("dex", 0), int=kv.pop("int", 0), luk=kv.pop("luk", 0))
+    if kv:
+        raise ValueError(f"invalid keys: {list(kv.keys())}")
+    return Effect(stats=s, acc=acc)
+
+
+def legacy_build(cat: SimpleNamespace, equip: List[str], buff: List[str], doping: List[str]) -> Effect:
+    equipment = EquipmentState(use_overall=False)
+    buffs = BuffState()
+    for spec in equip:
+        slot_s, rhs = spec.split("=", 1)
+        slot = EquipSlot(slot_s)
+        if rhs.startswith("custom:"):
+            it = Item(item_id="custom", name="(커스텀 장비)", slot=slot, effect=_legacy_effect(rhs))
+        else:
+            it = cat.items[rhs]
+            if it.slot != slot:
+                raise ValueError("slot mismatch")
+        equipment.equipped[it.slot] = it
+    for i, bid in enumerate(buff):
+        if bid.startswith("custom:"):
+            buffs.skill_buffs[f"custom_buff_{i}"] = EffectSpec("(커스텀 버프)", _legacy_effect(bid))
+        else:
+            buffs.skill_buffs[bid] = cat.buffs[bid]
+    for i, did in enumerate(doping):
+        if did.startswith("custom:"):
+            buffs.doping[f"custom_doping_{i}"] = EffectSpec("(커스텀 도핑)", _legacy_effect(did))
+        else:
+            buffs.doping[did] = cat.doping[did]
+    return equipment.iter_effects() + buffs.total_effect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--builds", type=int, default=5000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cat = synthetic_catalog(args.items, args.seed)
+    specs = synthetic_specs(cat, args.builds, args.distinct, args.seed)
+    n = len(specs)
+
+    t0 = time.perf_counter()
+    legacy = [legacy_build(cat, *s) for s in specs]
+    t_legacy = time.perf_counter() - t0
+
+    compiler = LoadoutCompiler(cat)
+    t0 = time.perf_counter()
+    cold = [compiler.compile(*s).bonus for s in specs]
+    t_cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    warm = [compiler.compile(*s).bonus for s in specs]
+    t_warm = time.perf_counter() - t0
+
+    if legacy != cold or cold != warm:
+        raise SystemExit("mismatch between legacy parser and LoadoutCompiler")
+
+    print(f"builds={n} distinct={args.distinct} items={args.items}")
+    print(f"legacy : {n / t_legacy:10.0f} builds/s  ({t_legacy / n * 1e6:7.2f} us/build)")
+    print(f"cold   : {n / t_cold:10.0f} builds/s  ({t_cold / n * 1e6:7.2f} us/build)  x{t_legacy / t_cold:.1f}")
+    print(f"warm   : {n / t_warm:10.0f} builds/s  ({t_warm / n * 1e6:7.2f} us/build)  x{t_legacy / t_warm:.1f}")
+
+
+if __name__ == "__main__":
+    main()
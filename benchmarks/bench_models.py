@@ -0,0 +1,196 @@
+"""
+Stats/Effect 메모리 + derive_character_result 시간 (slots/누적기 적용 전후)
+
+    python -m accuracy_cal.benchmarks.bench_models [--builds 2000] [--repeat 5]
+
+"before"는 이전 구현(slots 없는 frozen dataclass + __add__ 연쇄 합산)을 여기에 그대로 옮겨 둔 것
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass
+from math import floor
+from typing import Dict, List, Optional, Tuple
+
+from ..engine import calc_accuracy_from_stats, derive_character_result
+from ..models import (
+    BuffState,
+    CharacterInput,
+    DerivedResult,
+    Effect,
+    EffectSpec,
+    EquipmentState,
+    EquipSlot,
+    Item,
+    JobGroup,
+    Stats,
+)
+
+
+# ---- 이전 구현 ----
+@dataclass(frozen=True)
+class LegacyStats:
+    str: int = 0
+    dex: int = 0
+    int: int = 0
+    luk: int = 0
+
+    def __add__(self, other: "LegacyStats") -> "LegacyStats":
+        return LegacyStats(
+            str=self.str + other.str,
+            dex=self.dex + other.dex,
+            int=self.int + other.int,
+            luk=self.luk + other.luk,
+        )
+
+
+@dataclass(frozen=True)
+class LegacyEffect:
+    stats: LegacyStats = LegacyStats()
+    acc: int = 0
+
+    def __add__(self, other: "LegacyEffect") -> "LegacyEffect":
+        return LegacyEffect(stats=self.stats + other.stats, acc=self.acc + other.acc)
+
+
+# (use_overall, [(slot, effect)], [(acc_group, effect)], base, mw, job)
+LegacyBuild = Tuple[bool, List[Tuple[EquipSlot, LegacyEffect]], List[Tuple[Optional[str], LegacyEffect]], LegacyStats, float, JobGroup]
+
+
+def legacy_derive(build: LegacyBuild) -> Tuple[int, int]:
+    use_overall, equipped, specs, base, mw, job = build
+
+    equip = LegacyEffect()
+    for slot, e in equipped:
+        if use_overall:
+            if slot in (EquipSlot.TOP, EquipSlot.BOTTOM):
+                continue
+        elif slot == EquipSlot.OVERALL:
+            continue
+        equip = equip + e
+
+    buff_stats = LegacyStats()
+    acc_sum = 0
+    acc_max: Dict[str, int] = {}
+    for group, e in specs:
+        buff_stats = buff_stats + e.stats
+        if group is None:
+            acc_sum += e.acc
+        elif e.acc > acc_max.get(group, 0):
+            acc_max[group] = e.acc
+    buff = LegacyEffect(stats=buff_stats, acc=acc_sum + sum(acc_max.values()))
+
+    base_after_mw = LegacyStats(
+        str=floor(base.str * (1.0 + mw)),
+        dex=floor(base.dex * (1.0 + mw)),
+        int=floor(base.int * (1.0 + mw)),
+        luk=floor(base.luk * (1.0 + mw)),
+    )
+    bonus_stats = equip.stats + buff.stats
+    total = base_after_mw + bonus_stats
+    acc_bonus = equip.acc + buff.acc
+    acc_from_stats = calc_accuracy_from_stats(job, Stats(total.str, total.dex, total.int, total.luk))
+    # DerivedResult 생성 비용도 동일하게 포함
+    DerivedResult(base_after_mw, bonus_stats, total, acc_from_stats, acc_bonus, acc_from_stats + acc_bonus)
+    return acc_from_stats, acc_bonus
+
+
+# ---- 합성 빌드 ----
+def _rand_effect(rng: random.Random) -> Effect:
+    return Effect(
+        stats=Stats(str=rng.randint(0, 5), dex=rng.randint(0, 8), int=rng.randint(0, 5), luk=rng.randint(0, 8)),
+        acc=rng.randint(0, 12),
+    )
+
+
+def synthetic_builds(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    jobs = list(JobGroup)
+    out = []
+    for i in range(n):
+        equipment = EquipmentState(use_overall=rng.random() < 0.3)
+        for slot in EquipSlot:
+            if rng.random() < 0.8:
+                equipment.equipped[slot] = Item(f"it_{i}_{slot.value}", "bench", slot, _rand_effect(rng))
+        buffs = BuffState()
+        for j in range(rng.randint(0, 4)):
+            buffs.skill_buffs[f"b{j}"] = EffectSpec("bench", _rand_effect(rng), rng.choice([None, "accuracy"]))
+        for j in range(rng.randint(0, 3)):
+            buffs.doping[f"d{j}"] = EffectSpec("bench", _rand_effect(rng), rng.choice([None, "accuracy"]))
+        ch = CharacterInput(
+            level=rng.randint(1, 200),
+            job=rng.choice(jobs),
+            base_stats=Stats(str=rng.randint(4, 300), dex=rng.randint(4, 300), int=rng.randint(4, 300), luk=rng.randint(4, 300)),
+            maple_warrior_percent=rng.choice([0.0, 0.1, 0.15]),
+        )
+        out.append((ch, equipment, buffs))
+    return out
+
+
+def _legacy_stats(s: Stats) -> LegacyStats:
+    return LegacyStats(s.str, s.dex, s.int, s.luk)
+
+
+def _legacy_effect(e: Effect) -> LegacyEffect:
+    return LegacyEffect(_legacy_stats(e.stats), e.acc)
+
+
+def to_legacy(ch: CharacterInput, equipment: EquipmentState, buffs: BuffState) -> LegacyBuild:
+    equipped = [(slot, _legacy_effect(it.effect)) for slot, it in equipment.equipped.items() if it is not None]
+    specs = [(s.acc_group, _legacy_effect(s.effect)) for d in (buffs.skill_buffs, buffs.doping) for s in d.values()]
+    return (equipment.use_overall, equipped, specs, _legacy_stats(ch.base_stats), ch.maple_warrior_percent, ch.job)
+
+
+def _object_size(obj) -> int:
+    # 인스턴스 + (있으면) __dict__ 크기, 필드 값(int)은 공유되므로 제외
+    size = sys.getsizeof(obj)
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        size += sys.getsizeof(d)
+    return size
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--builds", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    builds = synthetic_builds(args.builds, args.seed)
+    legacy = [to_legacy(*b) for b in builds]
+
+    # 두 구현의 결과가 같은지 먼저 확인
+    for (ch, eq, bs), lb in zip(builds, legacy):
+        r = derive_character_result(ch, eq, bs)
+        if (r.acc_from_stats, r.acc_bonus) != legacy_derive(lb):
+            raise SystemExit("mismatch between legacy and current derive_character_result")
+
+    s_old, s_new = LegacyStats(1, 2, 3, 4), Stats(1, 2, 3, 4)
+    e_old, e_new = LegacyEffect(s_old, 5), Effect(s_new, 5)
+    print("per-object memory (bytes, excluding shared field values)")
+    print(f"  Stats  : before {_object_size(s_old):4d}  after {_object_size(s_new):4d}")
+    print(f"  Effect : before {_object_size(e_old):4d}  after {_object_size(e_new):4d}")
+
+    t_old = _best(lambda: [legacy_derive(b) for b in legacy], args.repeat)
+    t_new = _best(lambda: [derive_character_result(*b) for b in builds], args.repeat)
+    n = len(builds)
+    print(f"derive_character_result ({n} builds, best of {args.repeat})")
+    print(f"  before : {t_old / n * 1e6:8.2f} us/build")
+    print(f"  after  : {t_new / n * 1e6:8.2f} us/build  (x{t_old / t_new:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+"""
+핫패스 벤치마크 모음 (합성 카탈로그 크기별) + 기준 결과와 비교
+
+    python -m accuracy_cal.benchmarks.suite run [--scales 1,10,100] [--out bench.json] [--baseline old.json] [--threshold 0.2]
+    python -m accuracy_cal.benchmarks.suite compare old.json new.json [--threshold 0.2]
+
+- 크기마다 하위 프로세스 하나 (ACCURACY_CAL_DATA_DIR로 합성 카탈로그 지정, 모듈 수준 캐시/앱 로드가 섞이지 않도록)
+- 결과 JSON: {"meta": {...}, "results": [{"scale", "case", "median_us", "min_us", "runs", "loops"}]}
+- compare: median이 기준 대비 (1 + threshold)배를 넘으면 slowdown으로 표시하고 종료 코드 1
+- fastapi/httpx가 없으면 api.* 항목은 skipped
+- api.*: rps = median 기준 초당 요청 수 (ASGI 전송, 네트워크 제외)
+- parallel.batch.workers_N: --batch 병렬 경로의 레코드당 시간 (N = 1, 2, 4, ..., CPU 수), speedup = workers_1 대비
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_THRESHOLD = 0.2
+
+# 한 번 측정(run)에 쓰는 최소 시간, run 반복 횟수
+_TARGET_RUN_SECONDS = 0.05
+_RUNS = 5
+
+
+# ---- 측정 ----
+def _measure(fn: Callable[[], Any], runs: int = _RUNS) -> Dict[str, Any]:
+    # timeit.autorange처럼 한 run이 _TARGET_RUN_SECONDS 이상이 되도록 loops 결정 후 runs번 반복
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - t0 >= _TARGET_RUN_SECONDS or loops >= 1 << 20:
+            break
+        loops *= 2
+    samples = []
+    for _ in range(runs):
+        gc.collect()
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - t0) / loops)
+    return _summary(samples, loops)
+
+
+def _measure_with_setup(setup: Callable[[], Any], fn: Callable[[], Any], runs: int = _RUNS) -> Dict[str, Any]:
+    # 매 호출 전에 상태를 되돌려야 하는 경우 (콜드 로드 등): 호출 1번씩, setup 시간은 제외
+    samples = []
+    for _ in range(runs):
+        setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return _summary(samples, 1)
+
+
+def _summary(samples: List[float], loops: int) -> Dict[str, Any]:
+    return {
+        "median_us": statistics.median(samples) * 1e6,
+        "min_us": min(samples) * 1e6,
+        "runs": len(samples),
+        "loops": loops,
+    }
+
+
+# ---- 하위 프로세스: 한 크기의 카탈로그로 전체 항목 측정 ----
+def _bench_data_store(out: Dict[str, Any]) -> None:
+    from .. import data_store
+
+    loaders = {
+        "monsters": data_store.load_monsters,
+        "items": data_store.load_items,
+        "buff_skills": lambda: data_store.load_named_effect_catalog("buff_skills.json"),
+        "doping": lambda: data_store.load_named_effect_catalog("doping.json"),
+    }
+    cache_dir = data_store.DATA_DIR / data_store.CACHE_DIR_NAME
+
+    def cold() -> None:
+        data_store.clear_cache()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for name, load in loaders.items():
+        # cold: JSON 파싱 + 디스크 캐시 작성 / disk: 컴파일된 디스크 캐시에서 / memory: 프로세스 내 캐시 적중
+        out[f"data_store.load_{name}.cold"] = _measure_with_setup(cold, load)
+        out[f"data_store.load_{name}.disk"] = _measure_with_setup(data_store.clear_cache, load)
+        load()
+        out[f"data_store.load_{name}.memory"] = _measure(load)
+
+
+def _bench_engine(out: Dict[str, Any]) -> None:
+    import random
+
+    from .. import data_store
+    from ..engine import check_hit, derive_character_result
+    from ..models import BuffState, CharacterInput, EquipmentState, JobGroup, Stats
+
+    rng = random.Random(0)
+    items = list(data_store.load_items().values())
+    buffs = list(data_store.load_named_effect_catalog("buff_skills.json").items())
+    doping = list(data_store.load_named_effect_catalog("doping.json").items())
+    monsters = list(data_store.load_monsters().values())
+
+    builds = []
+    for _ in range(200):
+        equipment = EquipmentState(use_overall=rng.random() < 0.3)
+        for it in rng.sample(items, min(len(items), 12)):
+            equipment.equipped[it.slot] = it
+        bs = BuffState(
+            skill_buffs=dict(rng.sample(buffs, min(len(buffs), 3))),
+            doping=dict(rng.sample(doping, min(len(doping), 2))),
+        )
+        ch = CharacterInput(
+            level=rng.randint(1, 200),
+            job=rng.choice(list(JobGroup)),
+            base_stats=Stats(4, rng.randint(4, 300), rng.randint(4, 300), rng.randint(4, 300)),
+            maple_warrior_percent=rng.choice([0.0, 0.15]),
+        )
+        builds.append((ch, equipment, bs))
+    n = len(builds)
+
+    def per_build(fn: Callable[[], Any]) -> Dict[str, Any]:
+        r = _measure(fn)
+        r["median_us"] /= n
+        r["min_us"] /= n
+        return r
+
+    out["engine.derive_character_result"] = per_build(lambda: [derive_character_result(*b) for b in builds])
+    out["models.EquipmentState.iter_effects"] = per_build(lambda: [b[1].iter_effects() for b in builds])
+    out["models.BuffState.total_effect"] = per_build(lambda: [b[2].total_effect() for b in builds])
+
+    # check_hit: 빌드 하나의 명중으로 카탈로그 전체 몬스터 판정 (몬스터 1마리당 시간)
+    acc, level = 300, 100
+    r = _measure(lambda: [check_hit(acc, level, m) for m in monsters])
+    r["median_us"] /= len(monsters)
+    r["min_us"] /= len(monsters)
+    out["engine.check_hit"] = r
+
+
+_CLI_ARGS = [
+    "--level", "60", "--job", "archer", "--dex", "200", "--luk", "40",
+    "--monster", "test_mob", "--equip", "gloves=work_gloves", "--buff", "bless", "--doping", "acc_pill",
+]
+
+
+def _bench_cli(out: Dict[str, Any]) -> None:
+    from .. import cli, data_store
+
+    def run() -> None:
+        argv = sys.argv
+        sys.argv = ["accuracy_cal.cli", *_CLI_ARGS]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                cli.main()
+        finally:
+            sys.argv = argv
+
+    # 매번 프로세스 내 카탈로그 캐시를 비움 -> 디스크 캐시 로드부터 출력까지 (인터프리터 시작은 제외)
+    run()
+    out["cli.main"] = _measure_with_setup(data_store.clear_cache, run, runs=_RUNS * 2)
+
+
+def _bench_api(out: Dict[str, Any]) -> None:
+    try:
+        import httpx
+        from .. import api
+    except ImportError as e:
+        for case in ("api.calc", "api.calc.compact", "api.calc_batch", "api.matrix", "api.catalog.gzip", "api.catalog.not_modified"):
+            out[case] = {"skipped": f"{type(e).__name__}: {e}"}
+        return
+
+    payload = {
+        "level": 60, "job": "archer", "base_stats": {"dex": 200, "luk": 40}, "mw_on": True,
+        "monster_id": "test_mob", "equip": ["gloves=work_gloves"], "buff": ["bless"], "doping": ["acc_pill"],
+    }
+    # 빌드 100개 x 몬스터 3마리 (응답 직렬화 비중이 큰 경우)
+    batch = {
+        "builds": [{**payload, "level": 10 + i, "base_stats": {"dex": 100 + i, "luk": 40}} for i in range(100)],
+        "monster_ids": ["test_mob", "slime_mock", "pig_mock"],
+    }
+    # 같은 빌드 100개 x 카탈로그 몬스터 전체 (행마다 명중 한 번, 마진 표는 브로드캐스트)
+    matrix = {"builds": [{k: v for k, v in b.items() if k != "monster_id"} for b in batch["builds"]]}
+
+    async def main() -> None:
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            etag = (await client.get("/catalog")).headers["etag"]
+
+            async def timed(n: int, request: Callable[[], Any]) -> Dict[str, Any]:
+                samples = []
+                for _ in range(_RUNS):
+                    gc.collect()
+                    t0 = time.perf_counter()
+                    for _ in range(n):
+                        r = await request()
+                        if r.status_code != 304:
+                            r.raise_for_status()
+                    samples.append((time.perf_counter() - t0) / n)
+                r = _summary(samples, n)
+                # 한 프로세스/커넥션 기준 초당 요청 수 (median 기준)
+                r["rps"] = 1e6 / r["median_us"]
+                return r
+
+            out["api.calc"] = await timed(50, lambda: client.post("/calc", json=payload))
+            out["api.calc.compact"] = await timed(50, lambda: client.post("/calc", params={"format": "compact"}, json=payload))
+            out["api.calc_batch"] = await timed(10, lambda: client.post("/calc/batch", json=batch))
+            out["api.matrix"] = await timed(10, lambda: client.post("/matrix", json=matrix))
+            out["api.catalog.gzip"] = await timed(20, lambda: client.get("/catalog", headers={"accept-encoding": "gzip"}))
+            out["api.catalog.not_modified"] = await timed(50, lambda: client.get("/catalog", headers={"if-none-match": etag}))
+
+    asyncio.run(main())
+
+
+_PARALLEL_RECORDS = 20000
+
+
+def _worker_counts(cpus: int) -> List[int]:
+    # 1, 2, 4, ... (CPU 수 미만) + CPU 수
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if cpus > 1:
+        counts.append(cpus)
+    return counts
+
+
+def _bench_parallel(out: Dict[str, Any]) -> None:
+    import random
+
+    from .. import data_store
+    from ..parallel import iter_results_parallel
+
+    rng = random.Random(0)
+    items = list(data_store.load_items().values())
+    buffs = list(data_store.load_named_effect_catalog("buff_skills.json"))
+    doping = list(data_store.load_named_effect_catalog("doping.json"))
+    monsters = list(data_store.load_monsters())
+    lines = []
+    for _ in range(_PARALLEL_RECORDS):
+        record = {
+            "version": 1,
+            "character": {
+                "level": rng.randint(1, 200),
+                "job": rng.choice(["warrior", "archer", "thief", "mage"]),
+                "base_stats": {"str": 4, "dex": rng.randint(4, 300), "int": rng.randint(4, 300), "luk": rng.randint(4, 300)},
+                "mw_on": rng.random() < 0.5,
+                "mw": 0.0,
+            },
+            "monster": {"id": rng.choice(monsters)},
+            "equip": [f"{it.slot.value}={it.item_id}" for it in rng.sample(items, min(len(items), 6))],
+            "buff": rng.sample(buffs, min(len(buffs), 2)),
+            "doping": rng.sample(doping, min(len(doping), 1)),
+        }
+        lines.append(json.dumps(record, ensure_ascii=False))
+
+    # 레코드 1개당 시간 (풀 시작 + 워커 카탈로그 로드 포함), speedup은 workers=1(풀 없이 현재 프로세스) 대비
+    base = None
+    for workers in _worker_counts(os.cpu_count() or 1):
+        r = _measure_with_setup(lambda: None, lambda: sum(1 for _ in iter_results_parallel(lines, workers, encoded=True)), runs=3)
+        r["median_us"] /= len(lines)
+        r["min_us"] /= len(lines)
+        base = base or r["median_us"]
+        r["speedup"] = base / r["median_us"]
+        out[f"parallel.batch.workers_{workers}"] = r
+
+
+def _worker(scale: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for bench in (_bench_data_store, _bench_engine, _bench_cli, _bench_api, _bench_parallel):
+        bench(out)
+    return out
+
+
+# ---- 상위 프로세스 ----
+def _git_rev() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(scales: List[int], seed: int = 0) -> Dict[str, Any]:
+    from .synthetic import write_catalog
+
+    # 패키지를 찾은 경로 그대로 하위 프로세스에 전달 (심볼릭 링크 설치 등)
+    package_parent = str(Path(os.path.abspath(__file__)).parents[2])
+    results: List[Dict[str, Any]] = []
+    catalogs: Dict[str, Dict[str, int]] = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix=f"accuracy_cal_bench_{scale}x_") as tmp:
+            catalogs[str(scale)] = write_catalog(Path(tmp), scale, seed)
+            env = dict(os.environ)
+            env["ACCURACY_CAL_DATA_DIR"] = tmp
+            env["ACCURACY_CAL_WATCH_INTERVAL"] = "0"
+            env["ACCURACY_CAL_CALC_CACHE_SIZE"] = "0"  # /calc는 매번 실제 계산 경로로 측정
+            env["PYTHONPATH"] = os.pathsep.join(p for p in (package_parent, env.get("PYTHONPATH")) if p)
+            print(f"[bench] scale={scale}x ...", file=sys.stderr)
+            proc = subprocess.run(
+                [sys.executable, "-m", __spec__.name, "_worker", "--scale", str(scale)],
+                env=env, capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                raise SystemExit(f"benchmark worker failed (scale={scale}):\n{proc.stderr}")
+            for case, r in json.loads(proc.stdout).items():
+                results.append({"scale": scale, "case": case, **r})
+
+    return {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "git_rev": _git_rev(),
+            "seed": seed,
+            "catalog_rows": catalogs,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """(scale, case)별 median 비교, ratio = current / baseline"""
+    base = {(r["scale"], r["case"]): r for r in baseline["results"] if "median_us" in r}
+    rows = []
+    for r in current["results"]:
+        b = base.get((r["scale"], r["case"]))
+        if b is None or "median_us" not in r:
+            continue
+        ratio = r["median_us"] / b["median_us"] if b["median_us"] > 0 else float("inf")
+        rows.append({
+            "scale": r["scale"],
+            "case": r["case"],
+            "baseline_us": b["median_us"],
+            "current_us": r["median_us"],
+            "ratio": ratio,
+            "slowdown": ratio > 1.0 + threshold,
+        })
+    return rows
+
+
+def _print_results(data: Dict[str, Any]) -> None:
+    for r in data["results"]:
+        if "skipped" in r:
+            print(f"{r['scale']:>5}x  {r['case']:<40} skipped ({r['skipped']})")
+        else:
+            speedup = f"  x{r['speedup']:.2f}" if "speedup" in r else ""
+            rps = f"  {r['rps']:.0f} req/s" if "rps" in r else ""
+            print(f"{r['scale']:>5}x  {r['case']:<40} {r['median_us']:12.2f} us  (min {r['min_us']:.2f}){speedup}{rps}")
+
+
+def _print_compare(rows: List[Dict[str, Any]], threshold: float) -> int:
+    slow = [r for r in rows if r["slowdown"]]
+    for r in rows:
+        flag = "  SLOWDOWN" if r["slowdown"] else ""
+        print(f"{r['scale']:>5}x  {r['case']:<40} {r['baseline_us']:12.2f} -> {r['current_us']:12.2f} us  x{r['ratio']:.2f}{flag}")
+    print(f"{len(slow)} slowdown(s) beyond +{threshold:.0%} out of {len(rows)} compared")
+    return 1 if slow else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="벤치마크 실행")
+    p_run.add_argument("--scales", type=str, default=",".join(map(str, DEFAULT_SCALES)), help="배포 데이터 대비 배수 목록. 예) 1,10,100,1000")
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--out", type=str, default=None, help="결과 JSON 경로 (없으면 stdout에 표만)")
+    p_run.add_argument("--baseline", type=str, default=None, help="비교할 기준 결과 JSON")
+    p_run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 느려짐 비율 (0.2 = 20%%)")
+
+    p_cmp = sub.add_parser("compare", help="두 결과 JSON 비교")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    p_worker = sub.add_parser("_worker")
+    p_worker.add_argument("--scale", type=int, required=True)
+
+    args = parser.parse_args()
+
+    if args.command == "_worker":
+        json.dump(_worker(args.scale), sys.stdout)
+        return
+
+    if args.command == "compare":
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+        raise SystemExit(_print_compare(compare(baseline, current, args.threshold), args.threshold))
+
+    data = run_suite([int(s) for s in args.scales.split(",") if s.strip()], args.seed)
+    _print_results(data)
+    if args.out is not None:
+        Path(args.out).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"[bench] wrote {args.out}", file=sys.stderr)
+    if args.baseline is not None:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        raise SystemExit(_print_compare(compare(baseline, data, args.threshold), args.threshold))
+
+
+if __name__ == "__main__":
+    main()
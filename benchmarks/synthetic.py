@@ -0,0 +1,85 @@
+"""
+배포 data/*.json을 scale배로 늘린 합성 카탈로그 생성
+
+    python -m accuracy_cal.benchmarks.synthetic OUT_DIR --scale 100
+
+원본 행은 그대로 두고(기존 id로 하는 요청이 그대로 동작) 나머지를 무작위 행으로 채움
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..models import EquipSlot
+
+SHIPPED_DIR = Path(__file__).resolve().parent.parent / "data"
+CATALOG_FILES = ("monsters.json", "items.json", "buff_skills.json", "doping.json")
+
+
+def _effect(rng: random.Random, stat_max: int, acc_max: int) -> Dict[str, Any]:
+    return {
+        "stats": {k: (rng.randint(0, stat_max) if rng.random() < 0.4 else 0) for k in ("str", "dex", "int", "luk")},
+        "acc": rng.randint(0, acc_max) if rng.random() < 0.6 else 0,
+    }
+
+
+def _monster(rng: random.Random, i: int) -> Dict[str, Any]:
+    level = rng.randint(1, 200)
+    return {"id": f"syn_mob_{i}", "name": f"합성 몬스터 {i}", "level": level, "evasion": rng.randint(0, level + 40), "image_url": None}
+
+
+def _item(rng: random.Random, i: int) -> Dict[str, Any]:
+    slot = rng.choice(list(EquipSlot)).value
+    return {"id": f"syn_item_{i}", "name": f"합성 {slot} {i}", "slot": slot, "effect": _effect(rng, 8, 15), "image_url": None}
+
+
+def _named_effect(prefix: str, label: str):
+    def make(rng: random.Random, i: int) -> Dict[str, Any]:
+        row: Dict[str, Any] = {"id": f"syn_{prefix}_{i}", "name": f"합성 {label} {i}", "effect": _effect(rng, 10, 25)}
+        if rng.random() < 0.5:
+            row["acc_group"] = rng.choice(["accuracy", "syn_group"])
+        return row
+    return make
+
+
+_ROW_MAKERS = {
+    "monsters.json": _monster,
+    "items.json": _item,
+    "buff_skills.json": _named_effect("buff", "버프"),
+    "doping.json": _named_effect("doping", "도핑"),
+}
+
+
+def write_catalog(out_dir: Path, scale: int, seed: int = 0, source_dir: Path = SHIPPED_DIR) -> Dict[str, int]:
+    """out_dir에 scale배 카탈로그를 쓰고 파일별 행 수 반환"""
+    if scale < 1:
+        raise ValueError(f"scale must be >= 1: {scale}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    counts: Dict[str, int] = {}
+    for name in CATALOG_FILES:
+        rng = random.Random(f"{seed}:{name}")
+        rows: List[Dict[str, Any]] = json.loads((source_dir / name).read_text(encoding="utf-8"))
+        target = len(rows) * scale
+        make = _ROW_MAKERS[name]
+        rows += [make(rng, i) for i in range(target - len(rows))]
+        (out_dir / name).write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+        counts[name] = len(rows)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("out_dir")
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for name, n in write_catalog(Path(args.out_dir), args.scale, args.seed).items():
+        print(f"{name}: {n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Hashable, List, Optional
+
+from .models import BuffState, Effect, EffectSpec, new_effect, new_stats
+
+
+class _GroupMax:
+    """acc_group 하나의 ACC 최댓값 (최대 힙 + 지연 삭제)"""
+    __slots__ = ("heap", "removed", "size")
+
+    def __init__(self) -> None:
+        self.heap: List[int] = []          # -acc
+        self.removed: Dict[int, int] = {}  # -acc -> 아직 힙에서 안 뺀 삭제 개수
+        self.size = 0
+
+    def push(self, acc: int) -> None:
+        heapq.heappush(self.heap, -acc)
+        self.size += 1
+
+    def discard(self, acc: int) -> None:
+        self.removed[-acc] = self.removed.get(-acc, 0) + 1
+        self.size -= 1
+        self._prune()
+
+    def _prune(self) -> None:
+        heap, removed = self.heap, self.removed
+        while heap and heap[0] in removed:
+            v = heapq.heappop(heap)
+            if removed[v] == 1:
+                del removed[v]
+            else:
+                removed[v] -= 1
+
+    def contribution(self) -> int:
+        # BuffState.total_effect와 동일: 그룹 최댓값이 0 이하이면 0
+        return max(0, -self.heap[0]) if self.size else 0
+
+
+class BuffAggregator:
+    """
+    버프/도핑 합계를 증분으로 유지 (BuffState.total_effect와 결과 동일)
+    - add/remove: O(log n) (acc_group별 최대 힙, 삭제는 지연 처리)
+    - effect(): O(1)
+    키는 임의의 hashable (BuffState에서 만들면 ("skill", id) / ("doping", id))
+    """
+
+    def __init__(self) -> None:
+        self._specs: Dict[Hashable, EffectSpec] = {}
+        self._groups: Dict[str, _GroupMax] = {}
+        self._str = self._dex = self._int = self._luk = 0
+        self._acc_stackable = 0  # acc_group이 None인 것들의 합
+        self._acc_groups = 0     # 그룹별 최댓값의 합
+        self._effect: Optional[Effect] = None
+
+    @classmethod
+    def from_state(cls, buffs: BuffState) -> "BuffAggregator":
+        agg = cls()
+        for key, spec in buffs.skill_buffs.items():
+            agg.add(("skill", key), spec)
+        for key, spec in buffs.doping.items():
+            agg.add(("doping", key), spec)
+        return agg
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._specs
+
+    def get(self, key: Hashable) -> Optional[EffectSpec]:
+        return self._specs.get(key)
+
+    def add(self, key: Hashable, spec: EffectSpec) -> None:
+        """key에 spec 적용 (이미 있으면 교체)"""
+        if key in self._specs:
+            self.remove(key)
+        self._specs[key] = spec
+        self._apply(spec, 1)
+
+    def remove(self, key: Hashable) -> EffectSpec:
+        spec = self._specs.pop(key)
+        self._apply(spec, -1)
+        return spec
+
+    def discard(self, key: Hashable) -> None:
+        if key in self._specs:
+            self.remove(key)
+
+    def _apply(self, spec: EffectSpec, sign: int) -> None:
+        e = spec.effect
+        s = e.stats
+        self._str += sign * s.str
+        self._dex += sign * s.dex
+        self._int += sign * s.int
+        self._luk += sign * s.luk
+
+        if spec.acc_group is None:
+            self._acc_stackable += sign * e.acc
+        else:
+            group = self._groups.get(spec.acc_group)
+            if group is None:
+                group = self._groups[spec.acc_group] = _GroupMax()
+            before = group.contribution()
+            if sign > 0:
+                group.push(e.acc)
+            else:
+                group.discard(e.acc)
+                if group.size == 0:
+                    del self._groups[spec.acc_group]
+            self._acc_groups += group.contribution() - before
+        self._effect = None
+
+    def effect(self) -> Effect:
+        e = self._effect
+        if e is None:
+            e = self._effect = new_effect(
+                new_stats(self._str, self._dex, self._int, self._luk),
+                self._acc_stackable + self._acc_groups,
+            )
+        return e
+
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Dict, Iterable, Iterator, Mapping
+
+from .engine import check_hit, derive_character_result
+from .loadout import CompiledLoadout, LoadoutCompiler, LoadoutError
+from .models import CharacterInput, JobGroup, Monster, Stats
+
+# 빌드 레코드: cli --export 가 쓰는 형식 그대로
+# {"version": 1, "character": {"level", "job", "base_stats": {...}, "mw_on", "mw"},
+#  "monster": {"id"}, "equip": [...], "buff": [...], "doping": [...]}
+DEFAULT_MW_ON = 0.15  # mw_on인데 mw가 0이면 마스터 기준 (cli와 동일)
+
+
+class RecordError(ValueError):
+    """레코드 형식 오류 (필드 누락/타입 오류 등)"""
+
+
+def _number(value: Any, name: str) -> float:
+    # json.loads는 NaN / Infinity / 1e999(inf)도 받으므로 유한한 값만 통과
+    v = float(value)
+    if not math.isfinite(v):
+        raise RecordError(f"invalid character: {name} must be finite")
+    return v
+
+
+def _integer(value: Any, name: str) -> int:
+    if isinstance(value, float):
+        _number(value, name)
+    return int(value)
+
+
+def character_from_record(record: Mapping[str, Any]) -> CharacterInput:
+    try:
+        c = record["character"]
+        bs = c["base_stats"]
+        mw = _number(c.get("mw", 0.0), "mw")
+        if c.get("mw_on", False) and mw == 0.0:
+            mw = DEFAULT_MW_ON
+        return CharacterInput(
+            level=_integer(c["level"], "level"),
+            job=JobGroup(str(c["job"])),
+            base_stats=Stats(**{k: _integer(bs[k], f"base_stats.{k}") for k in ("str", "dex", "int", "luk")}),
+            maple_warrior_percent=mw,
+        )
+    except KeyError as e:
+        raise RecordError(f"missing field: {e.args[0]}") from None
+    except RecordError:
+        raise
+    except (TypeError, ValueError, OverflowError) as e:
+        raise RecordError(f"invalid character: {e}") from None
+
+
+def _spec_list(record: Mapping[str, Any], key: str) -> list:
+    v = record.get(key, [])
+    if not isinstance(v, list) or not all(isinstance(s, str) for s in v):
+        raise RecordError(f"{key} must be a list of strings")
+    return v
+
+
+def loadout_from_record(record: Mapping[str, Any], compiler: LoadoutCompiler) -> CompiledLoadout:
+    """레코드의 equip/buff/doping 스펙 -> 컴파일된 로드아웃 (RecordError / LoadoutError)"""
+    return compiler.compile(_spec_list(record, "equip"), _spec_list(record, "buff"), _spec_list(record, "doping"))
+
+
+def evaluate_record(record: Any, compiler: LoadoutCompiler, monsters: Mapping[str, Monster]) -> Dict[str, Any]:
+    """빌드 레코드 하나 평가 -> 결과 dict (잘못된 레코드는 예외: RecordError / LoadoutError)"""
+    if not isinstance(record, dict):
+        raise RecordError("record must be a JSON object")
+    ch = character_from_record(record)
+    try:
+        monster_id = str(record["monster"]["id"])
+    except (KeyError, TypeError):
+        raise RecordError("missing field: monster.id") from None
+    mob = monsters.get(monster_id)
+    if mob is None:
+        raise RecordError(f"unknown monster id: {monster_id}")
+
+    equipment, buffs = loadout_from_record(record, compiler).states()
+    result = derive_character_result(ch, equipment, buffs)
+    hit = check_hit(result.acc_total, ch.level, mob)
+    return {
+        "mw": ch.maple_warrior_percent,
+        "acc_from_stats": result.acc_from_stats,
+        "acc_bonus": result.acc_bonus,
+        "acc_total": result.acc_total,
+        "monster": {"id": monster_id, "name": mob.name, "level": mob.level, "evasion": mob.evasion},
+        "acc_required": hit.acc_required,
+        "is_sufficient": hit.is_sufficient,
+        "margin": hit.margin,
+    }
+
+
+def evaluate_line(line_no: int, line: str, compiler: LoadoutCompiler, monsters: Mapping[str, Monster]) -> Dict[str, Any]:
+    """JSONL 한 줄 -> 결과 한 줄 (실패도 {"ok": false, "error": ...}로)"""
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {"line": line_no, "ok": False, "error": f"invalid JSON: {e}"}
+    try:
+        out = evaluate_record(record, compiler, monsters)
+    except LoadoutError as e:
+        return {"line": line_no, "ok": False, "error": str(e), "errors": [err.to_dict() for err in e.errors]}
+    except RecordError as e:
+        return {"line": line_no, "ok": False, "error": str(e)}
+    except Exception as e:
+        # 레코드 하나의 계산 실패(값이 너무 커서 생기는 OverflowError 등)로 배치 전체가 멈추지 않도록
+        return {"line": line_no, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    return {"line": line_no, "ok": True, **out}
+
+
+def encode_result(row: Dict[str, Any]) -> str:
+    """결과 한 줄 JSON (줄바꿈 제외)"""
+    return json.dumps(row, ensure_ascii=False)
+
+
+def iter_jsonl_results(lines: Iterable[str], compiler: LoadoutCompiler, monsters: Mapping[str, Monster]) -> Iterator[Dict[str, Any]]:
+    """입력 줄을 하나씩 읽어 결과를 하나씩 내보냄 (전체를 메모리에 올리지 않음), 빈 줄은 건너뜀 (line 번호는 1부터)"""
+    for line_no, line in enumerate(lines, 1):
+        if line.strip():
+            yield evaluate_line(line_no, line, compiler, monsters)
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+from . import data_store
+from .catalog_db import SqliteCatalog, open_catalog
+from .frontier import ItemFrontier
+from .loadout import LoadoutCompiler
+from .models import EffectSpec, Item, Monster
+from .reachability import MonsterReachIndex
+from .search import SearchIndex
+
+if TYPE_CHECKING:
+    from .catalog_mmap import MmapCatalog
+
+# 스냅샷을 이루는 원본 파일 (data_store.DATA_DIR 기준)
+CATALOG_FILES = ("monsters.json", "items.json", "buff_skills.json", "doping.json")
+
+
+@dataclass(frozen=True)
+class CatalogBody:
+    raw: bytes       # /catalog JSON (utf-8), mmap 스냅샷이면 매핑 위의 memoryview
+    gzip: bytes      # raw를 미리 gzip 압축한 것
+    etag: str        # raw의 내용 해시 (따옴표 포함)
+
+
+def _effect_json(e) -> Dict[str, Any]:
+    s = e.stats
+    return {"stats": {"str": s.str, "dex": s.dex, "int": s.int, "luk": s.luk}, "acc": e.acc}
+
+
+def build_catalog_body(monsters, items, buffs, doping) -> CatalogBody:
+    payload = {
+        "monsters": {
+            mid: {"name": m.name, "level": m.level, "evasion": m.evasion, "image_url": m.image_url}
+            for mid, m in monsters.items()
+        },
+        "items": {
+            iid: {"name": it.name, "slot": it.slot.value, "effect": _effect_json(it.effect), "image_url": it.icon_url}
+            for iid, it in items.items()
+        },
+        "buffs": {
+            bid: {"name": spec.name, "acc_group": spec.acc_group, "effect": _effect_json(spec.effect)}
+            for bid, spec in buffs.items()
+        },
+        "doping": {
+            did: {"name": spec.name, "acc_group": spec.acc_group, "effect": _effect_json(spec.effect)}
+            for did, spec in doping.items()
+        },
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return CatalogBody(
+        raw=raw,
+        gzip=gzip.compress(raw, compresslevel=9, mtime=0),
+        etag='"' + hashlib.sha256(raw).hexdigest()[:32] + '"',
+    )
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    한 시점의 카탈로그 전체 (만든 뒤에는 바뀌지 않음, 요청 하나는 스냅샷 하나만 봄)
+    store가 있으면(SQLite / mmap 스냅샷) monsters/items/... 는 저장소의 Mapping 뷰, 인덱스/검색도 저장소 조회
+    """
+    version: int
+    fingerprint: str
+    loaded_at: float
+    monsters: Mapping[str, Monster]
+    items: Mapping[str, Item]
+    buffs: Mapping[str, EffectSpec]
+    doping: Mapping[str, EffectSpec]
+    store: Optional[SqliteCatalog | MmapCatalog] = None
+
+    @cached_property
+    def monster_index(self):
+        # hittable(level, acc, sort_by) 조회: JSON은 메모리 인덱스, 저장소는 같은 조건을 SQL/열 배열로
+        return self.store if self.store is not None else MonsterReachIndex(self.monsters)
+
+    @cached_property
+    def body(self) -> CatalogBody:
+        if self.store is not None and hasattr(self.store, "catalog_body"):
+            # mmap 스냅샷: 파일에 들어 있는 본문을 그대로 (워커마다 다시 만들지 않음)
+            return self.store.catalog_body()
+        return build_catalog_body(self.monsters, self.items, self.buffs, self.doping)
+
+    @cached_property
+    def loadouts(self) -> LoadoutCompiler:
+        # 스펙 해석/인턴 캐시도 스냅샷 단위 (리로드하면 같이 버려짐)
+        return LoadoutCompiler(self)
+
+    @cached_property
+    def item_frontier(self) -> ItemFrontier:
+        # 직업 종류 x 슬롯별 파레토 프런티어 (gear 탐색 후보 축소용)
+        return ItemFrontier(self.items)
+
+    @cached_property
+    def item_search(self):
+        return self.store.item_search if self.store is not None else SearchIndex.from_items(self.items)
+
+    @cached_property
+    def monster_search(self):
+        return self.store.monster_search if self.store is not None else SearchIndex.from_monsters(self.monsters)
+
+
+def source_fingerprint() -> str:
+    # 원본 JSON들(또는 SQLite/스냅샷 파일)의 (크기, mtime) -> 바뀌었는지 판단용
+    if data_store.CATALOG_DB:
+        st = Path(data_store.CATALOG_DB).stat()
+        return hashlib.sha256(f"store:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+    h = hashlib.sha256()
+    for name in CATALOG_FILES:
+        st = (data_store.DATA_DIR / name).stat()
+        h.update(f"{name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()[:16]
+
+
+def build_snapshot(version: int) -> CatalogSnapshot:
+    fingerprint = source_fingerprint()
+    store = open_catalog()
+    if store is not None:
+        # 전체를 읽지 않음: /catalog 본문 등은 처음 필요할 때 만듦
+        return CatalogSnapshot(
+            version=version,
+            fingerprint=fingerprint,
+            loaded_at=time.time(),
+            monsters=store.monsters,
+            items=store.items,
+            buffs=store.buffs,
+            doping=store.doping,
+            store=store,
+        )
+    snap = CatalogSnapshot(
+        version=version,
+        fingerprint=fingerprint,
+        loaded_at=time.time(),
+        monsters=data_store.load_monsters(),
+        items=data_store.load_items(),
+        buffs=data_store.load_named_effect_catalog("buff_skills.json"),
+        doping=data_store.load_named_effect_catalog("doping.json"),
+    )
+    # JSON은 리로드 스레드에서 미리 만들어 둠 (요청이 첫 생성 비용을 내지 않도록)
+    snap.monster_index
+    snap.body
+    snap.item_frontier
+    return snap
+
+
+class CatalogManager:
+    """
+    카탈로그 스냅샷 보관 + 백그라운드 리로드
+    - current: 항상 완성된 스냅샷 (참조 교체는 원자적이라 요청 중에 섞이지 않음)
+    - request_reload(): 백그라운드 스레드에서 새 스냅샷을 만든 뒤 교체 (호출은 바로 반환)
+    - start_watching(): data 디렉터리를 주기적으로 확인해서 바뀌면 request_reload()
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot = build_snapshot(version=1)
+        self._reload_thread: Optional[threading.Thread] = None
+        # 워커가 pending 확인 후 끝내기로 한 시점과 스레드가 실제로 끝나는 시점 사이에 요청이 사라지지 않도록
+        # 실행 여부는 is_alive()가 아니라 같은 락 아래에서 켜고 끄는 플래그로 판단
+        self._reload_running = False
+        self._reload_pending = False
+        self._watch_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.last_error: Optional[str] = None
+        self._failed_fingerprint: Optional[str] = None
+
+    @property
+    def current(self) -> CatalogSnapshot:
+        return self._snapshot
+
+    @property
+    def reloading(self) -> bool:
+        return self._reload_running
+
+    def reload(self) -> CatalogSnapshot:
+        """동기 리로드 (실패하면 예외, 기존 스냅샷은 그대로)"""
+        snap = build_snapshot(version=self._snapshot.version + 1)
+        with self._lock:
+            # 더 새로운 버전이 먼저 들어갔으면 덮어쓰지 않음
+            if snap.version > self._snapshot.version:
+                self._snapshot = snap
+            self.last_error = None
+        return self._snapshot
+
+    def request_reload(self) -> bool:
+        """백그라운드 리로드 시작. 이미 진행 중이면 끝난 뒤 한 번 더 하도록 표시만 하고 False"""
+        with self._lock:
+            if self._reload_running:
+                self._reload_pending = True
+                return False
+            self._reload_running = True
+            self._reload_thread = threading.Thread(target=self._reload_worker, name="catalog-reload", daemon=True)
+            self._reload_thread.start()
+            return True
+
+    def _reload_worker(self) -> None:
+        while True:
+            try:
+                self.reload()
+            except Exception as e:
+                # 잘못된 JSON 등: 기존 스냅샷 유지, 파일이 다시 바뀌면 재시도
+                self.last_error = f"{type(e).__name__}: {e}"
+                try:
+                    self._failed_fingerprint = source_fingerprint()
+                except OSError:
+                    self._failed_fingerprint = None
+            with self._lock:
+                if not self._reload_pending:
+                    self._reload_running = False
+                    return
+                self._reload_pending = False
+
+    def start_watching(self, interval: float = 2.0) -> None:
+        if self._watch_thread is not None:
+            return
+        self._stop.clear()
+        self._watch_thread = threading.Thread(target=self._watch, args=(interval,), name="catalog-watch", daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+            self._watch_thread = None
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                fp = source_fingerprint()
+            except OSError:
+                # 파일 교체 중 잠깐 없는 경우
+                continue
+            if fp != self._snapshot.fingerprint and fp != self._failed_fingerprint and not self.reloading:
+                self.request_reload()
+
+    def status(self) -> Dict[str, Any]:
+        snap = self._snapshot
+        return {
+            "catalog_version": snap.version,
+            "catalog_fingerprint": snap.fingerprint,
+            "loaded_at": snap.loaded_at,
+            "reloading": self.reloading,
+            "last_error": self.last_error,
+        }
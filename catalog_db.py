@@ -0,0 +1,443 @@
+"""
+SQLite 카탈로그 저장소 (data_store의 JSON 대신 쓸 수 있는 백엔드)
+
+    python -m accuracy_cal.catalog_db import catalog.sqlite [--data-dir DIR]
+
+- import: data/*.json -> SQLite (임시 파일에 쓴 뒤 교체, 열려 있는 연결은 예전 파일을 계속 봄)
+- 조회는 DB에서 (슬롯별 아이템, 레벨/EVA 범위 몬스터, id 조회, 이름 검색, 미스 0 몬스터)
+- monsters/items/buffs/doping은 dict와 같은 Mapping 뷰: 전체를 메모리에 올리지 않고 접근할 때 조회
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections.abc import ItemsView, Mapping, ValuesView
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from . import data_store
+from .models import Effect, EffectSpec, EquipSlot, Item, Monster, Stats
+from .reachability import SORT_KEYS
+from .search import (
+    CHOSEONG_SET,
+    SCORE_CHOSEONG,
+    SCORE_EXACT,
+    SCORE_PREFIX,
+    SCORE_SUBSTRING,
+    SearchHit,
+    choseong,
+    normalize,
+)
+
+SCHEMA_VERSION = 2
+# 뷰별 id 조회 캐시 크기 (스냅샷 단위라 리로드하면 같이 버려짐)
+LOOKUP_CACHE_SIZE = 4096
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE monsters (
+    rid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    name_norm TEXT NOT NULL,
+    name_cho TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    evasion INTEGER NOT NULL,
+    image_url TEXT
+);
+CREATE INDEX monsters_level ON monsters (level, evasion);
+CREATE INDEX monsters_evasion ON monsters (evasion, level);
+CREATE INDEX monsters_name ON monsters (name_norm);
+CREATE TABLE items (
+    rid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    name_norm TEXT NOT NULL,
+    name_cho TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    str INTEGER NOT NULL, dex INTEGER NOT NULL, int INTEGER NOT NULL, luk INTEGER NOT NULL, acc INTEGER NOT NULL,
+    image_url TEXT
+);
+CREATE INDEX items_slot ON items (slot, rid);
+CREATE INDEX items_name ON items (name_norm);
+CREATE TABLE effects (
+    rid INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    acc_group TEXT,
+    str INTEGER NOT NULL, dex INTEGER NOT NULL, int INTEGER NOT NULL, luk INTEGER NOT NULL, acc INTEGER NOT NULL,
+    UNIQUE (kind, id)
+);
+-- 이름 검색용 글자 1개/2개 n-gram (search.SearchIndex와 같은 방식, col: norm = name_norm / cho = name_cho)
+CREATE TABLE name_grams (
+    tbl TEXT NOT NULL,
+    col TEXT NOT NULL,
+    gram TEXT NOT NULL,
+    rid INTEGER NOT NULL,
+    PRIMARY KEY (tbl, col, gram, rid)
+) WITHOUT ROWID;
+"""
+
+# effects.kind -> 원본 파일
+EFFECT_FILES = {"buff": "buff_skills.json", "doping": "doping.json"}
+
+_MONSTER_COLS = "id, name, level, evasion, image_url"
+_ITEM_COLS = "id, name, slot, str, dex, int, luk, acc, image_url"
+_EFFECT_COLS = "id, name, acc_group, str, dex, int, luk, acc"
+
+_SLOTS = {s.value: s for s in EquipSlot}
+
+
+def _grams(text: str) -> set:
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _gram_rows(table: str, names: List[str]) -> Iterator[Tuple[str, str, str, int]]:
+    # rid는 1부터 입력 순서 (monsters/items에 같은 rid로 넣음)
+    for rid, name in enumerate(names, 1):
+        norm = normalize(name)
+        for col, text in (("norm", norm), ("cho", choseong(norm))):
+            for g in _grams(text):
+                yield table, col, g, rid
+
+
+# ---- import ----
+def import_json(db_path: Path, data_dir: Optional[Path] = None) -> Dict[str, int]:
+    """data_dir(기본 data_store.DATA_DIR)의 JSON 카탈로그를 db_path로 가져오기, 테이블별 행 수 반환"""
+    data_dir = Path(data_dir) if data_dir is not None else data_store.DATA_DIR
+    db_path = Path(db_path)
+
+    def rows(filename: str, compile_rows: Callable[[list], list]) -> list:
+        # 검증/정규화는 JSON 로더와 같은 행 컴파일러로
+        return compile_rows(json.loads((data_dir / filename).read_text(encoding="utf-8")))
+
+    monsters = rows("monsters.json", data_store.compile_monster_rows)
+    items = rows("items.json", data_store.compile_item_rows)
+    effects = {kind: rows(name, data_store.compile_named_effect_rows) for kind, name in EFFECT_FILES.items()}
+
+    fd, tmp = tempfile.mkstemp(dir=db_path.parent, prefix=db_path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+                conn.executemany(
+                    "INSERT INTO monsters (rid, id, name, name_norm, name_cho, level, evasion, image_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (rid, mid, name, normalize(name), choseong(normalize(name)), level, eva, url)
+                        for rid, (mid, name, level, eva, url) in enumerate(monsters, 1)
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO items (rid, id, name, name_norm, name_cho, slot, str, dex, int, luk, acc, image_url)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (rid, iid, name, normalize(name), choseong(normalize(name)), slot, *e, url)
+                        for rid, (iid, name, slot, e, url) in enumerate(items, 1)
+                    ),
+                )
+                for table, table_rows in (("monsters", monsters), ("items", items)):
+                    conn.executemany("INSERT INTO name_grams VALUES (?, ?, ?, ?)", _gram_rows(table, [r[1] for r in table_rows]))
+                for kind, effect_rows in effects.items():
+                    conn.executemany(
+                        "INSERT INTO effects (kind, id, name, acc_group, str, dex, int, luk, acc) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        ((kind, eid, name, group, *e) for eid, name, group, e in effect_rows),
+                    )
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+        os.replace(tmp, db_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return {"monsters": len(monsters), "items": len(items), **{kind: len(r) for kind, r in effects.items()}}
+
+
+# ---- row -> 모델 ----
+def _monster(row: tuple) -> Monster:
+    _id, name, level, evasion, image_url = row
+    return Monster(name=name, level=level, evasion=evasion, image_url=image_url)
+
+
+def _effect(s: int, d: int, i: int, l: int, acc: int) -> Effect:
+    return Effect(stats=Stats(str=s, dex=d, int=i, luk=l), acc=acc)
+
+
+def _item(row: tuple) -> Item:
+    iid, name, slot, s, d, i, l, acc, image_url = row
+    return Item(item_id=iid, name=name, slot=_SLOTS[slot], effect=_effect(s, d, i, l, acc), icon_url=image_url)
+
+
+def _effect_spec(row: tuple) -> EffectSpec:
+    _id, name, acc_group, s, d, i, l, acc = row
+    return EffectSpec(name=name, acc_group=acc_group, effect=_effect(s, d, i, l, acc))
+
+
+# ---- Mapping 뷰 ----
+class _TableView(Mapping):
+    """
+    테이블 하나를 id -> 모델 Mapping으로 (dict 대신 그대로 넘길 수 있음)
+    - [id] / get / in: id 인덱스 조회 (LRU 캐시)
+    - 순회 / items() / values(): 커서로 한 행씩 (원본 JSON 순서)
+    """
+
+    def __init__(self, store: "SqliteCatalog", table: str, cols: str, build: Callable[[tuple], Any], where: str = "", params: tuple = ()) -> None:
+        self._store = store
+        self._build = build
+        cond = f"WHERE {where}" if where else ""
+        self._select_all = f"SELECT {cols} FROM {table} {cond} ORDER BY rid"
+        self._select_ids = f"SELECT id FROM {table} {cond} ORDER BY rid"
+        self._select_one = f"SELECT {cols} FROM {table} WHERE {where + ' AND ' if where else ''}id = ?"
+        self._count = f"SELECT COUNT(*) FROM {table} {cond}"
+        self._params = params
+        self._lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._fetch)
+
+    def _fetch(self, key: str) -> Any:
+        row = self._store._conn().execute(self._select_one, (*self._params, key)).fetchone()
+        return None if row is None else self._build(row)
+
+    def __getitem__(self, key: str) -> Any:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        value = self._lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for (key,) in self._store._conn().execute(self._select_ids, self._params):
+            yield key
+
+    def __len__(self) -> int:
+        return self._store._conn().execute(self._count, self._params).fetchone()[0]
+
+    def iter_rows(self) -> Iterator[Tuple[str, Any]]:
+        for row in self._store._conn().execute(self._select_all, self._params):
+            yield row[0], self._build(row)
+
+    def items(self) -> "RowItems":
+        return RowItems(self)
+
+    def values(self) -> "RowValues":
+        return RowValues(self)
+
+
+class RowItems(ItemsView):
+    def __iter__(self):
+        return self._mapping.iter_rows()
+
+
+class RowValues(ValuesView):
+    def __iter__(self):
+        return (v for _, v in self._mapping.iter_rows())
+
+
+class _TableSearch:
+    """
+    SearchIndex.search와 같은 인터페이스/순위 (exact / prefix / substring / choseong)
+    - exact/prefix: name_norm 인덱스 범위 조회, limit개가 substring보다 높은 점수로 차면 여기서 끝
+    - substring/choseong: name_grams에서 질의의 가장 드문 n-gram을 가진 행만 후보로 instr 확인 (전체 스캔 없음)
+    순위는 여기서. 오타 허용(fuzzy) 단계는 없음
+    """
+
+    def __init__(self, store: "SqliteCatalog", table: str) -> None:
+        self._store = store
+        self._table = table
+        self._has_slot = table == "items"
+
+    def _rarest_gram(self, conn: sqlite3.Connection, col: str, text: str) -> Optional[str]:
+        # text를 포함할 수 있는 행이 가장 적은 n-gram (그런 행이 없으면 None)
+        grams = [text] if len(text) == 1 else sorted({text[i:i + 2] for i in range(len(text) - 1)})
+        best, best_n = None, -1
+        for g in grams:
+            (n,) = conn.execute(
+                "SELECT count(*) FROM name_grams WHERE tbl = ? AND col = ? AND gram = ?", (self._table, col, g)
+            ).fetchone()
+            if n == 0:
+                return None
+            if best is None or n < best_n:
+                best, best_n = g, n
+        return best
+
+    def search(self, query: str, limit: Optional[int] = 20, slot: Optional[EquipSlot] = None) -> List[SearchHit]:
+        q = normalize(query)
+        if not q:
+            return []
+        if slot is not None and not self._has_slot:
+            return []
+        conn = self._store._conn()
+        table = self._table
+        select = f"SELECT id, name, {'slot' if self._has_slot else 'NULL'}"
+        slot_sql, slot_params = (" AND slot = ?", [slot.value]) if slot is not None else ("", [])
+        ranked = []
+
+        def add(score: float, match: str, key: str, name: str, slot_v: Optional[str]) -> None:
+            ranked.append((-score, len(name), key, name, match, slot_v))
+
+        # exact / prefix: name_norm이 q로 시작 = [q, q의 마지막 글자 + 1) 범위 (BINARY 비교 = 코드 포인트 순)
+        upper = q[:-1] + chr(ord(q[-1]) + 1) if ord(q[-1]) < 0x10FFFF else None
+        sql = f"{select}, name_norm FROM {table} WHERE name_norm >= ?" + (" AND name_norm < ?" if upper else "") + slot_sql
+        params = [q] + ([upper] if upper else []) + slot_params
+        if limit is not None:
+            # exact가 가장 짧음 -> 짧은 이름 순 = 점수 순 (동점은 SearchIndex와 같게 이름 길이 -> id)
+            sql += " ORDER BY length(name_norm), length(name), id LIMIT ?"
+            params.append(limit)
+        for key, name, slot_v, norm in conn.execute(sql, params):
+            if norm == q:
+                add(SCORE_EXACT, "exact", key, name, slot_v)
+            elif norm.startswith(q):
+                add(SCORE_PREFIX - len(norm), "prefix", key, name, slot_v)
+
+        # substring(pos >= 1) 점수 < SCORE_SUBSTRING, choseong은 더 낮음 -> limit개가 그 이상이면 순위 확정
+        if limit is not None and 0 < limit <= len(ranked) and -heapq.nsmallest(limit, ranked)[-1][0] >= SCORE_SUBSTRING:
+            return self._hits(heapq.nsmallest(limit, ranked))
+
+        gram = self._rarest_gram(conn, "norm", q)
+        if gram is not None:
+            sql = (
+                f"{select}, name_norm, instr(name_norm, ?) FROM {table}"
+                " WHERE rid IN (SELECT rid FROM name_grams WHERE tbl = ? AND col = 'norm' AND gram = ?)"
+                " AND instr(name_norm, ?) > 1" + slot_sql
+            )
+            for key, name, slot_v, norm, pos in conn.execute(sql, [q, table, gram, q] + slot_params):
+                add(SCORE_SUBSTRING - (pos - 1) - len(norm) / 100, "substring", key, name, slot_v)
+
+        if any(ch in CHOSEONG_SET for ch in q):
+            qc = choseong(q)
+            gram = self._rarest_gram(conn, "cho", qc)
+            if gram is not None:
+                # 이름에 q가 그대로 있는 행은 위에서 이미 (exact/prefix/substring)
+                sql = (
+                    f"{select}, name_cho, instr(name_cho, ?) FROM {table}"
+                    " WHERE rid IN (SELECT rid FROM name_grams WHERE tbl = ? AND col = 'cho' AND gram = ?)"
+                    " AND instr(name_cho, ?) > 0 AND instr(name_norm, ?) = 0" + slot_sql
+                )
+                for key, name, slot_v, cho, pos in conn.execute(sql, [qc, table, gram, qc, q] + slot_params):
+                    add(SCORE_CHOSEONG - (pos - 1) - len(cho) / 100, "choseong", key, name, slot_v)
+
+        return self._hits(sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked))
+
+    @staticmethod
+    def _hits(top: list) -> List[SearchHit]:
+        return [SearchHit(key, name, match, -neg, _SLOTS[s] if s else None) for neg, _, key, name, match, s in top]
+
+
+# ---- 저장소 ----
+class SqliteCatalog:
+    """
+    SQLite 카탈로그 (읽기 전용 연결, 스레드마다 하나)
+    monsters / items / buffs / doping: Mapping 뷰, item_search / monster_search: 이름 검색
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path).resolve()
+        if not self.path.exists():
+            raise FileNotFoundError(f"catalog db not found: {self.path}")
+        self._local = threading.local()
+        version = self._conn().execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if version is None or int(version[0]) != SCHEMA_VERSION:
+            raise ValueError(f"unsupported catalog db schema (expected {SCHEMA_VERSION}): {self.path}")
+
+        self.monsters = _TableView(self, "monsters", _MONSTER_COLS, _monster)
+        self.items = _TableView(self, "items", _ITEM_COLS, _item)
+        self.buffs = _TableView(self, "effects", _EFFECT_COLS, _effect_spec, "kind = ?", ("buff",))
+        self.doping = _TableView(self, "effects", _EFFECT_COLS, _effect_spec, "kind = ?", ("doping",))
+        self.item_search = _TableSearch(self, "items")
+        self.monster_search = _TableSearch(self, "monsters")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 파일이 교체돼도 이미 연 연결은 예전 파일을 계속 봄 (스냅샷 일관성)
+            conn = self._local.conn = sqlite3.connect(self.path.as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+        return conn
+
+    def monster(self, monster_id: str) -> Optional[Monster]:
+        return self.monsters.get(monster_id)
+
+    def item(self, item_id: str) -> Optional[Item]:
+        return self.items.get(item_id)
+
+    def items_by_slot(self, slot: EquipSlot) -> List[Item]:
+        rows = self._conn().execute(f"SELECT {_ITEM_COLS} FROM items WHERE slot = ? ORDER BY rid", (slot.value,))
+        return [_item(r) for r in rows]
+
+    def monsters_in_range(
+        self,
+        level_min: Optional[int] = None,
+        level_max: Optional[int] = None,
+        evasion_min: Optional[int] = None,
+        evasion_max: Optional[int] = None,
+    ) -> List[Tuple[str, Monster]]:
+        """레벨/EVA 범위(양 끝 포함, None이면 제한 없음)의 (id, Monster), 레벨 -> EVA -> id 순"""
+        conds, params = [], []
+        for col, op, v in (("level", ">=", level_min), ("level", "<=", level_max), ("evasion", ">=", evasion_min), ("evasion", "<=", evasion_max)):
+            if v is not None:
+                conds.append(f"{col} {op} ?")
+                params.append(v)
+        where = f"WHERE {' AND '.join(conds)}" if conds else ""
+        rows = self._conn().execute(f"SELECT {_MONSTER_COLS} FROM monsters {where} ORDER BY level, evasion, id", params)
+        return [(r[0], _monster(r)) for r in rows]
+
+    def hittable(self, level: int, acc: int, sort_by: str = "level") -> List[Tuple[str, Monster]]:
+        """MonsterReachIndex.hittable과 같은 결과 (조건을 SQL로: 유도는 reachability.MonsterReachIndex 참고)"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}: {sort_by!r}")
+        if acc < 0:
+            return []
+        m_limit = 15 * acc + 14
+        order = "level, evasion, id" if sort_by == "level" else "evasion, level, id"
+        # 레벨차 > 0 이고 (M // EVA - 55) < 0 이면 SQLite 정수 나눗셈(0 방향 버림)이든 floor든 조건이 거짓이라 결과 동일
+        rows = self._conn().execute(
+            f"SELECT {_MONSTER_COLS} FROM monsters"
+            " WHERE evasion <= ? AND (evasion = 0 OR level <= ? OR level - ? <= (? / evasion - 55) / 2)"
+            f" ORDER BY {order}",
+            (m_limit // 55, level, level, m_limit),
+        )
+        return [(r[0], _monster(r)) for r in rows]
+
+    def __len__(self) -> int:
+        # snapshot.monster_index 자리에 그대로 쓸 수 있도록 (MonsterReachIndex와 같은 의미)
+        return len(self.monsters)
+
+
+def open_catalog(path: Optional[str] = None):
+    """
+    path(없으면 data_store.CATALOG_DB)가 있으면 카탈로그 저장소, 아니면 None (JSON 로더 사용)
+    파일 헤더로 구분: mmap 스냅샷(catalog_mmap.MAGIC)이면 MmapCatalog, 아니면 SqliteCatalog
+    """
+    path = path or data_store.CATALOG_DB
+    if not path:
+        return None
+    from .catalog_mmap import MAGIC, MmapCatalog
+
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return MmapCatalog(Path(path))
+    return SqliteCatalog(Path(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_import = sub.add_parser("import", help="data/*.json -> SQLite")
+    p_import.add_argument("db")
+    p_import.add_argument("--data-dir", type=str, default=None)
+    args = parser.parse_args()
+
+    if args.command == "import":
+        for table, n in import_json(Path(args.db), args.data_dir).items():
+            print(f"{table}: {n}")
+
+
+if __name__ == "__main__":
+    main()
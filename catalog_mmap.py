@@ -0,0 +1,564 @@
+"""
+메모리 매핑 카탈로그 스냅샷 (여러 API 워커가 같은 파일을 읽기 전용으로 공유)
+
+    python -m accuracy_cal.catalog_mmap build catalog.snap [--data-dir DIR]
+
+- 고정 레이아웃 바이너리: 헤더(JSON) + 열 배열(int32) + 문자열 테이블 + 이름 검색용 텍스트 + /catalog 본문
+- 워커는 파일을 mmap만 함 -> 페이지는 OS 페이지 캐시에서 공유, 워커별 메모리는 카탈로그 크기와 거의 무관
+- monsters/items/buffs/doping: id -> 가벼운 행 뷰(Monster/Item/EffectSpec과 같은 속성)의 Mapping
+- id 조회는 id 순 정렬 배열에서 이진 탐색, 범위/미스 0 조회는 열 배열(numpy, 복사 없음)로
+- ACCURACY_CAL_CATALOG_DB / --catalog-db 에 SQLite 파일 대신 그대로 줄 수 있음 (catalog_db.open_catalog가 파일 헤더로 구분)
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from . import data_store
+from .catalog import CatalogBody, build_catalog_body
+from .catalog_db import EFFECT_FILES, LOOKUP_CACHE_SIZE, RowItems, RowValues
+from .models import EffectSpec, EquipSlot, Item, Monster, new_effect, new_stats
+from .reachability import SORT_KEYS
+from .search import (
+    CHOSEONG_SET,
+    SCORE_CHOSEONG,
+    SCORE_EXACT,
+    SCORE_PREFIX,
+    SCORE_SUBSTRING,
+    SearchHit,
+    choseong,
+    normalize,
+)
+
+MAGIC = b"ACCSNAP\x00"
+FORMAT_VERSION = 1
+# 헤더: MAGIC + JSON 길이(uint32) + JSON, 섹션은 ALIGN 바이트 경계에서 시작
+_HEADER_LEN = struct.Struct("<I")
+ALIGN = 8
+NULL = -1  # 문자열 없음 (image_url / acc_group)
+
+_SLOT_LIST = list(EquipSlot)
+_STAT_COLS = ("str", "dex", "int", "luk", "acc")
+
+
+# ---- build ----
+class _Writer:
+    """섹션(이름 -> (형식, 바이트))과 문자열 테이블(중복 제거)을 모아 한 파일로"""
+
+    def __init__(self) -> None:
+        self.sections: Dict[str, Tuple[str, bytes]] = {}
+        self._strings: Dict[str, int] = {}
+
+    def string(self, s: Optional[str]) -> int:
+        if s is None:
+            return NULL
+        return self._strings.setdefault(s, len(self._strings))
+
+    def column(self, name: str, fmt: str, values) -> None:
+        self.sections[name] = (fmt, array(fmt, values).tobytes())
+
+    def text(self, prefix: str, texts: List[str]) -> None:
+        # 행마다 "텍스트\n" 을 이어 붙임 (줄바꿈이 경계라 매치가 두 행에 걸치지 않음), start는 바이트 오프셋 (행 수 + 1)
+        data = bytearray()
+        starts = [0]
+        for t in texts:
+            data += t.encode("utf-8") + b"\n"
+            starts.append(len(data))
+        self.sections[f"{prefix}.data"] = ("B", bytes(data))
+        self.column(f"{prefix}.start", "I", starts)
+
+    def sorted_ids(self, prefix: str, ids: List[str]) -> None:
+        # by_id: id(utf-8 바이트) 순 행 번호 -> 이진 탐색, id_rank: 행 -> 그 순위 (id 순 정렬 키)
+        order = sorted(range(len(ids)), key=lambda r: ids[r].encode("utf-8"))
+        rank = [0] * len(ids)
+        for pos, r in enumerate(order):
+            rank[r] = pos
+        self.column(f"{prefix}.by_id", "i", order)
+        self.column(f"{prefix}.id_rank", "i", rank)
+
+    def write(self, path: Path, counts: Dict[str, int]) -> None:
+        data = bytearray()
+        offsets = [0]
+        for s in self._strings:
+            data += s.encode("utf-8")
+            offsets.append(len(data))
+        self.sections["strings.data"] = ("B", bytes(data))
+        self.column("strings.offset", "I", offsets)
+
+        def layout(start: int) -> Dict[str, list]:
+            table, pos = {}, start
+            for name, (fmt, blob) in self.sections.items():
+                pos += -pos % ALIGN
+                table[name] = [pos, len(blob) // array(fmt).itemsize, fmt]
+                pos += len(blob)
+            return table
+
+        def header(table: Dict[str, list]) -> bytes:
+            meta = {"version": FORMAT_VERSION, "byteorder": sys.byteorder, "counts": counts, "sections": table}
+            raw = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+            return MAGIC + _HEADER_LEN.pack(len(raw)) + raw
+
+        # 헤더 길이가 오프셋 자릿수에 따라 바뀔 수 있어서 고정될 때까지 반복
+        start = 0
+        while True:
+            table = layout(start)
+            head = header(table)
+            if len(head) <= start:
+                break
+            start = len(head) + -len(head) % ALIGN + 64
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(head + b"\0" * (start - len(head)))
+                pos = start
+                for name, (_fmt, blob) in self.sections.items():
+                    f.write(b"\0" * (table[name][0] - pos))
+                    f.write(blob)
+                    pos = table[name][0] + len(blob)
+            # 열려 있는 매핑은 예전 파일(inode)을 계속 봄
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def build_snapshot_file(path: Path, data_dir: Optional[Path] = None) -> Dict[str, int]:
+    """data_dir(기본 data_store.DATA_DIR)의 JSON 카탈로그 -> 스냅샷 파일, 테이블별 행 수 반환"""
+    data_dir = Path(data_dir) if data_dir is not None else data_store.DATA_DIR
+    path = Path(path)
+
+    def rows(filename: str, compile_rows) -> list:
+        # 검증/정규화는 JSON 로더와 같은 행 컴파일러로
+        return compile_rows(json.loads((data_dir / filename).read_text(encoding="utf-8")))
+
+    monsters = rows("monsters.json", data_store.compile_monster_rows)
+    items = rows("items.json", data_store.compile_item_rows)
+    effects = {kind: rows(name, data_store.compile_named_effect_rows) for kind, name in EFFECT_FILES.items()}
+
+    w = _Writer()
+    slot_code = {s.value: code for code, s in enumerate(_SLOT_LIST)}
+
+    w.column("monsters.id", "i", [w.string(r[0]) for r in monsters])
+    w.column("monsters.name", "i", [w.string(r[1]) for r in monsters])
+    w.column("monsters.level", "i", [r[2] for r in monsters])
+    w.column("monsters.evasion", "i", [r[3] for r in monsters])
+    w.column("monsters.image", "i", [w.string(r[4]) for r in monsters])
+    w.sorted_ids("monsters", [r[0] for r in monsters])
+    w.text("monsters.norm", [normalize(r[1]) for r in monsters])
+    w.text("monsters.cho", [choseong(normalize(r[1])) for r in monsters])
+
+    w.column("items.id", "i", [w.string(r[0]) for r in items])
+    w.column("items.name", "i", [w.string(r[1]) for r in items])
+    w.column("items.slot", "i", [slot_code[r[2]] for r in items])
+    for k, col in enumerate(_STAT_COLS):
+        w.column(f"items.{col}", "i", [r[3][k] for r in items])
+    w.column("items.image", "i", [w.string(r[4]) for r in items])
+    w.sorted_ids("items", [r[0] for r in items])
+    w.text("items.norm", [normalize(r[1]) for r in items])
+    w.text("items.cho", [choseong(normalize(r[1])) for r in items])
+
+    for kind, effect_rows in effects.items():
+        w.column(f"{kind}.id", "i", [w.string(r[0]) for r in effect_rows])
+        w.column(f"{kind}.name", "i", [w.string(r[1]) for r in effect_rows])
+        w.column(f"{kind}.acc_group", "i", [w.string(r[2]) for r in effect_rows])
+        for k, col in enumerate(_STAT_COLS):
+            w.column(f"{kind}.{col}", "i", [r[3][k] for r in effect_rows])
+        w.sorted_ids(kind, [r[0] for r in effect_rows])
+
+    # /catalog 본문도 미리 직렬화해서 넣음 (워커는 매핑된 바이트를 그대로 응답)
+    body = build_catalog_body(
+        data_store.build_monsters(monsters),
+        data_store.build_items(items),
+        data_store.build_named_effects(effects["buff"]),
+        data_store.build_named_effects(effects["doping"]),
+    )
+    w.sections["catalog.raw"] = ("B", body.raw)
+    w.sections["catalog.gzip"] = ("B", body.gzip)
+    w.sections["catalog.etag"] = ("B", body.etag.encode("ascii"))
+
+    counts = {"monsters": len(monsters), "items": len(items), **{kind: len(r) for kind, r in effects.items()}}
+    w.write(path, counts)
+    return counts
+
+
+# ---- 행 뷰 ----
+class _RowView:
+    """
+    스냅샷 한 행 (테이블 + 행 번호만 들고, 속성은 읽을 때 열에서 꺼냄)
+    모델(Monster/Item/EffectSpec)과 같은 속성, 같은 값이면 모델과도 == (to_model()로 비교)
+    """
+    __slots__ = ("_t", "_r")
+    _MODEL: Any = None
+    _FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, table: "_SnapshotTable", row: int) -> None:
+        self._t = table
+        self._r = row
+
+    def to_model(self) -> Any:
+        return self._MODEL(**{f: getattr(self, f) for f in self._FIELDS})
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _RowView):
+            other = other.to_model()
+        elif not isinstance(other, self._MODEL):
+            return NotImplemented
+        return self.to_model() == other
+
+    def __hash__(self) -> int:
+        return hash(self.to_model())
+
+    def __repr__(self) -> str:
+        return repr(self.to_model())
+
+
+class _MonsterView(_RowView):
+    __slots__ = ()
+    _MODEL = Monster
+    _FIELDS = ("name", "level", "evasion", "image_url")
+
+    @property
+    def name(self) -> str:
+        t = self._t
+        return t.snap.string(t.name[self._r])
+
+    @property
+    def level(self) -> int:
+        return self._t.level[self._r]
+
+    @property
+    def evasion(self) -> int:
+        return self._t.evasion[self._r]
+
+    @property
+    def image_url(self) -> Optional[str]:
+        t = self._t
+        return t.snap.string(t.image[self._r])
+
+
+class _EffectRow(_RowView):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        t = self._t
+        return t.snap.string(t.name[self._r])
+
+    @property
+    def effect(self):
+        t, r = self._t, self._r
+        return new_effect(new_stats(t.str[r], t.dex[r], t.int[r], t.luk[r]), t.acc[r])
+
+
+class _ItemView(_EffectRow):
+    __slots__ = ()
+    _MODEL = Item
+    _FIELDS = ("item_id", "name", "slot", "effect", "icon_url")
+
+    @property
+    def item_id(self) -> str:
+        t = self._t
+        return t.snap.string(t.id[self._r])
+
+    @property
+    def slot(self) -> EquipSlot:
+        return _SLOT_LIST[self._t.slot[self._r]]
+
+    @property
+    def icon_url(self) -> Optional[str]:
+        t = self._t
+        return t.snap.string(t.image[self._r])
+
+
+class _EffectSpecView(_EffectRow):
+    __slots__ = ()
+    _MODEL = EffectSpec
+    _FIELDS = ("name", "effect", "acc_group")
+
+    @property
+    def acc_group(self) -> Optional[str]:
+        t = self._t
+        return t.snap.string(t.acc_group[self._r])
+
+
+# ---- Mapping 뷰 ----
+class _SnapshotTable(Mapping):
+    """
+    테이블 하나를 id -> 행 뷰 Mapping으로 (catalog_db._TableView와 같은 역할)
+    - [id] / get / in: by_id 이진 탐색 (LRU 캐시)
+    - 순회 / items() / values(): 행 순서 (원본 JSON 순서)
+    열은 memoryview (인덱싱하면 바로 int), 속성 이름이 곧 열 이름 (t.level[r])
+    """
+
+    def __init__(self, snap: "MmapCatalog", prefix: str, view: type, columns: Tuple[str, ...]) -> None:
+        self.snap = snap
+        self._view = view
+        self._n = snap.counts[prefix]
+        self.id = snap.column(f"{prefix}.id")
+        self.by_id = snap.column(f"{prefix}.by_id")
+        for col in columns:
+            setattr(self, col, snap.column(f"{prefix}.{col}"))
+        self._lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._find)
+
+    def _find(self, key: str) -> Optional[_RowView]:
+        want = key.encode("utf-8")
+        key_bytes, by_id, ids = self.snap.string_bytes, self.by_id, self.id
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_bytes(ids[by_id[mid]]) < want:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n and key_bytes(ids[by_id[lo]]) == want:
+            return self._view(self, by_id[lo])
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        value = self._lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        string, ids = self.snap.string, self.id
+        return (string(ids[r]) for r in range(self._n))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def row(self, r: int) -> Any:
+        return self._view(self, r)
+
+    def iter_rows(self) -> Iterator[Tuple[str, Any]]:
+        string, ids, view = self.snap.string, self.id, self._view
+        for r in range(self._n):
+            yield string(ids[r]), view(self, r)
+
+    def items(self) -> RowItems:
+        return RowItems(self)
+
+    def values(self) -> RowValues:
+        return RowValues(self)
+
+
+class _TextSearch:
+    """
+    SearchIndex.search와 같은 인터페이스/순위 (exact / prefix / substring / choseong, fuzzy 없음)
+    매핑된 이름 텍스트에서 mmap.find로 매치 위치를 찾고 행 시작 오프셋 이진 탐색으로 행 번호 (인덱스를 메모리에 만들지 않음)
+    """
+
+    def __init__(self, table: _SnapshotTable, prefix: str, has_slot: bool) -> None:
+        self._t = table
+        snap = table.snap
+        self._mm = snap.mm
+        self._norm = (snap.offset(f"{prefix}.norm.data"), snap.column(f"{prefix}.norm.start"))
+        self._cho = (snap.offset(f"{prefix}.cho.data"), snap.column(f"{prefix}.cho.start"))
+        self._has_slot = has_slot
+
+    def _scan(self, text: Tuple[int, memoryview], q: str) -> Iterator[Tuple[int, str, int]]:
+        # (행, 그 행 텍스트, 글자 단위 위치), 한 행에서는 첫 매치만
+        base, starts = text
+        mm, qb = self._mm, q.encode("utf-8")
+        end = base + starts[len(starts) - 1]
+        at = mm.find(qb, base, end)
+        while at >= 0:
+            r = bisect_right(starts, at - base) - 1
+            a, b = base + starts[r], base + starts[r + 1] - 1
+            # utf-8은 자기 동기화: 바이트 매치는 항상 글자 경계에서 시작
+            yield r, str(mm[a:b], "utf-8"), len(str(mm[a:at], "utf-8"))
+            at = mm.find(qb, b + 1, end)
+
+    def search(self, query: str, limit: Optional[int] = 20, slot: Optional[EquipSlot] = None) -> List[SearchHit]:
+        q = normalize(query)
+        if not q:
+            return []
+        if slot is not None and not self._has_slot:
+            return []
+        t = self._t
+        string = t.snap.string
+        slot_code = None if slot is None else _SLOT_LIST.index(slot)
+        ranked: List[Tuple[float, int, str, int, str]] = []
+        seen = set()
+
+        def add(r: int, score: float, match: str) -> None:
+            name = string(t.name[r])
+            ranked.append((-score, len(name), string(t.id[r]), r, match))
+            seen.add(r)
+
+        for r, norm, pos in self._scan(self._norm, q):
+            if slot_code is not None and t.slot[r] != slot_code:
+                continue
+            if norm == q:
+                add(r, SCORE_EXACT, "exact")
+            elif pos == 0:
+                add(r, SCORE_PREFIX - len(norm), "prefix")
+            else:
+                add(r, SCORE_SUBSTRING - pos - len(norm) / 100, "substring")
+
+        if any(ch in CHOSEONG_SET for ch in q):
+            for r, cho, pos in self._scan(self._cho, choseong(q)):
+                if r in seen or (slot_code is not None and t.slot[r] != slot_code):
+                    continue
+                add(r, SCORE_CHOSEONG - pos - len(cho) / 100, "choseong")
+
+        top = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+        return [
+            SearchHit(key, string(t.name[r]), match, -neg, _SLOT_LIST[t.slot[r]] if self._has_slot else None)
+            for neg, _, key, r, match in top
+        ]
+
+
+# ---- 저장소 ----
+class MmapCatalog:
+    """
+    매핑된 스냅샷 파일 (읽기 전용, 스레드/프로세스 간 공유 가능)
+    SqliteCatalog와 같은 인터페이스: monsters / items / buffs / doping, item_search / monster_search,
+    items_by_slot / monsters_in_range / hittable / catalog_body
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path).resolve()
+        with open(self.path, "rb") as f:
+            # 매핑은 fd를 닫아도 유지됨, 파일이 교체돼도 예전 내용을 계속 봄
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"not a catalog snapshot: {self.path}")
+        (n,) = _HEADER_LEN.unpack_from(self.mm, len(MAGIC))
+        start = len(MAGIC) + _HEADER_LEN.size
+        meta = json.loads(self.mm[start:start + n])
+        if meta["version"] != FORMAT_VERSION or meta["byteorder"] != sys.byteorder:
+            raise ValueError(f"unsupported catalog snapshot (expected v{FORMAT_VERSION}, {sys.byteorder}-endian): {self.path}")
+        self.counts: Dict[str, int] = meta["counts"]
+        self._sections: Dict[str, list] = meta["sections"]
+        self._mv = memoryview(self.mm)
+
+        self._str_data = self.offset("strings.data")
+        self._str_offset = self.column("strings.offset")
+
+        self.monsters = _SnapshotTable(self, "monsters", _MonsterView, ("name", "level", "evasion", "image", "id_rank"))
+        self.items = _SnapshotTable(self, "items", _ItemView, ("name", "slot", *_STAT_COLS, "image"))
+        self.buffs = _SnapshotTable(self, "buff", _EffectSpecView, ("name", "acc_group", *_STAT_COLS))
+        self.doping = _SnapshotTable(self, "doping", _EffectSpecView, ("name", "acc_group", *_STAT_COLS))
+        self.item_search = _TextSearch(self.items, "items", has_slot=True)
+        self.monster_search = _TextSearch(self.monsters, "monsters", has_slot=False)
+
+    # 섹션 접근: 전부 매핑 위의 뷰 (복사 없음)
+    def offset(self, name: str) -> int:
+        return self._sections[name][0]
+
+    def column(self, name: str) -> memoryview:
+        off, count, fmt = self._sections[name]
+        return self._mv[off:off + count * array(fmt).itemsize].cast(fmt)
+
+    def array(self, name: str) -> np.ndarray:
+        off, count, fmt = self._sections[name]
+        return np.frombuffer(self.mm, dtype=np.dtype(fmt), count=count, offset=off)
+
+    def string_bytes(self, k: int) -> bytes:
+        o = self._str_offset
+        a = self._str_data
+        return self.mm[a + o[k]:a + o[k + 1]]
+
+    def string(self, k: int) -> Optional[str]:
+        if k < 0:
+            return None
+        o = self._str_offset
+        a = self._str_data
+        return str(self._mv[a + o[k]:a + o[k + 1]], "utf-8")
+
+    def catalog_body(self) -> CatalogBody:
+        # raw/gzip은 매핑 위의 memoryview 그대로 (워커마다 복사하지 않음)
+        return CatalogBody(
+            raw=self.column("catalog.raw"),
+            gzip=self.column("catalog.gzip"),
+            etag=bytes(self.column("catalog.etag")).decode("ascii"),
+        )
+
+    def monster(self, monster_id: str) -> Optional[Monster]:
+        return self.monsters.get(monster_id)
+
+    def item(self, item_id: str) -> Optional[Item]:
+        return self.items.get(item_id)
+
+    def items_by_slot(self, slot: EquipSlot) -> List[Item]:
+        rows = np.flatnonzero(self.array("items.slot") == _SLOT_LIST.index(slot))
+        return [self.items.row(r) for r in rows.tolist()]
+
+    def _monster_rows(self, mask: np.ndarray, sort_by: str) -> List[Tuple[str, Monster]]:
+        level, evasion = self.array("monsters.level"), self.array("monsters.evasion")
+        rows = np.flatnonzero(mask)
+        # 레벨 -> EVA -> id (id_rank는 id의 바이트 순서 = 문자열 순서)
+        keys = (self.array("monsters.id_rank")[rows], evasion[rows], level[rows])
+        if sort_by == "evasion":
+            keys = (keys[0], keys[2], keys[1])
+        order = rows[np.lexsort(keys)]
+        t = self.monsters
+        return [(self.string(t.id[r]), t.row(r)) for r in order.tolist()]
+
+    def monsters_in_range(
+        self,
+        level_min: Optional[int] = None,
+        level_max: Optional[int] = None,
+        evasion_min: Optional[int] = None,
+        evasion_max: Optional[int] = None,
+    ) -> List[Tuple[str, Monster]]:
+        """레벨/EVA 범위(양 끝 포함, None이면 제한 없음)의 (id, 몬스터), 레벨 -> EVA -> id 순"""
+        level, evasion = self.array("monsters.level"), self.array("monsters.evasion")
+        mask = np.ones(len(level), dtype=bool)
+        for col, lo, hi in ((level, level_min, level_max), (evasion, evasion_min, evasion_max)):
+            if lo is not None:
+                mask &= col >= lo
+            if hi is not None:
+                mask &= col <= hi
+        return self._monster_rows(mask, "level")
+
+    def hittable(self, level: int, acc: int, sort_by: str = "level") -> List[Tuple[str, Monster]]:
+        """MonsterReachIndex.hittable과 같은 결과 (SqliteCatalog.hittable과 같은 조건을 열 배열로)"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}: {sort_by!r}")
+        if acc < 0:
+            return []
+        m_limit = 15 * acc + 14
+        mob_level = self.array("monsters.level").astype(np.int64)
+        evasion = self.array("monsters.evasion").astype(np.int64)
+        reach = (m_limit // np.maximum(evasion, 1) - 55) // 2
+        mask = (evasion <= m_limit // 55) & ((evasion == 0) | (mob_level <= level) | (mob_level - level <= reach))
+        return self._monster_rows(mask, sort_by)
+
+    def __len__(self) -> int:
+        return self.counts["monsters"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="data/*.json -> 스냅샷 파일")
+    p_build.add_argument("path")
+    p_build.add_argument("--data-dir", type=str, default=None)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        for table, n in build_snapshot_file(Path(args.path), args.data_dir).items():
+            print(f"{table}: {n}")
+
+
+if __name__ == "__main__":
+    main()
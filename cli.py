@@ -1,61 +1,126 @@
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import argparse
+import sys
+from typing import TYPE_CHECKING, List, Mapping, Optional
+from contextlib import contextmanager
+from functools import cached_property
 
 from .defaults import DEFAULT_BASE_STATS
-from .engine import derive_character_result, check_hit
-from .models import BuffState, CharacterInput, EquipmentState, JobGroup, Stats, Monster, EquipSlot, Effect, Item, Stats
-from .data_store import load_monsters, load_effect_catalog, load_items, load_named_effect_catalog
+from .loadout import LoadoutCompiler
+from .models import CharacterInput, JobGroup, Stats, Monster, EquipSlot, Effect, EffectSpec, Item
+
+if TYPE_CHECKING:
+    # 주석용 (카탈로그 백엔드는 --catalog-db를 쓸 때만 _Catalogs.store에서 import)
+    from .catalog_db import SqliteCatalog
+    from .catalog_mmap import MmapCatalog
 
 import json
 from pathlib import Path
 
-def parse_kv_int_list(spec: str) -> dict[str, int]:
-    """
-    "acc=7,dex=3,luk=1" -> {"acc":7,"dex":3,"luk":1}
-    """
-    out: dict[str, int] = {}
-    if not spec:
-        return out
-    for part in spec.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        if "=" not in part:
-            raise ValueError(f"커스텀 옵션 형식 오류: '{part}' (key=value 필요)")
-        k, v = part.split("=", 1)
-        k = k.strip().lower()
-        v = v.strip()
-        out[k] = int(v)
-    return out
-
-def make_custom_item(slot: "EquipSlot", kv: dict[str, int]) -> Item:
-    acc = kv.pop("acc", 0)
-    s = Stats(
-        str=kv.pop("str", 0),
-        dex=kv.pop("dex", 0),
-        int=kv.pop("int", 0),
-        luk=kv.pop("luk", 0),
-    )
-    if kv:
-        raise ValueError(f"허용되지 않은 키: {list(kv.keys())} (허용: str,dex,int,luk,acc)")
-    return Item(
-        item_id=f"custom_{slot.value}",
-        name=f"(커스텀 {slot.value})",
-        slot=slot,
-        effect=Effect(stats=s, acc=acc),
-        icon_url=None,
-    )
-
-def make_custom_effect(kv: dict[str, int]) -> Effect:
-    acc = kv.pop("acc", 0)
-    s = Stats(
-        str=kv.pop("str", 0),
-        dex=kv.pop("dex", 0),
-        int=kv.pop("int", 0),
-        luk=kv.pop("luk", 0),
-    )
-    if kv:
-        raise ValueError(f"허용되지 않은 키: {list(kv.keys())} (허용: str,dex,int,luk,acc)")
-    return Effect(stats=s, acc=acc)
+# 엔진/카탈로그/탐색 모듈은 해당 모드에서 처음 쓸 때 import (목록/검색 모드 시작 시간 단축)
+_IMPORT_FINISHED = time.perf_counter()
+
+
+class _Timings:
+    """--timings: import / catalog-load / compute 구간별 소요 시간 누적"""
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        # import: 지연 import만 누적 (모듈 로드 시점 import는 report에서 더함)
+        self.spent = {"import": 0.0, "catalog-load": 0.0}
+
+    @contextmanager
+    def measure(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spent[name] += time.perf_counter() - t0
+
+    def report(self) -> None:
+        total = time.perf_counter() - self.started
+        compute = total - self.spent["import"] - self.spent["catalog-load"]
+        imports = (_IMPORT_FINISHED - _IMPORT_STARTED) + self.spent["import"]
+        print("[TIMINGS]", file=sys.stderr)
+        print(f"- import      : {imports * 1e3:8.2f} ms", file=sys.stderr)
+        print(f"- catalog-load: {self.spent['catalog-load'] * 1e3:8.2f} ms", file=sys.stderr)
+        print(f"- compute     : {compute * 1e3:8.2f} ms", file=sys.stderr)
+
+
+class _Catalogs:
+    """카탈로그를 처음 접근할 때 한 번만 로드 (SQLite 카탈로그면 전체를 읽지 않고 필요한 행만 조회)"""
+
+    def __init__(self, timings: _Timings, db_path: Optional[str] = None) -> None:
+        self._timings = timings
+        self._db_path = db_path
+
+    def _load(self, fn_name: str, *args):
+        with self._timings.measure("import"):
+            from . import data_store
+        with self._timings.measure("catalog-load"):
+            return getattr(data_store, fn_name)(*args)
+
+    @cached_property
+    def store(self) -> Optional["SqliteCatalog | MmapCatalog"]:
+        # --catalog-db 또는 ACCURACY_CAL_CATALOG_DB (SQLite 파일 또는 mmap 스냅샷)
+        with self._timings.measure("import"):
+            from . import data_store
+        path = self._db_path or data_store.CATALOG_DB
+        if not path:
+            return None
+        with self._timings.measure("import"):
+            from .catalog_db import open_catalog
+        with self._timings.measure("catalog-load"):
+            return open_catalog(path)
+
+    @cached_property
+    def monsters(self) -> Mapping[str, Monster]:
+        return self.store.monsters if self.store is not None else self._load("load_monsters")
+
+    @cached_property
+    def items(self) -> Mapping[str, Item]:
+        return self.store.items if self.store is not None else self._load("load_items")
+
+    @cached_property
+    def buffs(self) -> Mapping[str, EffectSpec]:
+        return self.store.buffs if self.store is not None else self._load("load_named_effect_catalog", "buff_skills.json")
+
+    @cached_property
+    def doping(self) -> Mapping[str, EffectSpec]:
+        return self.store.doping if self.store is not None else self._load("load_named_effect_catalog", "doping.json")
+
+    def items_by_slot(self, slot: EquipSlot) -> List[Item]:
+        if self.store is not None:
+            return self.store.items_by_slot(slot)
+        return [it for it in self.items.values() if it.slot == slot]
+
+    @cached_property
+    def monster_index(self):
+        if self.store is not None:
+            return self.store
+        with self._timings.measure("import"):
+            from .reachability import MonsterReachIndex
+        return MonsterReachIndex(self.monsters)
+
+    @cached_property
+    def item_search(self):
+        if self.store is not None:
+            return self.store.item_search
+        with self._timings.measure("import"):
+            from .search import SearchIndex
+        return SearchIndex.from_items(self.items)
+
+    @cached_property
+    def monster_search(self):
+        if self.store is not None:
+            return self.store.monster_search
+        with self._timings.measure("import"):
+            from .search import SearchIndex
+        return SearchIndex.from_monsters(self.monsters)
 
 def export_build_json(path: str, payload: dict) -> None:
     Path(path).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -74,22 +139,33 @@ def format_effect(e: "Effect") -> str:
     return " / ".join(parts) if parts else "(효과 없음)"
 
 
+def _print_similar_note(hits) -> None:
+    # 부분/초성 일치가 없어서 오타 허용 결과만 있는 경우
+    if hits and hits[0].match == "fuzzy":
+        print("(일치하는 이름 없음, 비슷한 이름:)")
+
+
 def add_effect(a: "Effect", b: "Effect") -> "Effect":
     # Effect.__add__가 이미 있으니 a+b로 써도 되지만, 의도를 명확히 하려고 분리
     return a + b
 
 
-def parse_custom_effect_from_rhs(rhs: str) -> "Effect":
-    # rhs: "custom:acc=10,dex=3"
-    kv = parse_kv_int_list(rhs[len("custom:"):])
-    return make_custom_effect(kv)
-
-
 #############################
 ##### main func section #####
 #############################
 
-def main() -> None:
+def _non_negative_int(text: str) -> int:
+    # --workers: 음수는 ProcessPoolExecutor까지 가기 전에 파서에서 거부
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0: {value}")
+    return value
+
+
+def _build_parser() -> argparse.ArgumentParser:
     ##### arguments section #####
     parser = argparse.ArgumentParser()
     parser.add_argument("--level", type=int, default=30)
@@ -100,7 +176,7 @@ def main() -> None:
     parser.add_argument("--luk", type=int, default=4)
     # parser.add_argument("--mw", type=float, default=0.15)  # 예: 0.15
     parser.add_argument("--mw", type=float, default=0.0, help="메용 퍼센트(소수). 예: 0.15")
-    parser.add_argument("--mw-on", action="store_true", help="메용 적용(마스터 15%)")
+    parser.add_argument("--mw-on", action="store_true", help="메용 적용(마스터 15%%)")
 
     parser.add_argument("--mw-percent", type=int, default=None, help="메용 퍼센트로 입력(예: 15). 주면 --mw보다 우선")
 
@@ -110,6 +186,7 @@ def main() -> None:
     parser.add_argument("--equip", action="append",default=[], help="장비 장착: --equip gloves=work_gloves (여러번 가능)",)
     
     parser.add_argument("--list-items", type=str, default=None, help="슬롯별 아이템 목록 출력 후 종료. 예) --list-items gloves",)
+    parser.add_argument("--frontier", type=str, default=None, choices=["warrior","archer","thief","mage"], help="--list-items에서 이 직업의 명중 축(물리 DEX/LUK/ACC, 마법 INT/LUK/ACC)으로 지배당하지 않은 아이템만")
     parser.add_argument("--list-items-all", action="store_true", help="전체 아이템 프리셋 목록 출력 후 종료")
     parser.add_argument("--find-item", type=str, default=None, help="아이템 이름 부분검색 후 종료. 예) --find-item 장갑")
 
@@ -126,11 +203,126 @@ def main() -> None:
     parser.add_argument("--export", type=str, default=None, help="현재 입력을 JSON으로 저장. 예) --export build.json")
     parser.add_argument("--import", dest="import_path", type=str, default=None, help="JSON 빌드 불러오기. 예) --import build.json")
     parser.add_argument("--show-loadout", action="store_true", help="현재 적용된 장비/버프/도핑 목록 출력")
+    parser.add_argument("--batch", type=str, default=None, help="빌드 JSONL(--export 형식, 한 줄에 하나)을 읽어 줄마다 결과 JSONL 출력 후 종료. '-'면 stdin")
+    parser.add_argument("--batch-out", type=str, default=None, help="--batch 결과 파일 (기본 stdout)")
+    parser.add_argument("--workers", type=_non_negative_int, default=1, help="--batch 프로세스 수 (0이면 CPU 수). 출력 순서는 입력 순서 유지")
+
+    parser.add_argument("--optimize-gear", action="store_true", help="대상 몬스터 미스 0을 만드는 최소 비용 장비 조합 탐색 후 종료 (--equip로 준 장비는 고정)")
+    parser.add_argument("--top-k", type=int, default=5, help="--optimize-gear 결과 개수")
+    parser.add_argument("--min-stat", type=str, default=None, choices=["dex", "luk", "int", "str", "mixed"], help="몬스터별 미스 0에 필요한 최소 순스탯 출력 후 종료")
+    parser.add_argument("--mix-ratio", type=float, default=0.5, help="--min-stat mixed일 때 주 스탯(물리 DEX, 마법 INT) 배분 비율, 나머지는 LUK")
+    parser.add_argument("--hittable", action="store_true", help="현재 빌드(레벨/최종 명중)로 미스 0인 몬스터 목록 출력 후 종료")
+    parser.add_argument("--hittable-sort", type=str, default="level", choices=["level", "evasion"], help="--hittable 정렬 기준")
+    parser.add_argument("--level-sweep", type=int, default=None, metavar="MAX_LEVEL", help="레벨 1..MAX_LEVEL x 전체 몬스터 마진 표 계산 후 종료 (몬스터별 미스 0 시작 레벨 출력)")
+    parser.add_argument("--sweep-out", type=str, default=None, help="--level-sweep 결과 저장 (.csv 또는 .npz)")
+    parser.add_argument("--ap-stat", type=str, default=None, choices=["str", "dex", "int", "luk"], help="--level-sweep에서 레벨당 AP 5를 이 스탯에 투자한다고 가정 (현재 --level 기준)")
+    parser.add_argument("--matrix", type=str, default=None, metavar="ROSTER", help="빌드 JSONL(--export 형식, 선택 키 name=행 이름) 로스터 x 몬스터 마진 표 출력 후 종료. '-'면 stdin")
+    parser.add_argument("--matrix-monster", action="append", default=[], help="--matrix 열 몬스터 id (여러 번 가능, 없으면 전체)")
+    parser.add_argument("--matrix-out", type=str, default=None, help="--matrix 결과 저장 (.csv 또는 .npz)")
+    parser.add_argument("--gear-cost", type=str, default=None, help="아이템 비용 JSON 파일({\"item_id\": 비용}). 없으면 스탯 합을 비용으로 사용")
+
+    parser.add_argument("--catalog-db", type=str, default=None, help="SQLite 카탈로그(python -m accuracy_cal.catalog_db import) 또는 mmap 스냅샷(python -m accuracy_cal.catalog_mmap build) 사용. 기본: ACCURACY_CAL_CATALOG_DB 또는 data/*.json")
+    parser.add_argument("--timings", action="store_true", help="import / 카탈로그 로드 / 계산 시간 출력(stderr)")
     
     ##### End arguments section #####
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    timings = _Timings(enabled=args.timings)
+    try:
+        _run(args, _Catalogs(timings, args.catalog_db), timings)
+    finally:
+        if timings.enabled:
+            timings.report()
+
+
+def _run_batch(args: argparse.Namespace, cat: _Catalogs, timings: _Timings) -> None:
+    """--batch: 카탈로그는 한 번만 로드, 입력을 한 줄씩 읽고 결과를 한 줄씩 씀 (메모리는 입력 크기와 무관)"""
+    with timings.measure("import"):
+        from .build_eval import encode_result, iter_jsonl_results
+    src = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+    dst = sys.stdout if args.batch_out is None else open(args.batch_out, "w", encoding="utf-8")
+    if args.workers == 1:
+        compiler = LoadoutCompiler(cat)
+        results = ((row["ok"], encode_result(row)) for row in iter_jsonl_results(src, compiler, cat.monsters))
+    else:
+        # 워커 프로세스마다 카탈로그 로드 (이 프로세스의 cat은 쓰지 않음), 출력 순서는 입력 순서 그대로
+        with timings.measure("import"):
+            from .parallel import iter_results_parallel
+        results = iter_results_parallel(src, args.workers or None, encoded=True, catalog_db=args.catalog_db)
+    total = failed = 0
+    try:
+        for ok, text in results:
+            dst.write(text + "\n")
+            total += 1
+            failed += not ok
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+        else:
+            dst.flush()
+    print(f"[BATCH] {total} records, {failed} errors", file=sys.stderr)
+
+
+def _run_matrix(args: argparse.Namespace, cat: _Catalogs, timings: _Timings) -> None:
+    """--matrix: 로스터의 빌드마다 명중을 한 번만 계산하고 몬스터 전체와의 마진을 한 번에 (잘못된 줄은 건너뛰고 stderr로)"""
+    with timings.measure("import"):
+        from .build_eval import RecordError, character_from_record, loadout_from_record
+        from .loadout import LoadoutError
+        from .matrix import hit_matrix
+    monsters = cat.monsters
+    if args.matrix_monster:
+        unknown = [mid for mid in args.matrix_monster if mid not in monsters]
+        if unknown:
+            raise SystemExit(f"unknown monster ids: {unknown}")
+        monsters = {mid: monsters[mid] for mid in args.matrix_monster}
+
+    compiler = LoadoutCompiler(cat)
+    roster = []
+    src = sys.stdin if args.matrix == "-" else open(args.matrix, encoding="utf-8")
+    try:
+        for line_no, line in enumerate(src, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise RecordError("record must be a JSON object")
+                ch = character_from_record(record)
+                bonus = loadout_from_record(record, compiler).bonus
+            except (json.JSONDecodeError, RecordError, LoadoutError) as e:
+                print(f"[MATRIX] line {line_no}: {e}", file=sys.stderr)
+                continue
+            roster.append((str(record.get("name", f"line{line_no}")), ch, bonus))
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+    m = hit_matrix(roster, monsters)
+    print(f"[MATRIX] {len(m.labels)} builds x {len(m.monster_ids)} monsters (칸: 마진, +는 미스 0)")
+    width = max([len(label) for label in m.labels] + [5])
+    print(" " * width + "  " + "".join(f"{mid[:10]:>11}" for mid in m.monster_ids) + "  미스0")
+    for label, row, ok in zip(m.labels, m.margin.tolist(), m.is_sufficient.sum(axis=1).tolist()):
+        print(f"{label:<{width}}  " + "".join(f"{v:>+11d}" for v in row) + f"  {ok}/{len(row)}")
+    if args.matrix_out is not None:
+        m.write(Path(args.matrix_out))
+        print(f"[MATRIX] saved: {args.matrix_out}")
+
+
+def _run(args: argparse.Namespace, cat: _Catalogs, timings: _Timings) -> None:
+
+    if args.batch is not None:
+        _run_batch(args, cat, timings)
+        return
+
+    if args.matrix is not None:
+        _run_matrix(args, cat, timings)
+        return
 
-    args = parser.parse_args()
-    
     if args.import_path is not None:
         build = import_build_json(args.import_path)
 
@@ -152,73 +344,69 @@ def main() -> None:
         args.doping = list(build.get("doping", []))
 
 
-    monsters = load_monsters()
-    
     if args.list_monsters:
         print("[MONSTERS]")
-        for mid, m in monsters.items():
+        for mid, m in cat.monsters.items():
             print(f"- {mid}: {m.name} (Lv{m.level}, EVA{m.evasion})")
         return
 
     if args.find_monster is not None:
-        key = args.find_monster.strip().lower()
         print(f"[MONSTER SEARCH] keyword='{args.find_monster}'")
-        found = False
-        for mid, m in monsters.items():
-            if key in m.name.lower():
-                print(f"- {mid}: {m.name} (Lv{m.level}, EVA{m.evasion})")
-                found = True
-        if not found:
+        hits = cat.monster_search.search(args.find_monster, limit=None)
+        _print_similar_note(hits)
+        for h in hits:
+            m = cat.monsters[h.key]
+            print(f"- {h.key}: {m.name} (Lv{m.level}, EVA{m.evasion})")
+        if not hits:
             print("(no matches)")
         return
     
-    buff_catalog = load_effect_catalog("buff_skills.json")
-    doping_catalog = load_effect_catalog("doping.json")
-    
-    named_buff = load_named_effect_catalog("buff_skills.json")
-    named_doping = load_named_effect_catalog("doping.json")
-    
-    items = load_items()
-    
     if args.list_items_all:
         print("[ITEMS ALL]")
-        for it in items.values():
+        for it in cat.items.values():
             print(f"- {it.item_id}: {it.name} (slot={it.slot.value})  |  {format_effect(it.effect)}")
         return
 
     if args.find_item is not None:
-        key = args.find_item.strip().lower()
         print(f"[ITEM SEARCH] keyword='{args.find_item}'")
-        found = False
-        for it in items.values():
-            if key in it.name.lower():
-                print(f"- {it.item_id}: {it.name} (slot={it.slot.value})  |  {format_effect(it.effect)}")
-                found = True
-        if not found:
+        hits = cat.item_search.search(args.find_item, limit=None)
+        _print_similar_note(hits)
+        for h in hits:
+            it = cat.items[h.key]
+            print(f"- {it.item_id}: {it.name} (slot={it.slot.value})  |  {format_effect(it.effect)}")
+        if not hits:
             print("(no matches)")
         return
 
     
     if args.list_items is not None:
         slot = EquipSlot(args.list_items)
-        print(f"[ITEMS] slot={slot.value}")
-        for item in items.values():
-            if item.slot == slot:
-                e = item.effect
-                s = e.stats
-                print(f"- {item.item_id}: {item.name} | +ACC {e.acc} | STR {s.str} DEX {s.dex} INT {s.int} LUK {s.luk}")
+        items = cat.items_by_slot(slot)
+        if args.frontier is None:
+            print(f"[ITEMS] slot={slot.value}")
+        else:
+            with timings.measure("import"):
+                from .frontier import ACC_DIMS, job_kind, pareto_frontier
+            total = len(items)
+            items = pareto_frontier(items, args.frontier)
+            dims = "/".join(d.upper() for d in ACC_DIMS[job_kind(args.frontier)])
+            print(f"[ITEMS] slot={slot.value} frontier={args.frontier} ({dims}) {len(items)}/{total}")
+        for item in items:
+            e = item.effect
+            s = e.stats
+            print(f"- {item.item_id}: {item.name} | +ACC {e.acc} | STR {s.str} DEX {s.dex} INT {s.int} LUK {s.luk}")
         return
     
     if args.list_buffs:
         print("[BUFF SKILLS]")
-        for bid, (name, e) in named_buff.items():
-            print(f"- {bid}: {name}  |  {format_effect(e)}")
+        for bid, spec in cat.buffs.items():
+            print(f"- {bid}: {spec.name}  |  {format_effect(spec.effect)}")
         return
 
     if args.list_doping:
         print("[DOPING]")
-        for did, (name, e) in named_doping.items():
-            print(f"- {did}: {name}  |  {format_effect(e)}")
+        for did, spec in cat.doping.items():
+            print(f"- {did}: {spec.name}  |  {format_effect(spec.effect)}")
         return
 
     mw = args.mw
@@ -254,16 +442,23 @@ def main() -> None:
         print(f"[EXPORTED] {args.export}")
 
 
-    equipment = EquipmentState(use_overall=False)
-    
-    # --equip-find gloves=작업  (해당 슬롯에서 이름 부분검색)
+    # --equip / --buff / --doping: 한 번만 해석 (잘못된 스펙은 전부 모아서 LoadoutError)
+    loadout = LoadoutCompiler(cat).compile(args.equip, args.buff, args.doping)
+    equipment, buffs = loadout.states()
+    equip_slots = {slot for slot, _ in loadout.equip}
+
+    # --equip-find gloves=작업  (해당 슬롯에서 이름 부분검색, 같은 슬롯을 --equip로도 주면 --equip 우선)
     for spec in args.equip_find:
         slot_s, keyword = spec.split("=", 1)
         slot = EquipSlot(slot_s)
-        key = keyword.strip().lower()
 
-        candidates = [it for it in items.values() if it.slot == slot and key in it.name.lower()]
+        # 이름 그대로 일치하면 그것만, 아니면 부분/초성 일치 후보 (오타 허용 결과는 제안만 하고 자동 장착 안 함)
+        hits = cat.item_search.search(keyword, limit=None, slot=slot)
+        exact = [h for h in hits if h.match == "exact"]
+        candidates = [cat.items[h.key] for h in (exact or [h for h in hits if h.match != "fuzzy"])]
         if len(candidates) == 0:
+            for h in hits:
+                print(f"[equip-find] 혹시: {h.key} ({h.name})")
             raise ValueError(f"[equip-find] 검색 결과 없음: slot={slot.value}, keyword='{keyword}'")
         if len(candidates) > 1:
             print(f"[equip-find] 검색 결과가 여러 개입니다: slot={slot.value}, keyword='{keyword}'")
@@ -272,109 +467,83 @@ def main() -> None:
             raise ValueError("[equip-find] 하나로 좁혀주세요(키워드 구체화)")
 
         chosen = candidates[0]
-        equipment.equipped[slot] = chosen
+        if slot not in equip_slots:
+            equipment.equipped[slot] = chosen
         print(f"[equip-find] equipped {slot.value} = {chosen.item_id} ({chosen.name})")
 
-    
-    # ✅ (추가) --equip 처리 블록은 여기!
-    for spec in args.equip:
-        slot_s, rhs = spec.split("=", 1)
-        slot = EquipSlot(slot_s)
-
-        # 1) 커스텀: custom:acc=7,dex=3
-        if rhs.startswith("custom:"):
-            kv = parse_kv_int_list(rhs[len("custom:"):])
-            item = make_custom_item(slot, kv)
 
-        # 2) 프리셋 아이템 id: work_gloves
-        else:
-            item = items[rhs]
-            if item.slot != slot:
-                raise ValueError(
-                    f"아이템 슬롯 불일치: {item.name}는 {item.slot.value}인데 {slot.value}에 장착 시도"
-                )
-
-        equipment.equipped[slot] = item
-    
-    buffs = BuffState()
+    if args.min_stat is not None:
+        with timings.measure("import"):
+            from .solver import min_stat_for_monsters
+        monsters = cat.monsters
+        reqs = min_stat_for_monsters(ch, equipment, buffs, monsters, stat=args.min_stat, ratio=args.mix_ratio)
+        print(f"[MIN STAT] stat={args.min_stat}" + (f" ratio={args.mix_ratio}" if args.min_stat == "mixed" else ""))
+        for mid, r in reqs.items():
+            m = monsters[mid]
+            head = f"- {mid}: {m.name} (Lv{m.level}, EVA{m.evasion}) 필요 {r.acc_required}"
+            if not r.reachable:
+                print(f"{head}  |  불가")
+                continue
+            bs = r.base_stats
+            print(f"{head}  |  STR {bs.str} DEX {bs.dex} INT {bs.int} LUK {bs.luk} (+{r.additional} AP, acc_total {r.acc_total})")
+        return
 
-    # 버프 스킬 적용: 프리셋 id 또는 custom:
-    for i, bid in enumerate(args.buff):
-        if bid.startswith("custom:"):
-            e = parse_custom_effect_from_rhs(bid)
-            buffs.skill_buffs[f"custom_buff_{i}"] = EffectSpec(name="(커스텀 버프)", effect=e, acc_group=None)
-        else:
-            buffs.skill_buffs[bid] = named_buff[bid]
+    if args.optimize_gear:
+        with timings.measure("import"):
+            from .optimizer import optimize_gear
+        mob = cat.monsters[args.monster]
+        cost = None
+        if args.gear_cost is not None:
+            cost = {k: float(v) for k, v in json.loads(Path(args.gear_cost).read_text(encoding="utf-8")).items()}
+
+        try:
+            loadouts = optimize_gear(ch, cat.items, buffs, mob, k=args.top_k, cost=cost, fixed=equipment)
+        except ValueError as e:
+            # --equip로 한벌옷과 상의/하의를 같이 고정한 경우
+            raise SystemExit(f"[OPTIMIZE GEAR] {e}")
+        print(f"[OPTIMIZE GEAR] monster={mob.name} (Lv{mob.level}, EVA{mob.evasion})")
+        if not loadouts:
+            print("(조합 없음: 장비만으로는 미스 0 불가)")
+        for rank, g in enumerate(loadouts, 1):
+            kind = "한벌옷" if g.use_overall else "상의/하의"
+            print(f"#{rank} cost={g.cost:g}  acc_total={g.acc_total} (필요 {g.acc_required}, margin {g.margin:+d})  [{kind}]")
+            for slot, it in g.items:
+                print(f"  - {slot.value}: {it.item_id} ({it.name})  |  {format_effect(it.effect)}")
+        return
 
-    # 도핑 적용: 프리셋 id 또는 custom:
-    for i, did in enumerate(args.doping):
-        if did.startswith("custom:"):
-            e = parse_custom_effect_from_rhs(did)
-            buffs.doping[f"custom_doping_{i}"] = EffectSpec(name="(커스텀 도핑)", effect=e, acc_group=None)
-        else:
-            buffs.doping[did] = named_doping[did]
+    if args.level_sweep is not None:
+        with timings.measure("import"):
+            from .level_sweep import sweep_levels
+        monsters = cat.monsters
+        sweep = sweep_levels(ch, equipment, buffs, monsters, max_level=args.level_sweep, ap_stat=args.ap_stat)
+        print(f"[LEVEL SWEEP] levels=1..{args.level_sweep}" + (f" ap_stat={args.ap_stat}" if args.ap_stat else ""))
+        for mid, first in zip(sweep.monster_ids, sweep.first_zero_miss_level.tolist()):
+            m = monsters[mid]
+            print(f"- {mid}: {m.name} (Lv{m.level}, EVA{m.evasion})  |  " + (f"Lv{first}부터 미스 0" if first > 0 else "불가"))
+        if args.sweep_out is not None:
+            sweep.write(Path(args.sweep_out))
+            print(f"[LEVEL SWEEP] saved: {args.sweep_out}")
+        return
 
     if args.show_loadout:
         print("[LOADOUT]")
 
-        # 1) 장비 출력 + 합계
-        equip_total = Effect()
-        if args.equip:
+        # 1) 장비 출력 (컴파일 결과 재사용)
+        if loadout.equip:
             print("Equipments:")
-            for spec in args.equip:
-                slot_s, rhs = spec.split("=", 1)
-                slot = EquipSlot(slot_s)
-
-                if rhs.startswith("custom:"):
-                    e = parse_custom_effect_from_rhs(rhs)
-                    name = f"(커스텀 장비)"
-                else:
-                    it = items[rhs]
-                    e = it.effect
-                    name = it.name
-
-                equip_total = equip_total + e
-                print(f"- {slot.value}: {name}  |  {format_effect(e)}")
+            for slot, it in loadout.equip:
+                print(f"- {slot.value}: {it.name}  |  {format_effect(it.effect)}")
         else:
             print("Equipments: (없음)")
 
-        # 2) 버프 스킬 출력 + 합계
-        buff_total = Effect()
-        if args.buff:
-            print("Buff Skills:")
-            for bid in args.buff:
-                if bid.startswith("custom:"):
-                    e = parse_custom_effect_from_rhs(bid)
-                    name = "(커스텀 버프)"
-                else:
-                    spec = named_buff[bid]
-                    name = spec.name
-                    e = spec.effect
-
-
-                buff_total = buff_total + e
-                print(f"- {name}  |  {format_effect(e)}")
-        else:
-            print("Buff Skills: (없음)")
-
-        # 3) 도핑 출력 + 합계
-        doping_total = Effect()
-        if args.doping:
-            print("Doping:")
-            for did in args.doping:
-                if did.startswith("custom:"):
-                    e = parse_custom_effect_from_rhs(did)
-                    name = "(커스텀 도핑)"
-                else:
-                    spec = named_doping[did]
-                    name = spec.name
-                    e = spec.effect
-
-
-                doping_total = doping_total + e
-                print(f"- {name}  |  {format_effect(e)}")
-        else:
-            print("Doping: (없음)")
+        # 2) 버프 스킬 / 3) 도핑 출력
+        for title, entries in (("Buff Skills", loadout.buffs), ("Doping", loadout.doping)):
+            if entries:
+                print(f"{title}:")
+                for _, spec in entries:
+                    print(f"- {spec.name}  |  {format_effect(spec.effect)}")
+            else:
+                print(f"{title}: (없음)")
 
         # 4) 합계 요약 (⚠️ 버프/도핑은 중첩 규칙을 BuffState.total_effect()로 반영)
         buffs_effect = buffs.total_effect()          # 스탯 합산 + ACC 그룹 max 규칙 적용 결과
@@ -388,9 +557,20 @@ def main() -> None:
         print(f"- Bonus total : {format_effect(total_bonus)}")
         print()
         
+    with timings.measure("import"):
+        from .engine import derive_character_result, check_hit
     result = derive_character_result(ch, equipment, buffs)
 
-    mob = monsters[args.monster]
+    if args.hittable:
+        print(f"[HITTABLE] level={ch.level} acc_total={result.acc_total}")
+        found = cat.monster_index.hittable(ch.level, result.acc_total, sort_by=args.hittable_sort)
+        for mid, m in found:
+            print(f"- {mid}: {m.name} (Lv{m.level}, EVA{m.evasion})")
+        if not found:
+            print("(no matches)")
+        return
+
+    mob = cat.monsters[args.monster]
     hit = check_hit(result.acc_total, ch.level, mob)
 
     print("base_after_mw:", result.base_after_mw)
@@ -1,68 +1,183 @@
 import json
+import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .models import Effect, Item, Monster, Stats, EquipSlot, EffectSpec
 
-DATA_DIR = Path(__file__).resolve().parent / "data"
+# ACCURACY_CAL_DATA_DIR로 다른 카탈로그 디렉터리 사용 가능 (벤치마크용 합성 데이터 등)
+DATA_DIR = Path(os.environ.get("ACCURACY_CAL_DATA_DIR") or Path(__file__).resolve().parent / "data")
+CACHE_DIR_NAME = "__cache__"
+# ACCURACY_CAL_CATALOG_DB를 주면 JSON 대신 SQLite 카탈로그(catalog_db.py) 또는 mmap 스냅샷(catalog_mmap.py) 사용, API/CLI 공통
+CATALOG_DB = os.environ.get("ACCURACY_CAL_CATALOG_DB") or None
 
-def _effect_from_dict(d: dict) -> Effect:
+# 컴파일 캐시 포맷 버전: 행(tuple) 구조가 바뀌면 올려서 예전 pickle을 무시하게 함
+_CACHE_FORMAT = 1
+
+# (종류, JSON 경로) -> ((size, mtime_ns), 카탈로그)
+_memory_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+
+
+def _source_key(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _compiled_path(kind: str, path: Path) -> Path:
+    return path.parent / CACHE_DIR_NAME / f"{path.name}.{kind}.pickle"
+
+
+def _read_compiled(kind: str, path: Path, key: Tuple[int, int]) -> Any:
+    try:
+        with open(_compiled_path(kind, path), "rb") as f:
+            fmt, cached_key, rows = pickle.load(f)
+    except Exception:
+        return None
+    if fmt != _CACHE_FORMAT or cached_key != key:
+        return None
+    return rows
+
+
+def _write_compiled(kind: str, path: Path, key: Tuple[int, int], rows: Any) -> None:
+    target = _compiled_path(kind, path)
+    try:
+        target.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    except OSError:
+        # 읽기 전용 설치 등: 캐시 없이 동작
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((_CACHE_FORMAT, key, rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        # 디스크 부족 등: 쓰다 만 임시 파일은 지우고 캐시 없이 계속
+        Path(tmp).unlink(missing_ok=True)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _load_cached(
+    kind: str,
+    filename: str,
+    compile_rows: Callable[[list], list],
+    build: Callable[[list], Any],
+    rows_kind: Optional[str] = None,
+) -> Any:
+    """
+    JSON 카탈로그 로드 (2단 캐시)
+    - 디스크: data/__cache__/ 아래에 JSON을 평평한 tuple 행으로 컴파일한 pickle
+      (JSON의 크기/mtime이 바뀌면 자동으로 다시 만듦)
+    - 프로세스 내: 같은 파일을 다시 로드하면 만들어둔 dict를 그대로 재사용 (반환값은 공유되므로 수정 금지)
+    """
+    path = DATA_DIR / filename
+    key = _source_key(path)
+    mem_key = (kind, str(path))
+
+    hit = _memory_cache.get(mem_key)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+
+    # rows_kind: 같은 JSON을 같은 행 구조로 쓰는 로더끼리 디스크 캐시 공유
+    rows_kind = rows_kind or kind
+    rows = _read_compiled(rows_kind, path, key)
+    if rows is None:
+        rows = compile_rows(json.loads(path.read_text(encoding="utf-8")))
+        _write_compiled(rows_kind, path, key, rows)
+
+    value = build(rows)
+    _memory_cache[mem_key] = (key, value)
+    return value
+
+
+def clear_cache() -> None:
+    """프로세스 내 카탈로그 캐시 비우기 (디스크 캐시는 mtime으로 관리되므로 그대로 둠)"""
+    _memory_cache.clear()
+
+
+def _effect_row(d: dict) -> Tuple[int, int, int, int, int]:
     s = d.get("stats", {})
-    return Effect(
-        stats=Stats(
-            str=int(s.get("str", 0)),
-            dex=int(s.get("dex", 0)),
-            int=int(s.get("int", 0)),
-            luk=int(s.get("luk", 0)),
-        ),
-        acc=int(d.get("acc", 0)),
+    return (
+        int(s.get("str", 0)),
+        int(s.get("dex", 0)),
+        int(s.get("int", 0)),
+        int(s.get("luk", 0)),
+        int(d.get("acc", 0)),
     )
 
+
+class _EffectInterner:
+    # 같은 수치의 Effect는 하나만 만들어 공유 (카탈로그에는 같은 옵션이 많음)
+    def __init__(self) -> None:
+        self._cache: Dict[Tuple[int, int, int, int, int], Effect] = {}
+
+    def __call__(self, row: Tuple[int, int, int, int, int]) -> Effect:
+        e = self._cache.get(row)
+        if e is None:
+            e = self._cache[row] = Effect(stats=Stats(str=row[0], dex=row[1], int=row[2], luk=row[3]), acc=row[4])
+        return e
+
+
+# compile_*_rows: JSON 목록 -> 평평한 tuple 행 (검증/정규화, 디스크 캐시와 catalog_db/catalog_mmap이 공유)
+# build_*: 행 -> id별 모델 dict
 def load_monsters() -> Dict[str, Monster]:
-    path = DATA_DIR / "monsters.json"
-    rows = json.loads(path.read_text(encoding="utf-8"))
+    return _load_cached("monsters", "monsters.json", compile_monster_rows, build_monsters)
+
+def compile_monster_rows(rows: list) -> List[tuple]:
+    return [(r["id"], r["name"], int(r["level"]), int(r["evasion"]), r.get("image_url")) for r in rows]
+
+def build_monsters(rows: List[tuple]) -> Dict[str, Monster]:
     out: Dict[str, Monster] = {}
-    for r in rows:
-        out[r["id"]] = Monster(
-            name=r["name"],
-            level=int(r["level"]),
-            evasion=int(r["evasion"]),
-            image_url=r.get("image_url"),
-        )
+    for mid, name, level, evasion, image_url in rows:
+        out[mid] = Monster(name=name, level=level, evasion=evasion, image_url=image_url)
     return out
 
 def load_effect_catalog(filename: str) -> Dict[str, Effect]:
-    path = DATA_DIR / filename
-    rows = json.loads(path.read_text(encoding="utf-8"))
+    return _load_cached("effects", filename, compile_named_effect_rows, _build_effects, rows_kind="named_effects")
+
+def _build_effects(rows: List[tuple]) -> Dict[str, Effect]:
+    effect = _EffectInterner()
     out: Dict[str, Effect] = {}
-    for r in rows:
-        out[r["id"]] = _effect_from_dict(r["effect"])
+    for eid, _name, _acc_group, e in rows:
+        out[eid] = effect(e)
     return out
 
 def load_named_effect_catalog(filename: str) -> dict[str, EffectSpec]:
-    path = DATA_DIR / filename
-    rows = json.loads(path.read_text(encoding="utf-8"))
+    return _load_cached("named_effects", filename, compile_named_effect_rows, build_named_effects)
+
+def compile_named_effect_rows(rows: list) -> List[tuple]:
+    return [(r["id"], r["name"], r.get("acc_group"), _effect_row(r["effect"])) for r in rows]
+
+def build_named_effects(rows: List[tuple]) -> dict[str, EffectSpec]:
+    effect = _EffectInterner()
     out: dict[str, EffectSpec] = {}
-    for r in rows:
-        out[r["id"]] = EffectSpec(
-            name=r["name"],
-            acc_group=r.get("acc_group"),
-            effect=_effect_from_dict(r["effect"]),
-        )
+    for eid, name, acc_group, e in rows:
+        out[eid] = EffectSpec(name=name, acc_group=acc_group, effect=effect(e))
     return out
 
 def load_items() -> dict[str, Item]:
-    path = DATA_DIR / "items.json"
-    rows = json.loads(path.read_text(encoding="utf-8"))
+    return _load_cached("items", "items.json", compile_item_rows, build_items)
 
-    out: dict[str, Item] = {}
+def compile_item_rows(rows: list) -> List[tuple]:
+    out = []
     for r in rows:
-        slot = EquipSlot(r["slot"])  # "gloves" -> EquipSlot.GLOVES
-        out[r["id"]] = Item(
-            item_id=r["id"],
-            name=r["name"],
-            slot=slot,
-            effect=_effect_from_dict(r["effect"]),
-            icon_url=r.get("image_url"),
+        EquipSlot(r["slot"])  # 잘못된 슬롯은 컴파일 단계에서 바로 에러
+        out.append((r["id"], r["name"], r["slot"], _effect_row(r["effect"]), r.get("image_url")))
+    return out
+
+def build_items(rows: List[tuple]) -> dict[str, Item]:
+    slots = {s.value: s for s in EquipSlot}  # "gloves" -> EquipSlot.GLOVES
+    effect = _EffectInterner()
+    out: dict[str, Item] = {}
+    for iid, name, slot, e, image_url in rows:
+        out[iid] = Item(
+            item_id=iid,
+            name=name,
+            slot=slots[slot],
+            effect=effect(e),
+            icon_url=image_url,
         )
     return out
@@ -2,17 +2,16 @@ from __future__ import annotations
 
 from math import floor
 
-from .models import BuffState, CharacterInput, DerivedResult, EquipmentState, JobGroup, Stats
+from .models import BuffState, CharacterInput, DerivedResult, EffectAccumulator, EquipmentState, JobGroup, Stats
+from .models import new_stats
 from .models import Monster, HitCheckResult
 
 def apply_maple_warrior(base: Stats, mw_percent: float) -> Stats:
     # 메용: 순스탯에만 % 적용, 소수점 버림
-    return Stats(
-        str=floor(base.str * (1.0 + mw_percent)),
-        dex=floor(base.dex * (1.0 + mw_percent)),
-        int=floor(base.int * (1.0 + mw_percent)),
-        luk=floor(base.luk * (1.0 + mw_percent)),
-    )
+    if mw_percent == 0.0:
+        return base
+    m = 1.0 + mw_percent
+    return new_stats(floor(base.str * m), floor(base.dex * m), floor(base.int * m), floor(base.luk * m))
 
 
 def calc_accuracy_from_stats(job: JobGroup, total_stats: Stats) -> int:
@@ -29,15 +28,15 @@ def derive_character_result(
     equipment: EquipmentState,
     buffs: BuffState,
 ) -> DerivedResult:
-    equip_effect = equipment.iter_effects()
-    buff_effect = buffs.total_effect()
+    # 장비 + 버프/도핑을 누적기 하나에 합산 (중간 Effect 객체 없이)
+    bonus = buffs.accumulate(equipment.accumulate(EffectAccumulator()))
 
     base_after_mw = apply_maple_warrior(ch.base_stats, ch.maple_warrior_percent)
 
-    bonus_stats = equip_effect.stats + buff_effect.stats
+    bonus_stats = bonus.to_stats()
     total_stats = base_after_mw + bonus_stats
 
-    acc_bonus = equip_effect.acc + buff_effect.acc
+    acc_bonus = bonus.acc
     acc_from_stats = calc_accuracy_from_stats(ch.job, total_stats)
     acc_total = acc_from_stats + acc_bonus
 
@@ -0,0 +1,85 @@
+"""
+직업별 x 슬롯별 아이템 파레토 프런티어 (명중 관련 축만 비교)
+
+- 물리(전사/궁수/도적): DEX/LUK/ACC, 마법사: INT/LUK/ACC (calc_accuracy_from_stats 참고)
+- 같은 슬롯의 다른 아이템이 세 축 모두 같거나 크고 하나라도 크면 그 아이템은 지배당함 -> 제외
+- 세 축이 모두 0 이하인 아이템은 빈 슬롯보다 나을 게 없으므로 제외, 벡터가 완전히 같은 아이템은 둘 다 남김
+- 비용은 보지 않음: 비용 최소화 탐색(optimize_gear)에서 쓰면 "지배하는 아이템이 더 비싸지 않다"는 가정이 들어감
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
+
+from .models import EquipSlot, Item, JobGroup
+
+# 직업 종류 -> 명중 관련 축 (Effect.stats의 필드 + "acc")
+ACC_DIMS: Dict[str, Tuple[str, str, str]] = {
+    "physical": ("dex", "luk", "acc"),
+    "mage": ("int", "luk", "acc"),
+}
+
+
+def job_kind(job: Union[JobGroup, str]) -> str:
+    """JobGroup(또는 값 문자열) -> "physical" / "mage" (이미 종류 이름이면 그대로)"""
+    if job in ACC_DIMS:
+        return job
+    return "mage" if JobGroup(job) == JobGroup.MAGE else "physical"
+
+
+def accuracy_vector(item: Item, kind: str) -> Tuple[int, int, int]:
+    e = item.effect
+    s = e.stats
+    if kind == "mage":
+        return (s.int, s.luk, e.acc)
+    return (s.dex, s.luk, e.acc)
+
+
+def pareto_frontier(items: Iterable[Item], job: Union[JobGroup, str]) -> List[Item]:
+    """items(보통 한 슬롯) 중 명중 관련 축에서 지배당하지 않은 아이템, 입력 순서 유지"""
+    kind = job_kind(job)
+    scored = []
+    for pos, it in enumerate(items):
+        v = accuracy_vector(it, kind)
+        if max(v) > 0:
+            scored.append((v, pos, it))
+    # 첫 축 내림차순: 앞에서 남긴 벡터는 첫 축이 항상 같거나 크므로 나머지 두 축만 비교
+    scored.sort(key=lambda t: (-t[0][0], -t[0][1], -t[0][2]))
+    kept_vecs: List[Tuple[int, int, int]] = []
+    kept: List[Tuple[int, Item]] = []
+    for v, pos, it in scored:
+        _, b, c = v
+        if any(k[1] >= b and k[2] >= c and k != v for k in kept_vecs):
+            continue
+        if not kept_vecs or kept_vecs[-1] != v:
+            kept_vecs.append(v)
+        kept.append((pos, it))
+    kept.sort(key=lambda t: t[0])
+    return [it for _, it in kept]
+
+
+class ItemFrontier:
+    """
+    카탈로그 전체의 (직업 종류, 슬롯) -> 프런티어 (카탈로그 로드마다 한 번, CatalogSnapshot.item_frontier)
+    gear 탐색은 items 대신 candidates(job)를 넘기면 후보가 프런티어로 줄어듦
+    """
+
+    def __init__(self, items: Mapping[str, Item]) -> None:
+        by_slot: Dict[EquipSlot, List[Item]] = {}
+        for it in items.values():
+            by_slot.setdefault(it.slot, []).append(it)
+        self.slot_sizes: Dict[EquipSlot, int] = {slot: len(v) for slot, v in by_slot.items()}
+        self._frontier: Dict[Tuple[str, EquipSlot], Tuple[Item, ...]] = {
+            (kind, slot): tuple(pareto_frontier(v, kind)) for kind in ACC_DIMS for slot, v in by_slot.items()
+        }
+
+    def get(self, job: Union[JobGroup, str], slot: EquipSlot) -> Tuple[Item, ...]:
+        return self._frontier.get((job_kind(job), slot), ())
+
+    def candidates(self, job: Union[JobGroup, str]) -> Dict[str, Item]:
+        """해당 직업의 전 슬롯 프런티어를 item_id -> Item으로 (optimize_gear의 items 자리에 그대로)"""
+        kind = job_kind(job)
+        return {it.item_id: it for (k, _), items in self._frontier.items() if k == kind for it in items}
+
+    def __len__(self) -> int:
+        return sum(self.slot_sizes.values())
+
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+
+from . import table_io
+from .batch import JOB_CODES, apply_maple_warrior_batch, calc_accuracy_from_stats_batch, required_accuracy_batch
+from .models import BuffState, CharacterInput, EffectAccumulator, EquipmentState, Monster
+
+# 레벨업마다 받는 AP, 순스탯 최솟값 (레벨을 내릴 때 이 아래로는 안 뺌)
+AP_PER_LEVEL = 5
+MIN_BASE_STAT = 4
+AP_STATS = ("str", "dex", "int", "luk")
+# first_zero_miss_level에서 "1..max_level 안에서는 미스 0 불가"
+NEVER = -1
+
+
+@dataclass(frozen=True)
+class LevelSweep:
+    """
+    빌드 하나의 레벨 x 몬스터 마진 표
+    - levels: (L,) 1..max_level
+    - acc_total: (L,) 레벨별 최종 명중 (ap_stat이 없으면 전부 같은 값)
+    - margin: (M, L) 몬스터 행 x 레벨 열, acc_total - 필요 명중
+    - first_zero_miss_level: (M,) margin >= 0 이 되는 첫 레벨 (없으면 NEVER)
+    """
+    levels: np.ndarray
+    monster_ids: List[str]
+    monster_level: np.ndarray
+    monster_evasion: np.ndarray
+    acc_total: np.ndarray
+    margin: np.ndarray
+    first_zero_miss_level: np.ndarray
+
+    def to_payload(self) -> Dict[str, Any]:
+        """API용 배열 형태 (margin은 monsters 순서의 행, 각 행은 levels 순서)"""
+        return {
+            "levels": {"start": int(self.levels[0]), "stop": int(self.levels[-1])},
+            "monsters": {
+                "ids": self.monster_ids,
+                "level": self.monster_level.tolist(),
+                "evasion": self.monster_evasion.tolist(),
+            },
+            "acc_total": self.acc_total.tolist(),
+            "margin": self.margin.tolist(),
+            "first_zero_miss_level": [None if v == NEVER else v for v in self.first_zero_miss_level.tolist()],
+        }
+
+    def write_csv(self, path: Path) -> None:
+        # 몬스터 한 줄: id, 레벨, EVA, 첫 미스0 레벨(없으면 빈칸), 레벨별 마진...
+        header = [["monster_id", "monster_level", "evasion", "first_zero_miss_level", *self.levels.tolist()]]
+        acc = [["acc_total", "", "", "", *self.acc_total.tolist()]]
+        first = ["" if v == NEVER else v for v in self.first_zero_miss_level.tolist()]
+        rows = (
+            [mid, int(self.monster_level[i]), int(self.monster_evasion[i]), first[i], *self.margin[i].tolist()]
+            for i, mid in enumerate(self.monster_ids)
+        )
+        table_io.write_csv(path, itertools.chain(header, acc, rows))
+
+    def write_npz(self, path: Path) -> None:
+        table_io.write_npz(path, self)
+
+    def write(self, path: Path) -> None:
+        """확장자로 형식 결정 (.csv / .npz)"""
+        table_io.write_table(self, path, "sweep")
+
+
+def sweep_levels(
+    ch: CharacterInput,
+    equipment: EquipmentState,
+    buffs: BuffState,
+    monsters: Mapping[str, Monster],
+    max_level: int = 200,
+    ap_stat: Optional[str] = None,
+    ap_per_level: int = AP_PER_LEVEL,
+) -> LevelSweep:
+    """
+    레벨 1..max_level x 몬스터 전체의 마진을 한 번에 계산
+    ap_stat을 주면 ch.level 기준으로 레벨당 ap_per_level씩 그 순스탯을 더함/뺌 (MIN_BASE_STAT 아래로는 안 내려감)
+    -> 레벨업하면서 DEX(마법사는 INT/LUK)를 올리는 경우의 레벨별 명중
+    """
+    if max_level < 1:
+        raise ValueError(f"max_level must be >= 1: {max_level}")
+    if ap_stat is not None and ap_stat not in AP_STATS:
+        raise ValueError(f"ap_stat must be one of {AP_STATS}: {ap_stat}")
+
+    levels = np.arange(1, max_level + 1, dtype=np.int64)
+    s = ch.base_stats
+    base = {"str": s.str, "dex": s.dex, "int": s.int, "luk": s.luk}
+    cols = {k: np.full(max_level, v, dtype=np.int64) for k, v in base.items()}
+    if ap_stat is not None:
+        grown = base[ap_stat] + (levels - ch.level) * ap_per_level
+        cols[ap_stat] = np.maximum(grown, min(MIN_BASE_STAT, base[ap_stat]))
+
+    # 장비/버프/도핑 합계는 레벨과 무관 -> 한 번만
+    bonus = buffs.accumulate(equipment.accumulate(EffectAccumulator()))
+    mw = ch.maple_warrior_percent
+    dex = apply_maple_warrior_batch(cols["dex"], mw) + bonus.dex
+    int_ = apply_maple_warrior_batch(cols["int"], mw) + bonus.int
+    luk = apply_maple_warrior_batch(cols["luk"], mw) + bonus.luk
+    acc_total = calc_accuracy_from_stats_batch(JOB_CODES[ch.job], dex, int_, luk) + bonus.acc
+
+    ids = list(monsters)
+    mob_level = np.fromiter((monsters[m].level for m in ids), dtype=np.int64, count=len(ids))
+    mob_evasion = np.fromiter((monsters[m].evasion for m in ids), dtype=np.int64, count=len(ids))
+    # (M, 1) x (1, L) 브로드캐스트
+    required = required_accuracy_batch(levels[None, :], mob_level[:, None], mob_evasion[:, None])
+    margin = acc_total[None, :] - required
+
+    ok = margin >= 0
+    first = np.where(ok.any(axis=1), levels[ok.argmax(axis=1)], NEVER)
+
+    return LevelSweep(
+        levels=levels,
+        monster_ids=ids,
+        monster_level=mob_level,
+        monster_evasion=mob_evasion,
+        acc_total=acc_total,
+        margin=margin,
+        first_zero_miss_level=first,
+    )
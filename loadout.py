@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from .models import BuffState, Effect, EffectAccumulator, EffectSpec, EquipmentState, EquipSlot, Item, Stats
+
+# 스펙 문자열 형식
+#   장비: "slot=item_id" 또는 "slot=custom:acc=7,dex=3"
+#   버프/도핑: "id" 또는 "custom:acc=10,dex=3"
+CUSTOM_PREFIX = "custom:"
+CUSTOM_KEYS = ("str", "dex", "int", "luk", "acc")
+
+# 인턴 캐시 상한 (넘으면 비우고 다시 채움, 임의 커스텀 스펙으로 메모리가 계속 늘지 않도록)
+MAX_INTERNED = 4096
+
+_KIND_LABEL = {"buff": "버프", "doping": "도핑"}
+
+
+@dataclass(frozen=True)
+class SpecError:
+    kind: str      # "equip" / "buff" / "doping"
+    index: int     # 입력 목록에서의 위치
+    spec: str
+    code: str      # "syntax" / "invalid_key" / "invalid_value" / "unknown_slot" / "unknown_id" / "slot_mismatch"
+    message: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "index": self.index, "spec": self.spec, "code": self.code, "message": self.message}
+
+
+class LoadoutError(ValueError):
+    """스펙 하나 이상이 잘못됨 (errors에 전부 담김)"""
+
+    def __init__(self, errors: Sequence[SpecError]) -> None:
+        self.errors: Tuple[SpecError, ...] = tuple(errors)
+        super().__init__("; ".join(f"{e.kind}[{e.index}] {e.spec!r}: {e.message}" for e in self.errors))
+
+
+class _SpecProblem(Exception):
+    # 스펙 하나 해석 실패 (위치 정보 없이 code/message만), 인턴 캐시에도 그대로 저장
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def parse_custom_effect(body: str) -> Effect:
+    """ "acc=7,dex=3" -> Effect (키는 str/dex/int/luk/acc, 대소문자 무시) """
+    values = dict.fromkeys(CUSTOM_KEYS, 0)
+    for part in body.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" not in part:
+            raise _SpecProblem("syntax", f"커스텀 옵션 형식 오류: '{part}' (key=value 필요)")
+        k, v = part.split("=", 1)
+        k = k.strip().lower()
+        if k not in values:
+            raise _SpecProblem("invalid_key", f"허용되지 않은 키: '{k}' (허용: {','.join(CUSTOM_KEYS)})")
+        try:
+            values[k] = int(v.strip())
+        except ValueError:
+            raise _SpecProblem("invalid_value", f"정수가 아닌 값: '{part}'") from None
+    return Effect(stats=Stats(values["str"], values["dex"], values["int"], values["luk"]), acc=values["acc"])
+
+
+def custom_item(slot: EquipSlot, effect: Effect) -> Item:
+    return Item(item_id=f"custom_{slot.value}", name=f"(커스텀 {slot.value})", slot=slot, effect=effect, icon_url=None)
+
+
+def custom_effect_spec(kind: str, effect: Effect) -> EffectSpec:
+    return EffectSpec(name=f"(커스텀 {_KIND_LABEL[kind]})", effect=effect, acc_group=None)
+
+
+@dataclass(frozen=True)
+class CompiledLoadout:
+    """
+    해석이 끝난 장비/버프/도핑 목록 (불변, 같은 입력이면 같은 객체를 재사용)
+    - equip: 입력 순서대로 (slot, Item), 같은 슬롯이 여러 번이면 뒤의 것이 적용됨
+    - buffs/doping: 입력 순서대로 (BuffState 키, EffectSpec), 같은 프리셋 id는 하나로 합쳐짐
+    - bonus: use_overall=False 기준 장비 + 버프/도핑 보너스 합계
+    """
+    equip: Tuple[Tuple[EquipSlot, Item], ...]
+    buffs: Tuple[Tuple[str, EffectSpec], ...]
+    doping: Tuple[Tuple[str, EffectSpec], ...]
+    bonus: Effect
+
+    def equipment_state(self, use_overall: bool = False) -> EquipmentState:
+        # 호출마다 새 상태 (EquipmentState는 가변)
+        return _equipment_state(self.equip, use_overall)
+
+    def buff_state(self) -> BuffState:
+        return BuffState(skill_buffs=dict(self.buffs), doping=dict(self.doping))
+
+    def states(self, use_overall: bool = False) -> Tuple[EquipmentState, BuffState]:
+        return self.equipment_state(use_overall), self.buff_state()
+
+
+def _equipment_state(equip: Sequence[Tuple[EquipSlot, Item]], use_overall: bool) -> EquipmentState:
+    equipment = EquipmentState(use_overall=use_overall)
+    for slot, item in equip:
+        equipment.equipped[slot] = item
+    return equipment
+
+
+# 인턴 캐시 값: 해석 결과 또는 실패 원인
+_Resolved = Union[Item, EffectSpec, _SpecProblem]
+
+
+class LoadoutCompiler:
+    """
+    스펙 문자열 목록 -> CompiledLoadout
+    catalog: items/buffs/doping 속성을 가진 객체 (CatalogSnapshot, cli의 지연 로드 카탈로그 등),
+             프리셋 id를 처음 해석할 때 해당 속성만 읽음
+    스펙 문자열 단위와 목록 전체 단위로 결과를 인턴 -> 같은 스펙은 한 번만 파싱
+    """
+
+    def __init__(self, catalog: Any) -> None:
+        self._catalog = catalog
+        self._specs: Dict[Tuple[str, str], _Resolved] = {}
+        self._loadouts: Dict[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]], CompiledLoadout] = {}
+
+    def compile(self, equip: Sequence[str] = (), buff: Sequence[str] = (), doping: Sequence[str] = ()) -> CompiledLoadout:
+        """잘못된 스펙이 있으면 전부 모아서 LoadoutError"""
+        key = (tuple(equip), tuple(buff), tuple(doping))
+        hit = self._loadouts.get(key)
+        if hit is not None:
+            return hit
+
+        errors: List[SpecError] = []
+        equip_out: List[Tuple[EquipSlot, Item]] = []
+        for i, spec in enumerate(key[0]):
+            r = self._resolve("equip", spec)
+            if isinstance(r, _SpecProblem):
+                errors.append(SpecError("equip", i, spec, r.code, r.message))
+            else:
+                equip_out.append((r.slot, r))
+
+        effect_out: Dict[str, List[Tuple[str, EffectSpec]]] = {"buff": [], "doping": []}
+        for kind, specs in (("buff", key[1]), ("doping", key[2])):
+            for i, spec in enumerate(specs):
+                r = self._resolve(kind, spec)
+                if isinstance(r, _SpecProblem):
+                    errors.append(SpecError(kind, i, spec, r.code, r.message))
+                else:
+                    # 커스텀은 위치별로 따로, 프리셋은 id로 (같은 id 중복 시 하나만 적용)
+                    state_key = f"custom_{kind}_{i}" if spec.startswith(CUSTOM_PREFIX) else spec
+                    effect_out[kind].append((state_key, r))
+
+        if errors:
+            raise LoadoutError(errors)
+
+        bonus = EffectAccumulator()
+        _equipment_state(equip_out, use_overall=False).accumulate(bonus)
+        BuffState(skill_buffs=dict(effect_out["buff"]), doping=dict(effect_out["doping"])).accumulate(bonus)
+        compiled = CompiledLoadout(
+            equip=tuple(equip_out),
+            buffs=tuple(effect_out["buff"]),
+            doping=tuple(effect_out["doping"]),
+            bonus=bonus.to_effect(),
+        )
+
+        if len(self._loadouts) >= MAX_INTERNED:
+            self._loadouts.clear()
+        self._loadouts[key] = compiled
+        return compiled
+
+    def _resolve(self, kind: str, spec: str) -> _Resolved:
+        cache_key = (kind, spec)
+        hit = self._specs.get(cache_key)
+        if hit is not None:
+            return hit
+        try:
+            r: _Resolved = self._resolve_equip(spec) if kind == "equip" else self._resolve_effect(kind, spec)
+        except _SpecProblem as e:
+            r = e.with_traceback(None)  # 캐시에 남기므로 프레임 참조는 끊음
+        if len(self._specs) >= MAX_INTERNED:
+            self._specs.clear()
+        self._specs[cache_key] = r
+        return r
+
+    def _resolve_equip(self, spec: str) -> Item:
+        if "=" not in spec:
+            raise _SpecProblem("syntax", f"장비 형식 오류: '{spec}' (slot=item_id 또는 slot=custom:... 필요)")
+        slot_s, rhs = spec.split("=", 1)
+        try:
+            slot = EquipSlot(slot_s.strip())
+        except ValueError:
+            raise _SpecProblem("unknown_slot", f"알 수 없는 슬롯: '{slot_s}'") from None
+
+        if rhs.startswith(CUSTOM_PREFIX):
+            return custom_item(slot, parse_custom_effect(rhs[len(CUSTOM_PREFIX):]))
+
+        item = self._catalog.items.get(rhs)
+        if item is None:
+            raise _SpecProblem("unknown_id", f"알 수 없는 아이템 id: '{rhs}'")
+        if item.slot != slot:
+            raise _SpecProblem(
+                "slot_mismatch",
+                f"아이템 슬롯 불일치: {item.name}는 {item.slot.value}인데 {slot.value}에 장착 시도",
+            )
+        return item
+
+    def _resolve_effect(self, kind: str, spec: str) -> EffectSpec:
+        if spec.startswith(CUSTOM_PREFIX):
+            return custom_effect_spec(kind, parse_custom_effect(spec[len(CUSTOM_PREFIX):]))
+        catalog = self._catalog.buffs if kind == "buff" else self._catalog.doping
+        es = catalog.get(spec)
+        if es is None:
+            raise _SpecProblem("unknown_id", f"알 수 없는 {_KIND_LABEL[kind]} id: '{spec}'")
+        return es
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from . import table_io
+from .batch import apply_maple_warrior_batch, calc_accuracy_from_stats_batch, job_codes, required_accuracy_batch
+from .models import CharacterInput, Effect, Monster
+
+# 로스터 한 줄: (행 이름, 캐릭터, 장비 + 버프/도핑 보너스 합계 = CompiledLoadout.bonus)
+RosterEntry = Tuple[str, CharacterInput, Effect]
+
+
+@dataclass(frozen=True)
+class HitMatrix:
+    """
+    로스터(빌드 여러 개) x 몬스터 마진 표
+    - labels / level / acc_total: (R,) 빌드 행
+    - monster_ids / monster_level / monster_evasion: (M,) 몬스터 열
+    - margin: (R, M) acc_total - 필요 명중 (>= 0 이면 미스 0)
+    """
+    labels: List[str]
+    level: np.ndarray
+    acc_total: np.ndarray
+    monster_ids: List[str]
+    monster_level: np.ndarray
+    monster_evasion: np.ndarray
+    margin: np.ndarray
+
+    @property
+    def is_sufficient(self) -> np.ndarray:
+        return self.margin >= 0
+
+    def to_payload(self) -> Dict[str, Any]:
+        """API용 배열 형태 (payloads.encode_matrix와 같은 구조)"""
+        return {
+            "rows": {"labels": self.labels, "level": self.level.tolist(), "acc_total": self.acc_total.tolist()},
+            "monsters": {
+                "ids": self.monster_ids,
+                "level": self.monster_level.tolist(),
+                "evasion": self.monster_evasion.tolist(),
+            },
+            "margin": self.margin.tolist(),
+        }
+
+    def write_csv(self, path: Path) -> None:
+        # 빌드 한 줄: 이름, 레벨, 최종 명중, 몬스터별 마진...
+        header = [["label", "level", "acc_total", *self.monster_ids]]
+        rows = (
+            [label, int(self.level[i]), int(self.acc_total[i]), *self.margin[i].tolist()]
+            for i, label in enumerate(self.labels)
+        )
+        table_io.write_csv(path, itertools.chain(header, rows))
+
+    def write_npz(self, path: Path) -> None:
+        table_io.write_npz(path, self)
+
+    def write(self, path: Path) -> None:
+        """확장자로 형식 결정 (.csv / .npz)"""
+        table_io.write_table(self, path, "matrix")
+
+
+def hit_matrix(roster: Sequence[RosterEntry], monsters: Mapping[str, Monster]) -> HitMatrix:
+    """
+    빌드마다 최종 명중을 한 번만 계산하고 (R, 1) x (1, M) 브로드캐스트로 check_hit 마진 전체를 한 번에
+    monsters의 순서가 열 순서
+    """
+    labels = [label for label, _, _ in roster]
+    chars = [ch for _, ch, _ in roster]
+    bonus = [b for _, _, b in roster]
+    r = len(roster)
+
+    def col(values) -> np.ndarray:
+        return np.fromiter(values, dtype=np.int64, count=r)
+
+    level = col(ch.level for ch in chars)
+    mw = np.fromiter((ch.maple_warrior_percent for ch in chars), dtype=np.float64, count=r)
+    # STR은 명중 계산에 쓰이지 않으므로 생략 (batch.derive_character_results_batch와 같음)
+    dex = apply_maple_warrior_batch(col(ch.base_stats.dex for ch in chars), mw) + col(b.stats.dex for b in bonus)
+    int_ = apply_maple_warrior_batch(col(ch.base_stats.int for ch in chars), mw) + col(b.stats.int for b in bonus)
+    luk = apply_maple_warrior_batch(col(ch.base_stats.luk for ch in chars), mw) + col(b.stats.luk for b in bonus)
+    acc_total = calc_accuracy_from_stats_batch(job_codes(ch.job for ch in chars), dex, int_, luk) + col(b.acc for b in bonus)
+
+    ids = list(monsters)
+    mob_level = np.fromiter((monsters[m].level for m in ids), dtype=np.int64, count=len(ids))
+    mob_evasion = np.fromiter((monsters[m].evasion for m in ids), dtype=np.int64, count=len(ids))
+    required = required_accuracy_batch(level[:, None], mob_level[None, :], mob_evasion[None, :])
+
+    return HitMatrix(
+        labels=labels,
+        level=level,
+        acc_total=acc_total,
+        monster_ids=ids,
+        monster_level=mob_level,
+        monster_evasion=mob_evasion,
+        margin=acc_total[:, None] - required,
+    )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from .models import CharacterInput, DerivedResult, HitCheckResult
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    크기 제한(LRU) + 만료 시간(TTL) 캐시, 스레드 안전
+    - maxsize를 넘으면 가장 오래 안 쓴 항목부터 제거 (evictions)
+    - ttl초가 지난 항목은 조회 시 제거 (expirations), ttl=None이면 만료 없음
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1: {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            stored_at, value = entry
+            if self.ttl is not None and self._clock() - stored_at > self.ttl:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (self._clock(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+def _equip_slot(spec: str) -> str:
+    return spec.split("=", 1)[0].strip()
+
+
+def request_key(ch: CharacterInput, equip: Sequence[str], buff: Sequence[str], doping: Sequence[str], monster_id: str) -> Tuple:
+    """
+    /calc 요청을 정규화한 키 (로드아웃 컴파일 전에 계산 -> 적중하면 스펙 해석/derive/check_hit 모두 생략)
+    - equip: 슬롯 기준 안정 정렬 (같은 슬롯은 뒤가 이기므로 그 순서는 유지, 잘못된 스펙도 그대로 남음)
+    - buff/doping: 적용 결과가 순서와 무관하므로 정렬
+    """
+    s = ch.base_stats
+    return (
+        ch.level,
+        ch.job.value,
+        s.str, s.dex, s.int, s.luk,
+        ch.maple_warrior_percent,
+        tuple(sorted(equip, key=_equip_slot)),
+        tuple(sorted(buff)),
+        tuple(sorted(doping)),
+        monster_id,
+    )
+
+
+class CalcMemo:
+    """
+    /calc의 (DerivedResult, HitCheckResult) 캐시 (키: request_key)
+    카탈로그 버전이 올라가면 전부 비움, 그보다 오래된 스냅샷으로 온 요청은 캐시를 건너뜀
+    (리로드 중 옛 스냅샷/새 스냅샷 요청이 섞여도 캐시를 반복해서 비우지 않도록)
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 300.0) -> None:
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _current(self, version: Optional[int]) -> bool:
+        """version이 캐시 기준 버전이면 True (더 새 버전이면 비우고 기준을 올림)"""
+        if version == self._version:
+            return True
+        with self._lock:
+            if self._version is None or (version is not None and version > self._version):
+                self.cache.clear()
+                self._version = version
+            return version == self._version
+
+    def get(self, key: Hashable, version: Optional[int] = None) -> Optional[Tuple[DerivedResult, HitCheckResult]]:
+        if not self._current(version):
+            return None
+        return self.cache.get(key)
+
+    def put(self, key: Hashable, value: Tuple[DerivedResult, HitCheckResult], version: Optional[int] = None) -> None:
+        if self._current(version):
+            self.cache.put(key, value)
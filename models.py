@@ -33,7 +33,7 @@ class EquipSlot(str, Enum):
     PET_EQUIP = "pet_equip"   # 기본 빈값
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stats:
     str: int = 0
     dex: int = 0
@@ -41,21 +41,87 @@ class Stats:
     luk: int = 0
 
     def __add__(self, other: "Stats") -> "Stats":
-        return Stats(
-            str=self.str + other.str,
-            dex=self.dex + other.dex,
-            int=self.int + other.int,
-            luk=self.luk + other.luk,
+        return new_stats(
+            self.str + other.str,
+            self.dex + other.dex,
+            self.int + other.int,
+            self.luk + other.luk,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Effect:
     stats: Stats = Stats()
     acc: int = 0
 
     def __add__(self, other: "Effect") -> "Effect":
-        return Effect(stats=self.stats + other.stats, acc=self.acc + other.acc)
+        return new_effect(self.stats + other.stats, self.acc + other.acc)
+
+
+# 내부 계산용 생성 경로: frozen dataclass의 __init__(object.__setattr__ 경유) 대신 slot에 바로 기록
+# (값 검증/기본값 처리가 없으므로 이미 int인 값에만 사용: new_stats / new_effect, 만들어진 객체는 일반 생성과 동일)
+_object_new = object.__new__
+_set_str = Stats.__dict__["str"].__set__
+_set_dex = Stats.__dict__["dex"].__set__
+_set_int = Stats.__dict__["int"].__set__
+_set_luk = Stats.__dict__["luk"].__set__
+_set_stats = Effect.__dict__["stats"].__set__
+_set_acc = Effect.__dict__["acc"].__set__
+
+
+def new_stats(str_: int, dex: int, int_: int, luk: int) -> Stats:
+    s = _object_new(Stats)
+    _set_str(s, str_)
+    _set_dex(s, dex)
+    _set_int(s, int_)
+    _set_luk(s, luk)
+    return s
+
+
+def new_effect(stats: Stats, acc: int) -> Effect:
+    e = _object_new(Effect)
+    _set_stats(e, stats)
+    _set_acc(e, acc)
+    return e
+
+
+class EffectAccumulator:
+    """
+    Effect 합산용 가변 누적기 (반복문에서 __add__ 마다 객체를 만들지 않도록)
+    - add(): Effect를 제자리 합산
+    - to_stats()/to_effect(): 마지막에 한 번만 불변 객체로 변환
+    """
+    __slots__ = ("str", "dex", "int", "luk", "acc")
+
+    def __init__(self) -> None:
+        self.str = 0
+        self.dex = 0
+        self.int = 0
+        self.luk = 0
+        self.acc = 0
+
+    def add(self, e: Effect) -> "EffectAccumulator":
+        s = e.stats
+        self.str += s.str
+        self.dex += s.dex
+        self.int += s.int
+        self.luk += s.luk
+        self.acc += e.acc
+        return self
+
+    def add_stats(self, s: Stats) -> "EffectAccumulator":
+        self.str += s.str
+        self.dex += s.dex
+        self.int += s.int
+        self.luk += s.luk
+        return self
+
+    def to_stats(self) -> Stats:
+        return new_stats(self.str, self.dex, self.int, self.luk)
+
+    def to_effect(self) -> Effect:
+        return new_effect(self.to_stats(), self.acc)
+
 
 @dataclass(frozen=True)
 class EffectSpec:
@@ -73,30 +139,159 @@ class Item:
     icon_url: Optional[str] = None
 
 
+# 장비 합계 그룹: 공통 / 상의+하의 / 한벌옷 (use_overall에 따라 둘 중 하나만 적용)
+_GROUP_COMMON, _GROUP_TOP_BOTTOM, _GROUP_OVERALL = 0, 1, 2
+_SLOT_GROUP: Dict[EquipSlot, int] = {
+    EquipSlot.TOP: _GROUP_TOP_BOTTOM,
+    EquipSlot.BOTTOM: _GROUP_TOP_BOTTOM,
+    EquipSlot.OVERALL: _GROUP_OVERALL,
+}
+
+
+_ALL_SLOTS = tuple(EquipSlot)
+
+
+class EquippedSlots(dict):
+    """
+    EquipmentState.equipped 용 dict: 항목이 바뀔 때마다 그룹별 합계(str, dex, int, luk, acc)를 갱신
+    -> 슬롯 하나 교체가 O(1), 합계 조회도 O(1)
+    (dict 메서드 중 값을 바꾸는 것은 모두 __setitem__/__delitem__ 을 거치도록 재정의)
+    """
+    __slots__ = ("totals",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.totals = [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def _apply(self, slot, item: Optional[Item], sign: int) -> None:
+        if item is None:
+            return
+        t = self.totals[_SLOT_GROUP.get(slot, _GROUP_COMMON)]
+        e = item.effect
+        s = e.stats
+        t[0] += sign * s.str
+        t[1] += sign * s.dex
+        t[2] += sign * s.int
+        t[3] += sign * s.luk
+        t[4] += sign * e.acc
+
+    def __setitem__(self, slot, item: Optional[Item]) -> None:
+        self._apply(slot, dict.get(self, slot), -1)
+        dict.__setitem__(self, slot, item)
+        self._apply(slot, item, 1)
+
+    def __delitem__(self, slot) -> None:
+        self._apply(slot, dict.__getitem__(self, slot), -1)
+        dict.__delitem__(self, slot)
+
+    def update(self, *args, **kwargs) -> None:
+        for slot, item in dict(*args, **kwargs).items():
+            self[slot] = item
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, slot, default: Optional[Item] = None) -> Optional[Item]:
+        if slot not in self:
+            self[slot] = default
+        return dict.__getitem__(self, slot)
+
+    _MISSING = object()
+
+    def pop(self, slot, default=_MISSING):
+        if slot not in self:
+            if default is EquippedSlots._MISSING:
+                raise KeyError(slot)
+            return default
+        item = dict.__getitem__(self, slot)
+        del self[slot]
+        return item
+
+    def popitem(self):
+        slot, item = dict.popitem(self)
+        self._apply(slot, item, -1)
+        return slot, item
+
+    def clear(self) -> None:
+        dict.clear(self)
+        for t in self.totals:
+            t[:] = (0, 0, 0, 0, 0)
+
+    def copy(self) -> "EquippedSlots":
+        return EquippedSlots(self)
+
+    def __reduce__(self):
+        return (EquippedSlots, (dict(self),))
+
+
 @dataclass
 class EquipmentState:
     use_overall: bool = False
     equipped: Dict[EquipSlot, Optional[Item]] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        for slot in EquipSlot:
-            self.equipped.setdefault(slot, None)
+        # 빈 슬롯(None)은 합계에 영향이 없으므로 훅을 거치지 않고 채움
+        equipped = self.equipped
+        for slot in _ALL_SLOTS:
+            if slot not in equipped:
+                dict.__setitem__(equipped, slot, None)
+
+    def __setattr__(self, name: str, value) -> None:
+        # equipped에 일반 dict를 넣어도 합계를 유지하도록 감쌈
+        if name == "equipped" and not isinstance(value, EquippedSlots):
+            value = EquippedSlots(value)
+        object.__setattr__(self, name, value)
+
+    def _active_totals(self):
+        t = self.equipped.totals
+        return t[_GROUP_COMMON], t[_GROUP_OVERALL if self.use_overall else _GROUP_TOP_BOTTOM]
 
     def iter_effects(self) -> Effect:
-        total = Effect()
-        for slot, item in self.equipped.items():
-            if item is None:
-                continue
-
-            if self.use_overall:
-                if slot in (EquipSlot.TOP, EquipSlot.BOTTOM):
-                    continue
-            else:
-                if slot == EquipSlot.OVERALL:
-                    continue
+        common, body = self._active_totals()
+        return new_effect(
+            new_stats(common[0] + body[0], common[1] + body[1], common[2] + body[2], common[3] + body[3]),
+            common[4] + body[4],
+        )
 
-            total = total + item.effect
-        return total
+    def accumulate(self, acc: EffectAccumulator) -> EffectAccumulator:
+        # iter_effects의 제자리 버전: 착용 장비 효과를 acc에 더함
+        for t in self._active_totals():
+            acc.str += t[0]
+            acc.dex += t[1]
+            acc.int += t[2]
+            acc.luk += t[3]
+            acc.acc += t[4]
+        return acc
+
+    def delta_if_equipped(self, slot: EquipSlot, item: Optional[Item]) -> Effect:
+        """
+        slot을 item으로 바꿨을 때 iter_effects()의 변화량 (실제로 바꾸지는 않음, item=None이면 해제)
+        현재 use_overall 기준으로 적용되지 않는 슬롯이면 0
+        """
+        group = _SLOT_GROUP.get(slot, _GROUP_COMMON)
+        if group == (_GROUP_TOP_BOTTOM if self.use_overall else _GROUP_OVERALL):
+            return Effect()
+        old = self.equipped.get(slot)
+        if item is None:
+            if old is None:
+                return Effect()
+            o = old.effect
+            return new_effect(new_stats(-o.stats.str, -o.stats.dex, -o.stats.int, -o.stats.luk), -o.acc)
+        if old is None:
+            return item.effect
+        n, o = item.effect, old.effect
+        return new_effect(
+            new_stats(
+                n.stats.str - o.stats.str,
+                n.stats.dex - o.stats.dex,
+                n.stats.int - o.stats.int,
+                n.stats.luk - o.stats.luk,
+            ),
+            n.acc - o.acc,
+        )
 
 
 @dataclass
@@ -106,31 +301,26 @@ class BuffState:
     doping: Dict[str, EffectSpec] = field(default_factory=dict)
 
     def total_effect(self) -> Effect:
+        return self.accumulate(EffectAccumulator()).to_effect()
+
+    def accumulate(self, acc: EffectAccumulator) -> EffectAccumulator:
+        # total_effect의 제자리 버전
         # 스탯은 전부 합산
-        total_stats = Stats()
         # ACC는 그룹별로 처리: None은 합산, group은 max
-        acc_sum_stackable = 0
         acc_max_by_group: Dict[str, int] = {}
 
-        def apply(spec: EffectSpec) -> None:
-            nonlocal total_stats, acc_sum_stackable, acc_max_by_group
-            e = spec.effect
-            total_stats = total_stats + e.stats
+        for specs in (self.skill_buffs, self.doping):
+            for spec in specs.values():
+                e = spec.effect
+                acc.add_stats(e.stats)
 
-            if spec.acc_group is None:
-                acc_sum_stackable += e.acc
-            else:
-                prev = acc_max_by_group.get(spec.acc_group, 0)
-                if e.acc > prev:
+                if spec.acc_group is None:
+                    acc.acc += e.acc
+                elif e.acc > acc_max_by_group.get(spec.acc_group, 0):
                     acc_max_by_group[spec.acc_group] = e.acc
 
-        for spec in self.skill_buffs.values():
-            apply(spec)
-        for spec in self.doping.values():
-            apply(spec)
-
-        acc_total = acc_sum_stackable + sum(acc_max_by_group.values())
-        return Effect(stats=total_stats, acc=acc_total)
+        acc.acc += sum(acc_max_by_group.values())
+        return acc
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from math import ceil
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .engine import apply_maple_warrior, calc_accuracy_from_stats, required_accuracy
+from .models import BuffState, CharacterInput, EquipmentState, EquipSlot, Item, JobGroup, Monster, Stats
+
+ItemCost = Union[Mapping[str, float], Callable[[Item], float]]
+
+# 한벌옷(OVERALL)과 상의/하의(TOP/BOTTOM)는 동시에 못 씀 (EquipmentState.iter_effects 규칙)
+_SPLIT_SLOTS = (EquipSlot.TOP, EquipSlot.BOTTOM)
+
+
+@dataclass(frozen=True)
+class GearLoadout:
+    cost: float
+    use_overall: bool
+    items: Tuple[Tuple[EquipSlot, Item], ...]  # 탐색으로 고른 장비만 (고정 장비 제외)
+    acc_total: int
+    acc_required: int
+    margin: int
+
+    def equipment_state(self, fixed: Optional[EquipmentState] = None) -> EquipmentState:
+        eq = EquipmentState(use_overall=self.use_overall)
+        if fixed is not None:
+            for slot, item in fixed.equipped.items():
+                eq.equipped[slot] = item
+        for slot, item in self.items:
+            eq.equipped[slot] = item
+        return eq
+
+
+def stat_investment(item: Item) -> float:
+    # 기본 비용: 아이템이 주는 스탯/명중 합 (적게 써서 맞추는 조합일수록 좋음)
+    e = item.effect
+    return max(e.stats.str, 0) + max(e.stats.dex, 0) + max(e.stats.int, 0) + max(e.stats.luk, 0) + max(e.acc, 0)
+
+
+def _cost_fn(cost: Optional[ItemCost]) -> Callable[[Item], Optional[float]]:
+    if cost is None:
+        return stat_investment
+    if callable(cost):
+        return cost
+    # 가격표에 없는 아이템은 후보에서 제외
+    return lambda it: cost.get(it.item_id)
+
+
+def _vec(item: Item) -> Tuple[int, int, int, int, int]:
+    s = item.effect.stats
+    return (s.str, s.dex, s.int, s.luk, item.effect.acc)
+
+
+def _vec_add(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2], a[3] + b[3], a[4] + b[4])
+
+
+_ZERO = (0, 0, 0, 0, 0)
+
+
+def _lp_segments(points: List[Tuple[float, float]]) -> List[Tuple[float, float, float]]:
+    """
+    한 슬롯의 (비용, 명중 이득) 후보 -> 아래 볼록 껍질 구간 [(기울기, 이득, 비용)]
+    슬롯당 하나만 고르는 제약을 '일부만 고를 수 있다'로 완화한 LP의 해가 됨 (비용 >= 0 전제)
+    """
+    # 이득이 더 큰데 비용이 같거나 싼 후보가 있으면 제외 -> 이득/비용 모두 증가하는 점들만 남김
+    frontier: List[Tuple[float, float]] = []
+    for g, c in sorted(((g, max(c, 0.0)) for c, g in points if g > 0), key=lambda t: (-t[0], t[1])):
+        if not frontier or c < frontier[-1][1]:
+            frontier.append((g, c))
+    frontier.reverse()
+
+    hull = [(0.0, 0.0)]
+    for g, c in frontier:
+        # 직전 점이 (전전 점 -> 새 점) 선분보다 위에 있으면 볼록하지 않으므로 제거
+        while len(hull) >= 2:
+            (g1, c1), (g2, c2) = hull[-2], hull[-1]
+            if (c2 - c1) * (g - g1) >= (c - c1) * (g2 - g1):
+                hull.pop()
+            else:
+                break
+        hull.append((g, c))
+    return [((c2 - c1) / (g2 - g1), g2 - g1, c2 - c1) for (g1, c1), (g2, c2) in zip(hull, hull[1:])]
+
+
+def _cumulate(segments: List[Tuple[float, float, float]]):
+    # 기울기 오름차순으로 정렬 후 누적 (이득, 비용)
+    segs = sorted(segments)
+    gains, costs = [0.0], [0.0]
+    for slope, g, c in segs:
+        gains.append(gains[-1] + g)
+        costs.append(costs[-1] + c)
+    return gains, costs, [slope for slope, _, _ in segs]
+
+
+def _lp_cost(lp, deficit: float) -> float:
+    gains, costs, slopes = lp
+    if deficit > gains[-1]:
+        return float("inf")
+    j = bisect_left(gains, deficit)
+    if j == 0:
+        return 0.0
+    return costs[j - 1] + (deficit - gains[j - 1]) * slopes[j - 1]
+
+
+def optimize_gear(
+    ch: CharacterInput,
+    items: Mapping[str, Item],
+    buffs: BuffState,
+    mob: Monster,
+    k: int = 5,
+    cost: Optional[ItemCost] = None,
+    fixed: Optional[EquipmentState] = None,
+    slots: Optional[Iterable[EquipSlot]] = None,
+) -> List[GearLoadout]:
+    """
+    슬롯당 아이템 하나씩 골라 미스 0(margin >= 0)이 되는 조합 중 비용이 가장 낮은 k개
+    - cost: 아이템 id -> 비용 dict 또는 Item -> 비용 함수 (None이면 stat_investment)
+    - fixed: 이미 정해둔 장비 (해당 슬롯은 탐색하지 않음)
+    - slots: 탐색할 슬롯 제한 (None이면 전체)
+    - 분기 한정: 남은 슬롯의 스탯/명중 최댓값으로 명중 상한, 최소 비용으로 비용 하한을 잡아 가지치기
+    """
+    if k <= 0:
+        return []
+
+    cost_of = _cost_fn(cost)
+    search_slots = set(EquipSlot) if slots is None else set(slots)
+    fixed_items = {} if fixed is None else {s: it for s, it in fixed.equipped.items() if it is not None}
+    search_slots -= set(fixed_items)
+
+    acc_required = required_accuracy(ch.level, mob.level, mob.evasion)
+    base_after_mw = apply_maple_warrior(ch.base_stats, ch.maple_warrior_percent)
+    buff_effect = buffs.total_effect()
+    s = base_after_mw + buff_effect.stats
+    base_vec = (s.str, s.dex, s.int, s.luk, buff_effect.acc)
+
+    def acc_of(v) -> int:
+        return calc_accuracy_from_stats(ch.job, Stats(str=v[0], dex=v[1], int=v[2], luk=v[3])) + v[4]
+
+    # 버림을 빼고 계산한 명중(항상 acc_of 이상): 비용 하한 계산용
+    if ch.job == JobGroup.MAGE:
+        def linear_acc(v) -> float:
+            return v[2] / 10 + v[3] / 10 + v[4]
+    else:
+        def linear_acc(v) -> float:
+            return v[1] * 0.8 + v[3] * 0.5 + v[4]
+
+    # 명중에 쓰이는 축 (물리: DEX/LUK/ACC, 마법: INT/LUK/ACC)
+    dims = (2, 3, 4) if ch.job == JobGroup.MAGE else (1, 3, 4)
+
+    # 슬롯별 후보: (비용, 벡터, 아이템), 비용 오름차순
+    # - 효과가 전혀 없는 아이템은 '빈 슬롯'과 같으므로 제외
+    # - 비용이 같거나 낮고 명중 관련 축이 모두 같거나 높은 아이템이 k개 이상 있으면 제외
+    #   (그 k개로 바꾼 조합이 모두 같거나 싸므로 상위 k개에 들 필요가 없음, k개 미만이면 남겨야 정확)
+    candidates: Dict[EquipSlot, List[Tuple[float, tuple, Item]]] = {}
+    for it in items.values():
+        if it.slot not in search_slots:
+            continue
+        v = _vec(it)
+        if all(v[d] <= 0 for d in dims):
+            continue
+        c = cost_of(it)
+        if c is None:
+            continue
+        candidates.setdefault(it.slot, []).append((c, v, it))
+    for sl, cands in candidates.items():
+        cands.sort(key=lambda t: (t[0], tuple(-t[1][d] for d in dims)))
+        kept: List[Tuple[float, tuple, Item]] = []
+        for cand in cands:
+            dominators = sum(1 for o in kept if all(o[1][d] >= cand[1][d] for d in dims))
+            if dominators < k:
+                kept.append(cand)
+        candidates[sl] = kept
+
+    all_costs = [c for cands in candidates.values() for c, _, _ in cands]
+    integral_costs = all(float(c).is_integer() for c in all_costs)
+    nonneg_costs = all(c >= 0 for c in all_costs)
+
+    # (비용, tie-break 카운터, use_overall, 선택) — 비용이 큰 쪽이 먼저 빠지도록 음수로 보관
+    best: List[Tuple[float, int, bool, tuple, int]] = []
+    counter = 0
+
+    configs = []
+    fixed_overall = EquipSlot.OVERALL in fixed_items
+    fixed_split = any(s in fixed_items for s in _SPLIT_SLOTS)
+    if fixed_overall and fixed_split:
+        raise ValueError("fixed equipment cannot include both overall and top/bottom")
+    if not fixed_overall:
+        configs.append(False)
+    if not fixed_split and (fixed_overall or EquipSlot.OVERALL in candidates):
+        configs.append(True)
+
+    for use_overall in configs:
+        inactive = _SPLIT_SLOTS if use_overall else (EquipSlot.OVERALL,)
+
+        start = base_vec
+        for slot, it in fixed_items.items():
+            if slot not in inactive:
+                start = _vec_add(start, _vec(it))
+
+        # 기여 가능한 명중이 큰 슬롯부터 (상한이 빨리 조여짐)
+        order = [sl for sl in candidates if sl not in inactive]
+        slot_max = {}
+        for sl in order:
+            m = _ZERO
+            for _, v, _ in candidates[sl]:
+                m = tuple(max(a, b) for a, b in zip(m, v))
+            slot_max[sl] = m
+        order.sort(key=lambda sl: acc_of(slot_max[sl]) - acc_of(_ZERO), reverse=True)
+
+        # 한벌옷 구성에서는 한벌옷을 반드시 고름 (안 고르면 상의/하의 구성의 부분집합과 같아짐)
+        mandatory = None
+        if use_overall and not fixed_overall:
+            mandatory = EquipSlot.OVERALL
+            order.remove(mandatory)
+            order.insert(0, mandatory)
+
+        # suffix_max[i]: i번째 이후 슬롯에서 얻을 수 있는 스탯/명중의 성분별 상한
+        # suffix_min_cost[i]: 같은 구간의 최소 비용 (빈 슬롯 = 0, 필수 슬롯과 음수 비용만 반영)
+        # suffix_lp[i]: 같은 구간에서 명중(버림 전)을 얻는 비용의 LP 완화 (_lp_segments 참고)
+        n = len(order)
+        suffix_max = [_ZERO] * (n + 1)
+        suffix_min_cost = [0.0] * (n + 1)
+        segments: List[Tuple[float, float, float]] = []
+        suffix_lp = [_cumulate(segments)] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            sl = order[i]
+            suffix_max[i] = _vec_add(suffix_max[i + 1], slot_max[sl])
+            cheapest = candidates[sl][0][0]
+            suffix_min_cost[i] = suffix_min_cost[i + 1] + (cheapest if sl == mandatory else min(0.0, cheapest))
+            segments = segments + _lp_segments([(c, linear_acc(v)) for c, v, _ in candidates[sl]])
+            suffix_lp[i] = _cumulate(segments)
+
+        chosen: List[Tuple[EquipSlot, Item]] = []
+
+        def bound_cost() -> float:
+            return -best[0][0] if len(best) >= k else float("inf")
+
+        def dfs(i: int, vec, total_cost: float) -> None:
+            nonlocal counter
+            if acc_of(_vec_add(vec, suffix_max[i])) < acc_required:
+                return
+            # 남은 부족분(버림 전 기준)을 LP 완화로 채우는 비용이 이미 k번째 해 이상이면 중단
+            lower = suffix_min_cost[i]
+            deficit = acc_required - linear_acc(vec)
+            if deficit > 0 and nonneg_costs:
+                lp = _lp_cost(suffix_lp[i], deficit)
+                if integral_costs and lp != float("inf"):
+                    # 비용이 모두 정수면 하한도 올림 가능
+                    lp = ceil(lp - 1e-9)
+                lower = max(lower, lp)
+            if total_cost + lower >= bound_cost():
+                return
+
+            if i == n:
+                acc_total = acc_of(vec)
+                counter += 1
+                entry = (-total_cost, -counter, use_overall, tuple(chosen), acc_total)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                else:
+                    heapq.heapreplace(best, entry)
+                return
+
+            # 빈 슬롯 먼저, 이후 비용 오름차순
+            sl = order[i]
+            if sl != mandatory:
+                dfs(i + 1, vec, total_cost)
+            rest = suffix_min_cost[i + 1]
+            for c, v, it in candidates[sl]:
+                if total_cost + c + rest >= bound_cost():
+                    break
+                chosen.append((sl, it))
+                dfs(i + 1, _vec_add(vec, v), total_cost + c)
+                chosen.pop()
+
+        dfs(0, start, 0.0)
+
+    out = [
+        GearLoadout(
+            cost=-neg_cost,
+            use_overall=use_overall,
+            items=choice,
+            acc_total=acc_total,
+            acc_required=acc_required,
+            margin=acc_total - acc_required,
+        )
+        for neg_cost, _, use_overall, choice, acc_total in best
+    ]
+    out.sort(key=lambda g: (g.cost, -g.margin))
+    return out
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from types import SimpleNamespace
+from typing import Any, Deque, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .build_eval import encode_result, evaluate_line
+from .loadout import LoadoutCompiler
+from .models import Monster
+
+# 청크 크기: 청크 하나가 TARGET_CHUNK_SECONDS쯤 걸리도록 조정
+# (너무 작으면 IPC/피클 비용, 너무 크면 첫 결과가 늦고 워커 간 부하가 고르지 않음)
+TARGET_CHUNK_SECONDS = 0.05
+MIN_CHUNK = 16
+MAX_CHUNK = 8192
+INITIAL_CHUNK = 64
+# 워커당 미리 넣어 두는 청크 수 (결과 대기 중에도 워커가 놀지 않도록, 메모리는 이만큼만)
+PENDING_PER_WORKER = 2
+
+# 워커 프로세스 전역: 프로세스당 카탈로그 한 번 로드 (_init_worker)
+_state: Optional[Tuple[LoadoutCompiler, Mapping[str, Monster]]] = None
+
+
+def _init_worker(catalog_db: Optional[str] = None) -> None:
+    global _state
+    from . import data_store
+    from .catalog_db import open_catalog
+
+    store = open_catalog(catalog_db)
+    if store is not None:
+        # SQLite 카탈로그: 워커마다 자기 연결, 쓰는 행만 조회 / mmap 스냅샷: 같은 파일을 매핑해서 페이지 공유
+        _state = (LoadoutCompiler(store), store.monsters)
+        return
+    catalog = SimpleNamespace(
+        items=data_store.load_items(),
+        buffs=data_store.load_named_effect_catalog("buff_skills.json"),
+        doping=data_store.load_named_effect_catalog("doping.json"),
+    )
+    _state = (LoadoutCompiler(catalog), data_store.load_monsters())
+
+
+def _eval_chunk(chunk: List[Tuple[int, str]], encoded: bool) -> Tuple[float, List[Any]]:
+    t0 = time.perf_counter()
+    compiler, monsters = _state
+    rows = [evaluate_line(line_no, line, compiler, monsters) for line_no, line in chunk]
+    if encoded:
+        # 직렬화도 워커에서 (부모 프로세스가 병목이 되지 않도록)
+        rows = [(row["ok"], encode_result(row)) for row in rows]
+    return time.perf_counter() - t0, rows
+
+
+class _ChunkSizer:
+    """완료된 청크의 줄당 시간(지수 평균)으로 다음 청크 크기 결정"""
+
+    def __init__(self, fixed: Optional[int] = None, target_seconds: float = TARGET_CHUNK_SECONDS) -> None:
+        self.fixed = fixed
+        self.target_seconds = target_seconds
+        self.size = fixed or INITIAL_CHUNK
+        self._per_line: Optional[float] = None
+
+    def update(self, n: int, elapsed: float) -> None:
+        if self.fixed or n == 0:
+            return
+        per_line = elapsed / n
+        self._per_line = per_line if self._per_line is None else 0.7 * self._per_line + 0.3 * per_line
+        if self._per_line > 0:
+            self.size = max(MIN_CHUNK, min(MAX_CHUNK, int(self.target_seconds / self._per_line)))
+        else:
+            self.size = MAX_CHUNK
+
+
+def iter_results_parallel(
+    lines: Iterable[str],
+    workers: Optional[int] = None,
+    *,
+    encoded: bool = False,
+    chunk_size: Optional[int] = None,
+    catalog_db: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    빌드 JSONL 줄을 프로세스 풀에 나눠 평가, 결과는 입력 순서대로 하나씩 내보냄
+    - workers: 프로세스 수 (None/0 -> CPU 수, 1 -> 풀 없이 현재 프로세스에서)
+    - encoded=True면 dict 대신 (ok, JSON 문자열) 쌍 (직렬화를 워커에서 처리)
+    - chunk_size: 고정 청크 크기 (None이면 적응형)
+    - 진행 중 청크는 workers * PENDING_PER_WORKER개까지만 -> 입력 크기와 무관하게 메모리 일정
+    카탈로그는 data_store 기준 (ACCURACY_CAL_DATA_DIR, catalog_db/ACCURACY_CAL_CATALOG_DB면 SQLite 또는 mmap 스냅샷), 워커마다 초기화 때 한 번 로드
+    """
+    workers = workers or os.cpu_count() or 1
+    numbered = ((line_no, line) for line_no, line in enumerate(lines, 1) if line.strip())
+
+    if workers == 1:
+        _init_worker(catalog_db)
+        for chunk in iter(lambda: list(islice(numbered, MAX_CHUNK)), []):
+            yield from _eval_chunk(chunk, encoded)[1]
+        return
+
+    sizer = _ChunkSizer(chunk_size)
+    pending: Deque[Future] = deque()
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(catalog_db,))
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < workers * PENDING_PER_WORKER:
+                chunk = list(islice(numbered, sizer.size))
+                if not chunk:
+                    exhausted = True
+                    break
+                pending.append(pool.submit(_eval_chunk, chunk, encoded))
+            if not pending:
+                break
+            # 맨 앞 청크부터 기다림 -> 순서 유지 (뒤 청크는 그동안 계속 처리됨)
+            elapsed, rows = pending.popleft().result()
+            sizer.update(len(rows), elapsed)
+            yield from rows
+    finally:
+        # 소비자가 중간에 멈춰도 남은 청크는 버리고 풀 정리
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,137 @@
+"""
+/calc, /calc/batch, /matrix 응답을 바로 bytes로 직렬화
+
+- dict를 만들고 jsonable_encoder -> json.dumps 를 거치는 대신 고정 템플릿(%)에 값만 채움
+- 기본 형식(json)은 예전 응답과 바이트 단위로 같음 (FastAPI JSONResponse: ensure_ascii=False, separators=(",", ":"))
+- compact: 키 없이 배열만 (기계 클라이언트용), 값 순서는 CALC_FIELDS / BATCH_FIELDS / BATCH_MONSTER_FIELDS
+"""
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import List, Optional
+
+from .matrix import HitMatrix
+from .models import DerivedResult, HitCheckResult, Monster
+
+FORMATS = ("json", "compact")
+
+# compact /calc: 이 순서의 값 배열
+CALC_FIELDS = (
+    "mw",
+    "base_after_mw.str", "base_after_mw.dex", "base_after_mw.int", "base_after_mw.luk",
+    "bonus_stats.str", "bonus_stats.dex", "bonus_stats.int", "bonus_stats.luk",
+    "total_stats.str", "total_stats.dex", "total_stats.int", "total_stats.luk",
+    "acc_from_stats", "acc_bonus", "acc_total",
+    "monster.level", "monster.evasion",
+    "acc_required", "is_sufficient", "margin",
+)
+# compact /calc/batch: 빌드 하나 = [BATCH_FIELDS..., [[BATCH_MONSTER_FIELDS...], ...]], 실패한 빌드는 {"error": ...}
+BATCH_FIELDS = ("mw", "acc_from_stats", "acc_bonus", "acc_total")
+BATCH_MONSTER_FIELDS = ("id", "acc_required", "is_sufficient", "margin")
+
+_STATS = '{"str":%d,"dex":%d,"int":%d,"luk":%d}'
+_CALC_JSON = (
+    '{"mw":%r,"base_after_mw":' + _STATS + ',"bonus_stats":' + _STATS + ',"total_stats":' + _STATS
+    + ',"acc_from_stats":%d,"acc_bonus":%d,"acc_total":%d,"monster":{"name":%s,"level":%d,"evasion":%d}'
+    + ',"acc_required":%d,"is_sufficient":%s,"margin":%d}'
+)
+_CALC_COMPACT = "[%r" + ",%d" * 18 + ",%s,%d]"
+
+_BATCH_OK_JSON = '{"ok":true,"mw":%r,"acc_from_stats":%d,"acc_bonus":%d,"acc_total":%d,"monsters":[%s]}'
+_BATCH_EMPTY_JSON = '{"ok":true,"mw":%r,"monsters":[]}'
+_BATCH_ERROR_JSON = '{"ok":false,"error":%s}'
+_BATCH_MONSTER_JSON = '{"id":%s,"acc_required":%d,"is_sufficient":%s,"margin":%d}'
+_BATCH_OK_COMPACT = "[%r,%d,%d,%d,[%s]]"
+_BATCH_EMPTY_COMPACT = "[%r,null,null,null,[]]"
+_BATCH_ERROR_COMPACT = '{"error":%s}'
+_BATCH_MONSTER_COMPACT = "[%s,%d,%s,%d]"
+_BATCH_COMPACT_HEAD = json.dumps(
+    {"fields": BATCH_FIELDS, "monster_fields": BATCH_MONSTER_FIELDS}, separators=(",", ":")
+)[:-1] + ',"results":['
+_MATRIX_JSON = (
+    '{"rows":{"labels":[%s],"level":[%s],"acc_total":[%s]}'
+    + ',"monsters":{"ids":[%s],"level":[%s],"evasion":[%s]},"margin":[%s]}'
+)
+
+_BOOL = ("false", "true")
+
+
+@lru_cache(maxsize=8192)
+def json_string(s: str) -> str:
+    """JSON 문자열 리터럴 (몬스터 이름/id처럼 반복되는 값은 캐시)"""
+    return json.dumps(s, ensure_ascii=False)
+
+
+def encode_calc(mw: float, result: DerivedResult, hit: HitCheckResult, mob: Monster, fmt: str = "json") -> bytes:
+    b, o, t = result.base_after_mw, result.bonus_stats, result.total_stats
+    if fmt == "compact":
+        return (_CALC_COMPACT % (
+            mw,
+            b.str, b.dex, b.int, b.luk,
+            o.str, o.dex, o.int, o.luk,
+            t.str, t.dex, t.int, t.luk,
+            result.acc_from_stats, result.acc_bonus, result.acc_total,
+            mob.level, mob.evasion,
+            hit.acc_required, _BOOL[hit.is_sufficient], hit.margin,
+        )).encode()
+    return (_CALC_JSON % (
+        mw,
+        b.str, b.dex, b.int, b.luk,
+        o.str, o.dex, o.int, o.luk,
+        t.str, t.dex, t.int, t.luk,
+        result.acc_from_stats, result.acc_bonus, result.acc_total,
+        json_string(mob.name), mob.level, mob.evasion,
+        hit.acc_required, _BOOL[hit.is_sufficient], hit.margin,
+    )).encode()
+
+
+class BatchEncoder:
+    """
+    /calc/batch 결과를 빌드 순서대로 조각(str)으로 모아 한 번에 bytes로
+    ok()/empty()/error()는 빌드 index 자리에 조각을 넣고, monster()는 ok() 전에 그 빌드의 몬스터 조각을 모음
+    """
+
+    def __init__(self, n: int, fmt: str = "json") -> None:
+        self.compact = fmt == "compact"
+        self._parts: List[Optional[str]] = [None] * n
+        self._monsters: List[List[str]] = [[] for _ in range(n)]
+
+    def monster(self, i: int, monster_id: str, acc_required: int, margin: int) -> None:
+        tmpl = _BATCH_MONSTER_COMPACT if self.compact else _BATCH_MONSTER_JSON
+        self._monsters[i].append(tmpl % (json_string(monster_id), acc_required, _BOOL[margin >= 0], margin))
+
+    def ok(self, i: int, mw: float, acc_from_stats: int, acc_bonus: int, acc_total: int) -> None:
+        tmpl = _BATCH_OK_COMPACT if self.compact else _BATCH_OK_JSON
+        self._parts[i] = tmpl % (mw, acc_from_stats, acc_bonus, acc_total, ",".join(self._monsters[i]))
+
+    def empty(self, i: int, mw: float) -> None:
+        # 공유 몬스터 목록이 비어 있어서 계산할 쌍이 없던 빌드
+        self._parts[i] = (_BATCH_EMPTY_COMPACT if self.compact else _BATCH_EMPTY_JSON) % (mw,)
+
+    def error(self, i: int, message: str) -> None:
+        # 에러 문구는 입력마다 달라서 캐시하지 않음
+        text = json.dumps(message, ensure_ascii=False)
+        self._parts[i] = (_BATCH_ERROR_COMPACT if self.compact else _BATCH_ERROR_JSON) % text
+
+    def encode(self) -> bytes:
+        head = _BATCH_COMPACT_HEAD if self.compact else '{"results":['
+        return (head + ",".join(self._parts) + "]}").encode()
+
+
+def _int_list(a) -> str:
+    return ",".join(map(str, a.tolist()))
+
+
+def _str_list(xs) -> str:
+    return ",".join(map(json_string, xs))
+
+
+def encode_matrix(m: HitMatrix) -> bytes:
+    """/matrix: HitMatrix.to_payload()와 같은 JSON (큰 표도 jsonable_encoder 없이 행 단위 join)"""
+    margin = ",".join("[" + _int_list(row) + "]" for row in m.margin)
+    return (_MATRIX_JSON % (
+        _str_list(m.labels), _int_list(m.level), _int_list(m.acc_total),
+        _str_list(m.monster_ids), _int_list(m.monster_level), _int_list(m.monster_evasion),
+        margin,
+    )).encode()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Dict, List, Mapping, Tuple
+
+from .models import Monster
+
+SORT_KEYS = ("level", "evasion")
+
+
+class MonsterReachIndex:
+    """
+    "레벨 L, 명중 A로 미스 0인 몬스터" 조회용 인덱스 (몬스터 카탈로그 로드 시 한 번 생성)
+
+    required_accuracy는 두 구간으로 나뉨
+    - 몹 레벨 <= L: floor(EVA * 55 / 15)           -> 레벨과 무관
+    - 몹 레벨 >  L: floor((55 + 2*(몹레벨-L)) * EVA / 15)
+    floor(N / 15) <= A  <=>  N <= 15*A + 14 = M 이므로 두 구간 모두
+    "EVA <= M // 55" 이고 "몹레벨 - L <= (M // EVA - 55) // 2" 인 몬스터로 정리됨.
+    EVA 값별 버킷(레벨 정렬)을 두고, 버킷마다 이분 탐색 한 번으로 앞부분만 잘라냄
+    -> O(버킷 수 * log n + 결과 수). EVA는 값의 범위가 작아 버킷 수는 카탈로그 크기와 거의 무관.
+    """
+
+    def __init__(self, monsters: Mapping[str, Monster]) -> None:
+        # 전체를 (레벨, EVA, id) 순으로 한 번 정렬해 두고, 버킷에는 그 순위(int)만 보관
+        # -> 레벨순 결과는 정수 정렬 한 번으로 끝남
+        self._ranked: List[Tuple[str, Monster]] = sorted(
+            monsters.items(), key=lambda e: (e[1].level, e[1].evasion, e[0])
+        )
+        buckets: Dict[int, List[int]] = {}
+        for rank, (_, m) in enumerate(self._ranked):
+            buckets.setdefault(m.evasion, []).append(rank)
+
+        self._evasions: List[int] = sorted(buckets)
+        self._levels: List[List[int]] = []
+        self._ranks: List[List[int]] = []
+        for eva in self._evasions:
+            ranks = buckets[eva]  # 순위 오름차순 = 레벨 오름차순
+            self._ranks.append(ranks)
+            self._levels.append([self._ranked[r][1].level for r in ranks])
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    def hittable(self, level: int, acc: int, sort_by: str = "level") -> List[Tuple[str, Monster]]:
+        """acc_required <= acc 인 (monster_id, Monster) 목록 (sort_by: "level" 또는 "evasion")"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}: {sort_by!r}")
+        if acc < 0:
+            return []
+
+        m_limit = 15 * acc + 14
+        # EVA <= M // 55 인 버킷까지만 (EVA 오름차순)
+        n_buckets = bisect_right(self._evasions, m_limit // 55)
+
+        out: List[int] = []
+        for b in range(n_buckets):
+            eva = self._evasions[b]
+            if eva == 0:
+                cut = len(self._levels[b])
+            else:
+                max_diff = (m_limit // eva - 55) // 2  # >= 0 (버킷 조건에서 보장)
+                cut = bisect_right(self._levels[b], level + max_diff)
+            out.extend(self._ranks[b][:cut])
+
+        if sort_by == "level":
+            out.sort()
+        ranked = self._ranked
+        return [ranked[r] for r in out]
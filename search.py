@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .models import EquipSlot, Item, Monster
+
+# 한글 음절 -> 초성 (U+AC00 ~ U+D7A3, 초성 하나당 중성 21 x 종성 28 = 588자)
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = frozenset(_CHOSEONG)
+
+# 매치 종류별 점수 (같은 종류 안에서는 앞쪽 위치/짧은 이름 우선)
+SCORE_EXACT = 1000.0
+SCORE_PREFIX = 800.0
+SCORE_SUBSTRING = 600.0
+SCORE_CHOSEONG = 400.0
+SCORE_FUZZY = 100.0
+# 직접 매치가 없을 때만 쓰는 오타 허용 검색: 질의 bigram 중 이름에 있는 비율 하한
+# (초성 bigram 비율은 FUZZY_CHOSEONG_WEIGHT를 곱해서 비교 -> 모음 오타 "작엽용" -> 작업용)
+FUZZY_MIN_COVERAGE = 0.5
+FUZZY_CHOSEONG_WEIGHT = 0.9
+
+
+def normalize(text: str) -> str:
+    """소문자 + 공백 제거 ("작업 장갑" / "작업장갑" 같게)"""
+    return "".join(text.lower().split())
+
+
+def choseong(text: str) -> str:
+    """한글 음절은 초성으로, 나머지 글자는 그대로 ("작업용 장갑" -> "ㅈㅇㅇㅈㄱ", 정규화 후 사용)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            out.append(_CHOSEONG[(code - _HANGUL_FIRST) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class _GramIndex:
+    """
+    글자 1개/2개 n-gram -> 문서 번호 목록
+    만든 뒤 freeze()로 목록을 tuple로 바꿈 (int만 든 tuple은 GC 추적 대상에서 빠짐 -> 큰 카탈로그에서 GC 부담 없음)
+    """
+
+    def __init__(self) -> None:
+        self.unigrams: Dict[str, Any] = defaultdict(set)
+        self.bigrams: Dict[str, Any] = defaultdict(set)
+
+    def add(self, doc: int, text: str) -> None:
+        for ch in text:
+            self.unigrams[ch].add(doc)
+        for g in _bigrams(text):
+            self.bigrams[g].add(doc)
+
+    def freeze(self) -> None:
+        self.unigrams = {k: tuple(v) for k, v in self.unigrams.items()}
+        self.bigrams = {k: tuple(v) for k, v in self.bigrams.items()}
+
+    def candidates(self, query: str) -> Iterable[int]:
+        # query를 포함할 수 있는 문서: query의 n-gram 중 가장 드문 것을 가진 문서 (실제 포함 여부는 호출자가 find로 확인)
+        if len(query) == 1:
+            return self.unigrams.get(query, ())
+        return min((self.bigrams.get(g, ()) for g in _bigrams(query)), key=len)
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    key: str                    # item_id / monster_id
+    name: str
+    match: str                  # exact | prefix | substring | choseong | fuzzy
+    score: float
+    slot: Optional[EquipSlot] = None
+
+
+class SearchIndex:
+    """
+    이름 검색 인덱스 (카탈로그 로드마다 한 번 생성)
+    - 부분 문자열: 가장 드문 n-gram의 문서 목록 -> 실제 포함 확인 (공백/대소문자 무시)
+    - 초성: 질의에 자음(ㄱ~ㅎ)이 있으면 이름의 초성 문자열에서 검색 ("ㅈㅇ" -> 작업용 장갑)
+    - 오타 허용: 위 둘 다 결과가 없으면 질의 bigram(글자/초성)을 많이 가진 이름
+    - slot을 주면 해당 EquipSlot 항목만
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, Optional[EquipSlot]]]) -> None:
+        self.keys: List[str] = []
+        self.names: List[str] = []
+        self.slots: List[Optional[EquipSlot]] = []
+        self._norm: List[str] = []
+        self._cho: List[str] = []
+        self._text = _GramIndex()
+        self._cho_index = _GramIndex()
+        for doc, (key, name, slot) in enumerate(entries):
+            norm = normalize(name)
+            cho = choseong(norm)
+            self.keys.append(key)
+            self.names.append(name)
+            self.slots.append(slot)
+            self._norm.append(norm)
+            self._cho.append(cho)
+            self._text.add(doc, norm)
+            self._cho_index.add(doc, cho)
+        self._text.freeze()
+        self._cho_index.freeze()
+
+    @classmethod
+    def from_items(cls, items: Mapping[str, Item]) -> "SearchIndex":
+        return cls((iid, it.name, it.slot) for iid, it in items.items())
+
+    @classmethod
+    def from_monsters(cls, monsters: Mapping[str, Monster]) -> "SearchIndex":
+        return cls((mid, m.name, None) for mid, m in monsters.items())
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _coverage(self, q: str) -> Dict[int, float]:
+        # 문서별 (질의 bigram 중 문서에도 있는 비율), 글자/초성 중 큰 쪽
+        best: Dict[int, float] = {}
+        for index, text, weight in ((self._text, q, 1.0), (self._cho_index, choseong(q), FUZZY_CHOSEONG_WEIGHT)):
+            grams = _bigrams(text)
+            shared: Counter = Counter()
+            for g in grams:
+                shared.update(index.bigrams.get(g, ()))
+            for doc, n in shared.items():
+                coverage = weight * n / len(grams)
+                if coverage > best.get(doc, 0.0):
+                    best[doc] = coverage
+        return best
+
+    def search(self, query: str, limit: Optional[int] = 20, slot: Optional[EquipSlot] = None) -> List[SearchHit]:
+        q = normalize(query)
+        if not q:
+            return []
+        slots, names, keys = self.slots, self.names, self.keys
+        # (-점수, 이름 길이, key, doc, 매치 종류) -> 그대로 정렬하면 순위, SearchHit는 상위 limit개만 만듦
+        ranked: List[Tuple[float, int, str, int, str]] = []
+        seen: Set[int] = set()
+
+        for doc in self._text.candidates(q):
+            if slot is not None and slots[doc] != slot:
+                continue
+            norm = self._norm[doc]
+            pos = norm.find(q)
+            if pos < 0:
+                continue
+            if norm == q:
+                score, match = SCORE_EXACT, "exact"
+            elif pos == 0:
+                score, match = SCORE_PREFIX - len(norm), "prefix"
+            else:
+                score, match = SCORE_SUBSTRING - pos - len(norm) / 100, "substring"
+            ranked.append((-score, len(names[doc]), keys[doc], doc, match))
+            seen.add(doc)
+
+        if any(ch in CHOSEONG_SET for ch in q):
+            qc = choseong(q)
+            for doc in self._cho_index.candidates(qc):
+                if doc in seen or (slot is not None and slots[doc] != slot):
+                    continue
+                cho = self._cho[doc]
+                pos = cho.find(qc)
+                if pos >= 0:
+                    ranked.append((pos + len(cho) / 100 - SCORE_CHOSEONG, len(names[doc]), keys[doc], doc, "choseong"))
+
+        if not ranked and len(q) >= 2:
+            for doc, coverage in self._coverage(q).items():
+                if coverage >= FUZZY_MIN_COVERAGE and (slot is None or slots[doc] == slot):
+                    score = SCORE_FUZZY * coverage - len(self._norm[doc]) / 100
+                    ranked.append((-score, len(names[doc]), keys[doc], doc, "fuzzy"))
+
+        top = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+        return [SearchHit(key, names[doc], match, -neg, slots[doc]) for neg, _, key, doc, match in top]
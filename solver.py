@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import ceil, floor
+from typing import Dict, Mapping, Optional
+
+from .defaults import DEFAULT_BASE_STATS
+from .engine import apply_maple_warrior, calc_accuracy_from_stats, required_accuracy
+from .models import BuffState, CharacterInput, Effect, EquipmentState, JobGroup, Monster, Stats
+
+# 직업별 명중 계산식의 스탯 계수 (버림 전): 물리 floor(DEX*0.8 + LUK*0.5), 마법 INT//10 + LUK//10
+_COEF = {
+    "physical": {"str": 0.0, "dex": 0.8, "int": 0.0, "luk": 0.5},
+    "mage": {"str": 0.0, "dex": 0.0, "int": 0.1, "luk": 0.1},
+}
+# mixed 배분 시 주 스탯 (나머지는 LUK)
+_PRIMARY = {"physical": "dex", "mage": "int"}
+
+SOLVABLE_STATS = ("str", "dex", "int", "luk", "mixed")
+
+
+@dataclass(frozen=True)
+class StatRequirement:
+    stat: str                     # "dex" / "luk" / "int" / "mixed"
+    reachable: bool               # 해당 스탯만 올려서 미스 0이 가능한지
+    base_stats: Optional[Stats]   # 미스 0이 되는 최소 순스탯 (다른 스탯은 입력 그대로)
+    additional: int               # 현재 순스탯 대비 추가로 필요한 AP (이미 충분하면 0)
+    acc_total: Optional[int]      # base_stats 기준 최종 명중
+    acc_required: int
+
+
+def _kind(job: JobGroup) -> str:
+    return "mage" if job == JobGroup.MAGE else "physical"
+
+
+def _with_points(base: Stats, stat: str, x: int, ratio: float, kind: str) -> Stats:
+    # x: stat이 단일 스탯이면 해당 스탯 값 자체, mixed면 현재 값에 더할 AP (주 스탯 floor(x*ratio), 나머지 LUK)
+    if stat == "mixed":
+        primary = _PRIMARY[kind]
+        to_primary = floor(x * ratio)
+        d = {primary: getattr(base, primary) + to_primary, "luk": base.luk + (x - to_primary)}
+    else:
+        d = {stat: x}
+    return Stats(
+        str=d.get("str", base.str),
+        dex=d.get("dex", base.dex),
+        int=d.get("int", base.int),
+        luk=d.get("luk", base.luk),
+    )
+
+
+def min_stat_for_monster(
+    ch: CharacterInput,
+    equipment: EquipmentState,
+    buffs: BuffState,
+    mob: Monster,
+    stat: str = "dex",
+    ratio: float = 0.5,
+) -> StatRequirement:
+    """
+    미스 0(margin >= 0)이 되는 최소 순스탯 (calc_accuracy_from_stats/required_accuracy의 역산)
+    - stat: "dex"/"luk"/"int"/"str" 하나만 올리거나, "mixed"면 AP를 주 스탯(물리 DEX, 마법 INT)과 LUK에 ratio:(1-ratio)로 배분
+    - 메용(apply_maple_warrior) 버림, 장비/버프/도핑 보너스 반영
+    """
+    bonus = equipment.iter_effects() + buffs.total_effect()
+    return _solve(ch, bonus, mob, stat, ratio)
+
+
+def min_stat_for_monsters(
+    ch: CharacterInput,
+    equipment: EquipmentState,
+    buffs: BuffState,
+    monsters: Mapping[str, Monster],
+    stat: str = "dex",
+    ratio: float = 0.5,
+) -> Dict[str, StatRequirement]:
+    """min_stat_for_monster를 몬스터 카탈로그 전체(예: load_monsters())에 대해 한 번에"""
+    bonus = equipment.iter_effects() + buffs.total_effect()
+    return {mid: _solve(ch, bonus, mob, stat, ratio) for mid, mob in monsters.items()}
+
+
+def _solve(ch: CharacterInput, bonus: Effect, mob: Monster, stat: str, ratio: float) -> StatRequirement:
+    if stat not in SOLVABLE_STATS:
+        raise ValueError(f"stat must be one of {SOLVABLE_STATS}: {stat!r}")
+    if stat == "mixed" and not 0.0 <= ratio <= 1.0:
+        raise ValueError(f"ratio must be in [0, 1]: {ratio}")
+
+    kind = _kind(ch.job)
+    acc_required = required_accuracy(ch.level, mob.level, mob.evasion)
+    base = ch.base_stats
+
+    def acc_at(x: int) -> int:
+        stats = _with_points(base, stat, x, ratio, kind)
+        total = apply_maple_warrior(stats, ch.maple_warrior_percent) + bonus.stats
+        return calc_accuracy_from_stats(ch.job, total) + bonus.acc
+
+    # x의 하한: 단일 스탯이면 기본 순스탯(4), mixed면 추가 AP 0
+    if stat == "mixed":
+        lo, current = 0, 0
+        coef = _COEF[kind]
+        per_point = ratio * coef[_PRIMARY[kind]] + (1.0 - ratio) * coef["luk"]
+    else:
+        lo, current = getattr(DEFAULT_BASE_STATS, stat), getattr(base, stat)
+        per_point = _COEF[kind][stat]
+    per_point *= 1.0 + ch.maple_warrior_percent
+
+    def result(x: Optional[int]) -> StatRequirement:
+        if x is None:
+            return StatRequirement(stat, False, None, 0, None, acc_required)
+        acc_total = acc_at(x)
+        return StatRequirement(
+            stat=stat,
+            reachable=True,
+            base_stats=_with_points(base, stat, x, ratio, kind),
+            additional=max(0, x - current),
+            acc_total=acc_total,
+            acc_required=acc_required,
+        )
+
+    if per_point <= 0.0:
+        # 명중에 영향이 없는 스탯: 지금 이미 충분한 경우만 가능
+        return result(lo if acc_at(lo) >= acc_required else None)
+
+    # 선형(버림 전) 근사로 바로 추정 후, 버림 오차만큼만 앞뒤로 보정 (보정 횟수는 상수)
+    x = max(lo, current + ceil((acc_required - acc_at(current)) / per_point))
+    while x > lo and acc_at(x - 1) >= acc_required:
+        x -= 1
+    while acc_at(x) < acc_required:
+        x += 1
+    return result(x)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import csv
+import dataclasses
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+# 표 결과(LevelSweep / HitMatrix 같은 frozen dataclass) 파일 저장 공용
+# - .csv: 표마다 정한 행들
+# - .npz: dataclass 필드 전체 (필드 이름 = 배열 이름, 문자열 목록은 str 배열로)
+
+
+def write_csv(path: Path, rows: Iterable[Sequence[Any]]) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def write_npz(path: Path, table: Any) -> None:
+    arrays = {}
+    for field in dataclasses.fields(table):
+        value = getattr(table, field.name)
+        arrays[field.name] = np.array(value, dtype=str) if isinstance(value, list) else value
+    np.savez_compressed(path, **arrays)
+
+
+def write_table(table: Any, path: Path, kind: str) -> None:
+    """확장자로 형식 결정 (.csv -> table.write_csv / .npz -> table.write_npz), kind는 에러 메시지용"""
+    path = Path(path)
+    if path.suffix == ".csv":
+        table.write_csv(path)
+    elif path.suffix == ".npz":
+        table.write_npz(path)
+    else:
+        raise ValueError(f"unsupported {kind} output (use .csv or .npz): {path}")
@@ -0,0 +1,45 @@
+import random
+
+from ..batch import derive_character_results_batch, job_codes
+from ..engine import check_hit, derive_character_result
+from ..models import BuffState, CharacterInput, Effect, EffectSpec, EquipmentState, JobGroup, Monster, Stats
+
+
+def test_batch_matches_scalar_path():
+    # 랜덤 빌드를 scalar 경로(derive_character_result/check_hit)와 배치 경로로 각각 계산
+    rng = random.Random(0)
+    rows = []
+    for _ in range(10000):
+        ch = CharacterInput(
+            level=rng.randint(1, 200),
+            job=rng.choice(list(JobGroup)),
+            base_stats=Stats(*(rng.randint(4, 999) for _ in range(4))),
+            maple_warrior_percent=rng.choice([0.0, 0.05, 0.1, 0.15, 0.2]),
+        )
+        buffs = BuffState()
+        bonus = Effect(stats=Stats(*(rng.randint(0, 60) for _ in range(4))), acc=rng.randint(0, 80))
+        buffs.skill_buffs["rand"] = EffectSpec(name="rand", effect=bonus)
+        mob = Monster(name="rand", level=rng.randint(1, 200), evasion=rng.randint(0, 300))
+        derived = derive_character_result(ch, EquipmentState(), buffs)
+        rows.append((ch, bonus, mob, check_hit(derived.acc_total, ch.level, mob)))
+
+    res = derive_character_results_batch(
+        level=[r[0].level for r in rows],
+        job_code=job_codes(r[0].job for r in rows),
+        base_str=[r[0].base_stats.str for r in rows],
+        base_dex=[r[0].base_stats.dex for r in rows],
+        base_int=[r[0].base_stats.int for r in rows],
+        base_luk=[r[0].base_stats.luk for r in rows],
+        mw_percent=[r[0].maple_warrior_percent for r in rows],
+        bonus_str=[r[1].stats.str for r in rows],
+        bonus_dex=[r[1].stats.dex for r in rows],
+        bonus_int=[r[1].stats.int for r in rows],
+        bonus_luk=[r[1].stats.luk for r in rows],
+        bonus_acc=[r[1].acc for r in rows],
+        mob_level=[r[2].level for r in rows],
+        mob_evasion=[r[2].evasion for r in rows],
+    )
+    assert res.acc_total.tolist() == [r[3].acc_total for r in rows]
+    assert res.acc_required.tolist() == [r[3].acc_required for r in rows]
+    assert res.margin.tolist() == [r[3].margin for r in rows]
+    assert res.is_sufficient.tolist() == [r[3].is_sufficient for r in rows]
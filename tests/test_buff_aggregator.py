@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from ..buff_aggregator import BuffAggregator
+from ..models import BuffState, Effect, EffectSpec, Stats
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_add_remove_matches_total_effect(seed):
+    # 무작위 add/remove/교체 시퀀스마다 BuffState.total_effect()와 같아야 함
+    rng = random.Random(seed)
+    groups = [None, None, "accuracy", "accuracy", "other"]
+    keys = [(kind, f"{kind}_{i}") for kind in ("skill", "doping") for i in range(8)]
+    for _ in range(100):
+        agg = BuffAggregator()
+        state = BuffState()
+        for _ in range(50):
+            kind, key = rng.choice(keys)
+            target = state.skill_buffs if kind == "skill" else state.doping
+            if key in target and rng.random() < 0.4:
+                del target[key]
+                agg.remove((kind, key))
+            else:
+                spec = EffectSpec(
+                    name=key,
+                    effect=Effect(stats=Stats(*(rng.randint(-5, 10) for _ in range(4))), acc=rng.randint(-5, 20)),
+                    acc_group=rng.choice(groups),
+                )
+                target[key] = spec
+                agg.add((kind, key), spec)
+            assert agg.effect() == state.total_effect()
+
+
+def test_from_state_matches_total_effect():
+    state = BuffState()
+    state.skill_buffs["a"] = EffectSpec(name="a", effect=Effect(acc=10), acc_group="accuracy")
+    state.doping["b"] = EffectSpec(name="b", effect=Effect(acc=15), acc_group="accuracy")
+    state.doping["c"] = EffectSpec(name="c", effect=Effect(stats=Stats(dex=3), acc=2))
+    agg = BuffAggregator.from_state(state)
+    assert agg.effect() == state.total_effect()
+    agg.remove(("doping", "b"))
+    del state.doping["b"]
+    assert agg.effect() == state.total_effect()
@@ -0,0 +1,38 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from .. import data_store
+from ..build_eval import evaluate_line
+from ..loadout import LoadoutCompiler
+
+GOOD = {"character": {"level": 30, "job": "archer", "base_stats": {"str": 4, "dex": 100, "int": 4, "luk": 4}}, "monster": {"id": "test_mob"}}
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    monsters = data_store.load_monsters()
+    compiler = LoadoutCompiler(SimpleNamespace(
+        items=data_store.load_items(),
+        buffs=data_store.load_named_effect_catalog("buff_skills.json"),
+        doping=data_store.load_named_effect_catalog("doping.json"),
+    ))
+    return compiler, monsters
+
+
+@pytest.mark.parametrize("line", [
+    # json.loads가 받는 비유한 값: 줄 하나만 실패하고 예외는 밖으로 나오지 않아야 함
+    json.dumps(GOOD).replace('"level": 30', '"level": 1e999'),
+    json.dumps(GOOD).replace('"dex": 100', '"dex": Infinity'),
+    json.dumps({**GOOD, "character": {**GOOD["character"], "mw": 0.0}}).replace('"mw": 0.0', '"mw": NaN'),
+    json.dumps({**GOOD, "character": {**GOOD["character"], "mw": 1e308}}),
+])
+def test_bad_numbers_become_error_lines(catalog, line):
+    row = evaluate_line(7, line, *catalog)
+    assert row["ok"] is False and row["line"] == 7 and row["error"]
+
+
+def test_good_record(catalog):
+    row = evaluate_line(1, json.dumps(GOOD), *catalog)
+    assert row["ok"] is True and row["acc_total"] == 82
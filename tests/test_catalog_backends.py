@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from .. import data_store
+from ..benchmarks.synthetic import write_catalog
+from ..catalog import build_catalog_body
+from ..catalog_db import SqliteCatalog, import_json
+from ..catalog_mmap import MmapCatalog, build_snapshot_file
+from ..engine import required_accuracy
+from ..models import EquipSlot
+from ..reachability import SORT_KEYS, MonsterReachIndex
+from ..search import SearchIndex, choseong, normalize
+
+TABLES = ("monsters", "items", "buffs", "doping")
+
+
+def _load_json(data_dir):
+    # 기준값: JSON 로더(data_store) 결과
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(data_store, "DATA_DIR", data_dir)
+        return {
+            "monsters": data_store.load_monsters(),
+            "items": data_store.load_items(),
+            "buffs": data_store.load_named_effect_catalog("buff_skills.json"),
+            "doping": data_store.load_named_effect_catalog("doping.json"),
+        }
+
+
+@pytest.fixture(scope="module", params=["shipped", "synthetic"])
+def source(request, tmp_path_factory):
+    if request.param == "shipped":
+        data_dir = data_store.DATA_DIR
+    else:
+        data_dir = tmp_path_factory.mktemp("data")
+        write_catalog(data_dir, scale=3, seed=0)
+    out = tmp_path_factory.mktemp("store")
+    import_json(out / "catalog.sqlite", data_dir)
+    build_snapshot_file(out / "catalog.snap", data_dir)
+    return {
+        "expected": _load_json(data_dir),
+        "sqlite": SqliteCatalog(out / "catalog.sqlite"),
+        "mmap": MmapCatalog(out / "catalog.snap"),
+    }
+
+
+@pytest.fixture(params=["sqlite", "mmap"])
+def case(request, source):
+    return source[request.param], source["expected"]
+
+
+def test_mapping_views_match_json(case):
+    store, expected = case
+    for name in TABLES:
+        view, want = getattr(store, name), expected[name]
+        assert list(view) == list(want)
+        assert len(view) == len(want)
+        assert dict(view.items()) == want
+        key = next(iter(want))
+        assert view[key] == want[key] and key in view
+        assert view.get("no-such-id") is None
+
+
+def test_items_by_slot(case):
+    store, expected = case
+    for slot in EquipSlot:
+        assert store.items_by_slot(slot) == [it for it in expected["items"].values() if it.slot == slot]
+
+
+def test_hittable_matches_reach_index(case):
+    store, expected = case
+    monsters = expected["monsters"]
+    index = MonsterReachIndex(monsters)
+    rng = random.Random(0)
+    mobs = list(monsters.values())
+    # 경계(필요 명중) 근처 명중값
+    for _ in range(300):
+        level = rng.randint(1, 200)
+        m = rng.choice(mobs)
+        acc = max(0, required_accuracy(level, m.level, m.evasion) + rng.randint(-2, 2))
+        for sort_by in SORT_KEYS:
+            assert store.hittable(level, acc, sort_by) == index.hittable(level, acc, sort_by)
+
+
+@pytest.mark.parametrize("table", ["monsters", "items"])
+def test_search_matches_search_index(case, table):
+    store, expected = case
+    mapping = expected[table]
+    if table == "monsters":
+        index, search = SearchIndex.from_monsters(mapping), store.monster_search
+    else:
+        index, search = SearchIndex.from_items(mapping), store.item_search
+    rng = random.Random(0)
+    names = [v.name for v in mapping.values()]
+    # 이름 일부 / 그 초성 / 이름 전체(exact) / 앞부분(prefix)
+    for _ in range(150):
+        norm = normalize(rng.choice(names))
+        a = rng.randrange(len(norm))
+        q = norm[a:a + rng.randint(1, 4)]
+        for query in (q, choseong(q), norm, norm[:a + 1]):
+            want = [h for h in index.search(query, limit=None) if h.match != "fuzzy"]
+            assert search.search(query, limit=None) == want, query
+            assert search.search(query, limit=5) == want[:5], query
+
+
+def test_item_search_slot_filter(case):
+    store, expected = case
+    index = SearchIndex.from_items(expected["items"])
+    name = next(iter(expected["items"].values())).name
+    for slot in EquipSlot:
+        want = [h for h in index.search(name[:1], limit=None, slot=slot) if h.match != "fuzzy"]
+        assert store.item_search.search(name[:1], limit=None, slot=slot) == want
+    assert store.monster_search.search(name[:1], slot=EquipSlot.GLOVES) == []
+
+
+def test_mmap_catalog_body(source):
+    expected = source["expected"]
+    body = source["mmap"].catalog_body()
+    want = build_catalog_body(*(expected[name] for name in TABLES))
+    assert bytes(body.raw) == want.raw
+    assert bytes(body.gzip) == want.gzip
+    assert body.etag == want.etag
@@ -0,0 +1,46 @@
+import threading
+
+from .. import catalog
+from ..catalog import CatalogManager
+
+
+def _blocking_builds(monkeypatch):
+    # reload() 안의 build_snapshot을 한 번씩 풀어 주는 가짜로 교체 (호출 횟수 기록)
+    real = catalog.build_snapshot
+    gate = threading.Semaphore(0)
+    calls = []
+
+    def build(version):
+        calls.append(version)
+        gate.acquire()
+        return real(version=version)
+
+    monkeypatch.setattr(catalog, "build_snapshot", build)
+    return gate, calls
+
+
+def test_request_during_reload_runs_once_more(monkeypatch):
+    m = CatalogManager()
+    gate, calls = _blocking_builds(monkeypatch)
+    assert m.request_reload() is True
+    assert m.request_reload() is False  # 진행 중 -> pending
+    assert m.request_reload() is False  # 여러 번 와도 한 번만 더
+    gate.release()
+    gate.release()
+    m._reload_thread.join(5)
+    assert not m.reloading
+    assert len(calls) == 2 and m.current.version == 3
+
+
+def test_request_after_worker_decided_to_exit_is_not_lost(monkeypatch):
+    m = CatalogManager()
+    gate, calls = _blocking_builds(monkeypatch)
+    # 워커가 pending 없음을 확인하고 빠져나가는 중 (스레드는 아직 살아 있음)
+    exiting = threading.Thread(target=threading.Event().wait, args=(0.5,))
+    exiting.start()
+    m._reload_thread = exiting
+    assert m.request_reload() is True
+    gate.release()
+    m._reload_thread.join(5)
+    exiting.join()
+    assert len(calls) == 1 and m.current.version == 2
@@ -0,0 +1,16 @@
+import pytest
+
+from ..cli import _build_parser
+
+
+@pytest.mark.parametrize("value, expected", [("0", 0), ("1", 1), ("8", 8)])
+def test_workers_accepts_non_negative(value, expected):
+    assert _build_parser().parse_args(["--workers", value]).workers == expected
+
+
+@pytest.mark.parametrize("value", ["-1", "-8", "two"])
+def test_workers_rejects_negative_and_non_int(value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        _build_parser().parse_args(["--workers", value])
+    assert exc.value.code == 2
+    assert "--workers" in capsys.readouterr().err
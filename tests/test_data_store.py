@@ -0,0 +1,25 @@
+import os
+
+from .. import data_store
+
+
+def _fail_replace(*args):
+    raise OSError(28, "No space left on device")
+
+
+def test_write_compiled_removes_tmp_on_failure(tmp_path, monkeypatch):
+    source = tmp_path / "items.json"
+    source.write_text("[]", encoding="utf-8")
+    monkeypatch.setattr(os, "replace", _fail_replace)
+    data_store._write_compiled("items", source, (2, 0), [])
+    cache_dir = tmp_path / data_store.CACHE_DIR_NAME
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_write_compiled_round_trip(tmp_path):
+    source = tmp_path / "items.json"
+    source.write_text("[]", encoding="utf-8")
+    data_store._write_compiled("items", source, (2, 0), [("a",)])
+    assert data_store._read_compiled("items", source, (2, 0)) == [("a",)]
+    assert data_store._read_compiled("items", source, (3, 0)) is None
+    assert [p.suffix for p in (tmp_path / data_store.CACHE_DIR_NAME).iterdir()] == [".pickle"]
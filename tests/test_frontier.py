@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from ..frontier import ACC_DIMS, ItemFrontier, accuracy_vector, pareto_frontier
+from ..models import Effect, EquipSlot, Item, JobGroup, Stats
+
+
+def _brute(items, kind):
+    # O(n^2): 빈 슬롯(0 벡터) 포함해서 지배당하지 않은 아이템 (입력 순서)
+    vecs = [accuracy_vector(it, kind) for it in items]
+    dominators = vecs + [(0, 0, 0)]
+    return [
+        it for it, v in zip(items, vecs)
+        if v != (0, 0, 0) and not any(all(o[d] >= v[d] for d in range(3)) and o != v for o in dominators)
+    ]
+
+
+def _items(rng, n):
+    out = {}
+    for i in range(n):
+        slot = rng.choice((EquipSlot.GLOVES, EquipSlot.SHOES, EquipSlot.CAPE))
+        stats = Stats(*(rng.randint(-2, 6) for _ in range(4)))
+        out[f"i{i}"] = Item(item_id=f"i{i}", name=f"i{i}", slot=slot, effect=Effect(stats=stats, acc=rng.randint(-2, 6)))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_frontier_matches_brute_force(seed):
+    rng = random.Random(seed)
+    items = _items(rng, rng.randint(1, 60))
+    frontier = ItemFrontier(items)
+    for kind in ACC_DIMS:
+        for slot in (EquipSlot.GLOVES, EquipSlot.SHOES, EquipSlot.CAPE):
+            slot_items = [it for it in items.values() if it.slot == slot]
+            assert list(frontier.get(kind, slot)) == _brute(slot_items, kind)
+    assert len(frontier) == len(items)
+
+
+def test_job_maps_to_kind_and_keeps_equal_vectors():
+    a = Item(item_id="a", name="a", slot=EquipSlot.GLOVES, effect=Effect(stats=Stats(dex=3), acc=2))
+    b = Item(item_id="b", name="b", slot=EquipSlot.GLOVES, effect=Effect(stats=Stats(dex=3, str=9), acc=2))
+    c = Item(item_id="c", name="c", slot=EquipSlot.GLOVES, effect=Effect(stats=Stats(int=5)))
+    assert pareto_frontier([a, b, c], JobGroup.ARCHER) == [a, b]
+    assert pareto_frontier([a, b, c], JobGroup.MAGE) == [a, b, c]
+    assert set(ItemFrontier({"a": a, "b": b, "c": c}).candidates("mage")) == {"a", "b", "c"}
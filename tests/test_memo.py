@@ -0,0 +1,39 @@
+from ..memo import CalcMemo, LRUCache, request_key
+from ..models import CharacterInput, JobGroup, Stats
+
+CH = CharacterInput(level=30, job=JobGroup.ARCHER, base_stats=Stats(dex=100), maple_warrior_percent=0.0)
+
+
+def test_request_key_ignores_buff_order_but_keeps_same_slot_order():
+    a = request_key(CH, ["gloves=a", "shoes=b"], ["bless", "custom:acc=3"], ["pill"], "mob")
+    b = request_key(CH, ["shoes=b", "gloves=a"], ["custom:acc=3", "bless"], ["pill"], "mob")
+    assert a == b
+    # 같은 슬롯은 뒤 스펙이 적용되므로 순서가 다르면 다른 키
+    assert request_key(CH, ["gloves=a", "gloves=b"], [], [], "mob") != request_key(CH, ["gloves=b", "gloves=a"], [], [], "mob")
+    assert request_key(CH, [], [], [], "mob") != request_key(CH, [], [], [], "other")
+
+
+def test_old_snapshot_version_does_not_clear_cache():
+    memo = CalcMemo(maxsize=8, ttl=None)
+    memo.put("k", "v1", version=1)
+    memo.put("k2", "v2", version=2)  # 새 버전: 비우고 기준을 2로
+    assert memo.get("k", version=2) is None
+    assert memo.get("k2", version=2) == "v2"
+    # 리로드 중 옛 스냅샷(1)으로 온 요청: 캐시를 건너뛰기만 하고 비우지 않음
+    assert memo.get("k2", version=1) is None
+    memo.put("k3", "old", version=1)
+    assert memo.get("k2", version=2) == "v2"
+    assert memo.get("k3", version=2) is None
+    assert memo.cache.invalidations == 1
+
+
+def test_lru_evicts_oldest_and_expires():
+    now = [0.0]
+    cache = LRUCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1
+    now[0] = 11
+    assert cache.get("a") is None and cache.expirations == 1
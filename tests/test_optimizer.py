@@ -0,0 +1,91 @@
+import itertools
+import random
+
+import pytest
+
+from ..engine import check_hit, derive_character_result
+from ..models import BuffState, CharacterInput, Effect, EquipmentState, EquipSlot, Item, JobGroup, Monster, Stats
+from ..optimizer import optimize_gear, stat_investment
+
+SLOTS = (EquipSlot.GLOVES, EquipSlot.SHOES, EquipSlot.OVERALL, EquipSlot.TOP, EquipSlot.BOTTOM)
+
+
+def _catalog(rng: random.Random):
+    items = {}
+    for slot in rng.sample(SLOTS, rng.randint(2, len(SLOTS))):
+        for j in range(rng.randint(1, 4)):
+            dex, luk, acc = rng.randint(0, 12), rng.randint(0, 12), rng.randint(0, 12)
+            if dex == luk == acc == 0:
+                acc = 1
+            item_id = f"{slot.value}_{j}"
+            items[item_id] = Item(item_id=item_id, name=item_id, slot=slot, effect=Effect(stats=Stats(dex=dex, luk=luk), acc=acc))
+    return items
+
+
+def _useful(item: Item, job: JobGroup) -> bool:
+    # optimize_gear처럼 명중 관련 축(물리 DEX/LUK/ACC, 마법 INT/LUK/ACC)이 모두 0 이하인 아이템은 빈 슬롯과 같게 봄
+    s = item.effect.stats
+    return max(s.int if job == JobGroup.MAGE else s.dex, s.luk, item.effect.acc) > 0
+
+
+def _brute_force_costs(ch, items, buffs, mob, fixed=None):
+    by_slot = {}
+    for it in items.values():
+        if _useful(it, ch.job):
+            by_slot.setdefault(it.slot, []).append(it)
+    slots = [sl for sl in by_slot if fixed is None or fixed.equipped.get(sl) is None]
+    costs = []
+    for choice in itertools.product(*([None] + by_slot[sl] for sl in slots)):
+        picked = {sl: it for sl, it in zip(slots, choice) if it is not None}
+        if fixed is not None:
+            picked.update({sl: it for sl, it in fixed.equipped.items() if it is not None})
+        use_overall = EquipSlot.OVERALL in picked
+        if use_overall and any(sl in picked for sl in (EquipSlot.TOP, EquipSlot.BOTTOM)):
+            continue
+        eq = EquipmentState(use_overall=use_overall)
+        for sl, it in picked.items():
+            eq.equipped[sl] = it
+        acc = derive_character_result(ch, eq, buffs).acc_total
+        if check_hit(acc, ch.level, mob).is_sufficient:
+            costs.append(sum(stat_investment(it) for sl, it in zip(slots, choice) if it is not None))
+    return sorted(costs)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_top_k_matches_brute_force(seed):
+    rng = random.Random(seed)
+    items = _catalog(rng)
+    job = rng.choice(list(JobGroup))
+    ch = CharacterInput(
+        level=rng.randint(10, 60),
+        job=job,
+        base_stats=Stats(str=4, dex=rng.randint(4, 60), int=rng.randint(4, 60), luk=rng.randint(4, 60)),
+        maple_warrior_percent=0.0,
+    )
+    mob = Monster(name="mob", level=rng.randint(10, 70), evasion=rng.randint(5, 30))
+    k = rng.choice((1, 3, 5))
+
+    got = [g.cost for g in optimize_gear(ch, items, BuffState(), mob, k=k)]
+    assert got == _brute_force_costs(ch, items, BuffState(), mob)[:k]
+
+
+def test_dominated_item_kept_for_k_greater_than_one():
+    # 더 싼 아이템에 지배당해도 k > 1이면 2등 조합으로 남아야 함
+    cheap = Item(item_id="cheap", name="cheap", slot=EquipSlot.GLOVES, effect=Effect(acc=6))
+    worse = Item(item_id="worse", name="worse", slot=EquipSlot.GLOVES, effect=Effect(acc=5, stats=Stats(str=2)))
+    ch = CharacterInput(level=30, job=JobGroup.ARCHER, base_stats=Stats(dex=100), maple_warrior_percent=0.0)
+    mob = Monster(name="mob", level=30, evasion=23)  # 필요 명중 84, 기본 80
+    loadouts = optimize_gear(ch, {"cheap": cheap, "worse": worse}, BuffState(), mob, k=2)
+    assert [(g.cost, g.items[0][1].item_id) for g in loadouts] == [(6, "cheap"), (7, "worse")]
+    assert [g.cost for g in optimize_gear(ch, {"cheap": cheap, "worse": worse}, BuffState(), mob, k=1)] == [6]
+
+
+def test_fixed_overall_and_split_conflict():
+    overall = Item(item_id="o", name="o", slot=EquipSlot.OVERALL, effect=Effect(acc=5))
+    top = Item(item_id="t", name="t", slot=EquipSlot.TOP, effect=Effect(acc=5))
+    fixed = EquipmentState()
+    fixed.equipped[EquipSlot.OVERALL] = overall
+    fixed.equipped[EquipSlot.TOP] = top
+    ch = CharacterInput(level=30, job=JobGroup.ARCHER, base_stats=Stats(dex=100), maple_warrior_percent=0.0)
+    with pytest.raises(ValueError):
+        optimize_gear(ch, {}, BuffState(), Monster(name="mob", level=30, evasion=10), fixed=fixed)
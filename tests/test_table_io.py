@@ -0,0 +1,68 @@
+import csv
+
+import numpy as np
+import pytest
+
+from ..level_sweep import NEVER, LevelSweep
+from ..matrix import HitMatrix
+
+
+def _sweep():
+    return LevelSweep(
+        levels=np.arange(1, 4),
+        monster_ids=["m1", "몬스터2"],
+        monster_level=np.array([10, 20]),
+        monster_evasion=np.array([5, 30]),
+        acc_total=np.array([50, 55, 60]),
+        margin=np.array([[-1, 0, 2], [-9, -8, -7]]),
+        first_zero_miss_level=np.array([2, NEVER]),
+    )
+
+
+def _matrix():
+    return HitMatrix(
+        labels=["a", "나"],
+        level=np.array([30, 50]),
+        acc_total=np.array([80, 90]),
+        monster_ids=["m1"],
+        monster_level=np.array([10]),
+        monster_evasion=np.array([5]),
+        margin=np.array([[3], [-2]]),
+    )
+
+
+def _read_csv(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_sweep_csv(tmp_path):
+    _sweep().write(tmp_path / "s.csv")
+    assert _read_csv(tmp_path / "s.csv") == [
+        ["monster_id", "monster_level", "evasion", "first_zero_miss_level", "1", "2", "3"],
+        ["acc_total", "", "", "", "50", "55", "60"],
+        ["m1", "10", "5", "2", "-1", "0", "2"],
+        ["몬스터2", "20", "30", "", "-9", "-8", "-7"],
+    ]
+
+
+def test_matrix_csv(tmp_path):
+    _matrix().write(tmp_path / "m.csv")
+    assert _read_csv(tmp_path / "m.csv") == [["label", "level", "acc_total", "m1"], ["a", "30", "80", "3"], ["나", "50", "90", "-2"]]
+
+
+@pytest.mark.parametrize("make", [_sweep, _matrix])
+def test_npz_has_every_field(tmp_path, make):
+    table = make()
+    table.write(tmp_path / "t.npz")
+    with np.load(tmp_path / "t.npz") as data:
+        assert list(data.files) == list(table.__dataclass_fields__)
+        for name in data.files:
+            want = getattr(table, name)
+            assert data[name].tolist() == (want if isinstance(want, list) else want.tolist())
+
+
+@pytest.mark.parametrize("make, kind", [(_sweep, "sweep"), (_matrix, "matrix")])
+def test_unknown_suffix(tmp_path, make, kind):
+    with pytest.raises(ValueError, match=f"unsupported {kind} output"):
+        make().write(tmp_path / "t.txt")
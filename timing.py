@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# ACCURACY_CAL_TIMING=1 일 때만 측정 (꺼져 있으면 span()은 공용 nullcontext 하나만 돌려줌)
+ENABLED = os.environ.get("ACCURACY_CAL_TIMING", "").lower() in ("1", "true", "yes", "on")
+
+# Prometheus 히스토그램 버킷 (초): 50us ~ 10s
+BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+# 분위수 계산용 최근 표본 수 (라벨 조합별)
+WINDOW = 2048
+
+_NULL = nullcontext()
+
+
+class Histogram:
+    """누적 버킷(Prometheus용) + 최근 WINDOW개 표본(p50/p95/p99용)"""
+    __slots__ = ("counts", "total", "count", "recent", "_lock")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # 마지막은 +Inf
+        self.total = 0.0
+        self.count = 0
+        self.recent: deque = deque(maxlen=WINDOW)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(BUCKETS, seconds)] += 1
+            self.total += seconds
+            self.count += 1
+            self.recent.append(seconds)
+
+    def quantiles(self) -> Dict[float, float]:
+        with self._lock:
+            samples = sorted(self.recent)
+        if not samples:
+            return {}
+        n = len(samples)
+        return {q: samples[min(n - 1, int(q * n))] for q in QUANTILES}
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.total, self.count
+
+
+class _RequestTimes:
+    __slots__ = ("route", "start", "handler_start", "handler_end")
+
+    def __init__(self, start: float) -> None:
+        self.route: Optional[str] = None
+        self.start = start
+        self.handler_start: Optional[float] = None
+        self.handler_end: Optional[float] = None
+
+
+_current: ContextVar[Optional[_RequestTimes]] = ContextVar("accuracy_cal_request_times", default=None)
+
+# (route,) -> 요청 전체, (route, stage) -> 구간
+_requests: Dict[str, Histogram] = {}
+_stages: Dict[Tuple[str, str], Histogram] = {}
+_registry_lock = threading.Lock()
+
+
+def _histogram(table: Dict[Any, Histogram], key: Any) -> Histogram:
+    h = table.get(key)
+    if h is None:
+        with _registry_lock:
+            h = table.setdefault(key, Histogram())
+    return h
+
+
+def observe_stage(route: str, stage: str, seconds: float) -> None:
+    _histogram(_stages, (route, stage)).observe(seconds)
+
+
+@contextmanager
+def _span(req: _RequestTimes, stage: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(req.route or "unknown", stage, time.perf_counter() - t0)
+
+
+def span(stage: str):
+    """현재 요청의 구간 측정 (with span("derive"): ...), 측정 중인 요청이 없으면 아무것도 안 함"""
+    if not ENABLED:
+        return _NULL
+    req = _current.get()
+    if req is None:
+        return _NULL
+    return _span(req, stage)
+
+
+@contextmanager
+def _handler(req: _RequestTimes, route: str) -> Iterator[None]:
+    req.route = route
+    req.handler_start = time.perf_counter()
+    # 미들웨어 진입 ~ 핸들러 시작: 본문 읽기 + 라우팅 + pydantic 검증 (+ 스레드풀 전환)
+    observe_stage(route, "validation", req.handler_start - req.start)
+    try:
+        yield
+    finally:
+        req.handler_end = time.perf_counter()
+        observe_stage(route, "handler", req.handler_end - req.handler_start)
+
+
+def handler(route: str):
+    """핸들러 본문 전체를 감쌈: 앞쪽 validation 구간과 뒤쪽 response(직렬화) 구간의 경계"""
+    if not ENABLED:
+        return _NULL
+    req = _current.get()
+    if req is None:
+        return _NULL
+    return _handler(req, route)
+
+
+def timed(route: str):
+    """엔드포인트 데코레이터 (@app.post 아래에): handler(route)로 감쌈, 꺼져 있으면 함수를 그대로 반환"""
+    def deco(fn):
+        if not ENABLED:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with handler(route):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+class TimingMiddleware:
+    """
+    순수 ASGI 미들웨어: 요청 전체 시간(route별)과 response 구간(핸들러 반환 ~ 응답 시작) 기록
+    route 라벨은 매칭된 경로 템플릿 (매칭 실패는 "unmatched", 라벨 수가 요청 경로만큼 늘지 않도록)
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        req = _RequestTimes(time.perf_counter())
+        token = _current.set(req)
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start" and req.handler_end is not None:
+                observe_stage(req.route or _route_of(scope), "response", time.perf_counter() - req.handler_end)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            route = req.route or _route_of(scope)
+            _histogram(_requests, route).observe(time.perf_counter() - req.start)
+
+
+def _route_of(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if path is not None else "unmatched"
+
+
+def reset() -> None:
+    with _registry_lock:
+        _requests.clear()
+        _stages.clear()
+
+
+def _fmt_labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{k}="{v}"' for k, v in labels.items())
+
+
+def _histogram_lines(name: str, items: List[Tuple[Dict[str, str], Histogram]]) -> List[str]:
+    lines = [f"# TYPE {name} histogram"]
+    quantile_lines = []
+    for labels, h in items:
+        counts, total, count = h.snapshot()
+        cumulative = 0
+        for bound, c in zip(BUCKETS + (float("inf"),), counts):
+            cumulative += c
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{{{_fmt_labels({**labels, 'le': le})}}} {cumulative}")
+        lines.append(f"{name}_sum{{{_fmt_labels(labels)}}} {total}")
+        lines.append(f"{name}_count{{{_fmt_labels(labels)}}} {count}")
+        for q, v in h.quantiles().items():
+            quantile_lines.append(f"{name}_recent{{{_fmt_labels({**labels, 'quantile': str(q)})}}} {v}")
+    if quantile_lines:
+        lines.append(f"# HELP {name}_recent Quantiles over the last {WINDOW} observations.")
+        lines.append(f"# TYPE {name}_recent gauge")
+        lines += quantile_lines
+    return lines
+
+
+def prometheus_lines() -> List[str]:
+    """/metrics 용 텍스트 줄 (꺼져 있으면 빈 목록)"""
+    if not ENABLED:
+        return []
+    with _registry_lock:
+        requests = sorted(_requests.items())
+        stages = sorted(_stages.items())
+    lines = ["# HELP accuracy_cal_request_duration_seconds Request latency by route."]
+    lines += _histogram_lines("accuracy_cal_request_duration_seconds", [({"route": r}, h) for r, h in requests])
+    lines.append("# HELP accuracy_cal_stage_duration_seconds Latency of named stages within a route.")
+    lines += _histogram_lines(
+        "accuracy_cal_stage_duration_seconds",
+        [({"route": r, "stage": s}, h) for (r, s), h in stages],
+    )
+    return lines